@@ -0,0 +1,101 @@
+"""
+Analysis Cache
+
+Persistent cache of content_analyzer results. Each entry is keyed by the
+file's resolved path and is only reused while the file's mtime and size
+are unchanged; the whole cache is dropped when the analyzer version
+changes.
+"""
+
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+# Shared JSONL store from the quality-gate skill
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "quality-gate" / "scripts"))
+from jsonl_store import JsonlStore
+
+CACHE_VERSION = 1
+
+
+def file_signature(file_path: Path) -> Dict[str, int]:
+    """mtime and size of a file, as stored next to its cached result."""
+    stat = os.stat(file_path)
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+class AnalysisCache:
+    """
+    Per-file analysis results, kept in a JSONL file (see jsonl_store).
+
+    The header records the cache and analyzer versions; each entry is
+    {"path", "mtime_ns", "size", "result"}.
+    """
+
+    def __init__(self, path: Path, analyzer_version: str):
+        """
+        Open (or create) a cache.
+
+        Args:
+            path: JSONL cache file
+            analyzer_version: Version of the checks that produced the results
+        """
+        self.path = Path(path)
+        self.analyzer_version = analyzer_version
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._store = JsonlStore(self.path, {"version": CACHE_VERSION, "analyzer": analyzer_version})
+        # Caches built by another analyzer version are discarded
+        self.entries: Dict[str, Dict[str, Any]] = self._store.load(lambda entry: entry["path"])
+
+    def get(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Cached result for a file, if it has not changed since it was analyzed."""
+        key = str(Path(file_path).resolve())
+        try:
+            signature = file_signature(file_path)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self.entries.get(key)
+            if (
+                entry is None
+                or entry["mtime_ns"] != signature["mtime_ns"]
+                or entry["size"] != signature["size"]
+            ):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry["result"]
+
+    def put(self, file_path: Path, result: Dict[str, Any], signature: Dict[str, int] = None):
+        """
+        Store a result and append it to the cache file.
+
+        Args:
+            file_path: Analyzed file
+            result: analyze_file() result
+            signature: file_signature() taken before the file was read
+        """
+        key = str(Path(file_path).resolve())
+        try:
+            signature = signature or file_signature(file_path)
+        except OSError:
+            return
+        entry = {"path": key, **signature, "result": result}
+        with self._lock:
+            self.entries[key] = entry
+            self._store.append(entry)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counts for this process."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0
+            }
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Script: benchmark_analyzer.py
+Purpose: Measure the per-file cost of the quality checks with and without the shared document model
+Usage: python benchmark_analyzer.py [directory] [--files 2000] [--repeat 3] [--output bench.json]
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+from pathlib import Path
+from typing import Dict, List, Any, Callable
+
+from document_model import parse_document
+from content_analyzer import (
+    CONTENT_EXTENSIONS,
+    check_title_quality,
+    check_structure_quality,
+    check_depth_quality,
+    check_engagement_quality,
+    check_seo_basics,
+    run_checks
+)
+from content_optimizer import analyze_readability, analyze_structure, analyze_seo, extract_text
+
+# Fix Windows console encoding
+try:
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+except AttributeError:
+    pass
+
+
+WORDS = (
+    "safety training workers risk assessment employer hazard equipment "
+    "protective inspection procedure emergency health occupational site "
+    "supervisor incident report compliance regulation audit"
+).split()
+
+
+def generate_markdown(index: int, rng: random.Random) -> str:
+    """Synthetic markdown article of a few hundred to a few thousand words."""
+    def sentence() -> str:
+        words = [rng.choice(WORDS) for _ in range(rng.randint(8, 22))]
+        return ' '.join(words).capitalize() + rng.choice(['.', '.', '.', '?', '!'])
+
+    lines = [
+        "---",
+        f'title: "Workplace Safety Guide {index}"',
+        "description: How to run safety training",
+        "---",
+        "",
+        f"# {rng.randint(3, 12)} Ways to Improve Workplace Safety",
+        ""
+    ]
+    for section in range(rng.randint(3, 12)):
+        lines += [f"## Section {section + 1}", ""]
+        for _ in range(rng.randint(2, 6)):
+            lines += [' '.join(sentence() for _ in range(rng.randint(3, 7))), ""]
+        if rng.random() < 0.6:
+            lines += [f"- {sentence()}" for _ in range(rng.randint(2, 5))] + [""]
+        if rng.random() < 0.4:
+            lines += [
+                f"See [the checklist](/checklists/{section}) and "
+                f"[the regulation](https://example.org/reg/{section}).",
+                ""
+            ]
+        if rng.random() < 0.3:
+            lines += [f"![Diagram {section}](/img/{index}-{section}.png)", ""]
+        if rng.random() < 0.2:
+            lines += ["```", "inspect --site all", "```", ""]
+    lines.append(f"{rng.randint(10, 90)}% of incidents are preventable. Contact us to get started.")
+    return '\n'.join(lines)
+
+
+def load_corpus(directory: Path = None, files: int = 1000, seed: int = 0) -> List[str]:
+    """Read content files from a directory, or generate a synthetic corpus."""
+    if directory:
+        return [
+            path.read_text(encoding='utf-8', errors='ignore')
+            for path in sorted(directory.rglob('*'))
+            if path.is_file() and path.suffix in CONTENT_EXTENSIONS
+        ]
+    rng = random.Random(seed)
+    return [generate_markdown(i, rng) for i in range(files)]
+
+
+def per_check_scan(content: str):
+    """Every check tokenizes the raw content itself."""
+    check_title_quality(content)
+    check_structure_quality(content)
+    check_depth_quality(content)
+    check_engagement_quality(content)
+    check_seo_basics(content)
+    analyze_readability(extract_text(content))
+    analyze_structure(content)
+    analyze_seo(content)
+
+
+def shared_model(content: str):
+    """The content is tokenized once and every check reads the model."""
+    doc = parse_document(content)
+    run_checks(doc)
+    analyze_readability(doc)
+    analyze_structure(doc)
+    analyze_seo(doc)
+
+
+def _time(fn: Callable[[str], None], corpus: List[str], repeat: int) -> float:
+    """Best-of-N wall time for one pass over the corpus."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for content in corpus:
+            fn(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(corpus: List[str], repeat: int = 3) -> Dict[str, Any]:
+    """
+    Time both strategies over a corpus.
+
+    Args:
+        corpus: Raw content strings
+        repeat: Passes per strategy (best is reported)
+
+    Returns:
+        Benchmark report
+    """
+    files = len(corpus)
+    per_check = _time(per_check_scan, corpus, repeat)
+    shared = _time(shared_model, corpus, repeat)
+    parse_only = _time(parse_document, corpus, repeat)
+
+    def per_file_ms(seconds: float) -> float:
+        return round(seconds / files * 1000, 3) if files else 0
+
+    return {
+        "files": files,
+        "bytes": sum(len(c) for c in corpus),
+        "repeat": repeat,
+        "per_check_ms_per_file": per_file_ms(per_check),
+        "shared_model_ms_per_file": per_file_ms(shared),
+        "parse_ms_per_file": per_file_ms(parse_only),
+        "speedup": round(per_check / shared, 2) if shared else 0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the shared document model")
+    parser.add_argument("directory", nargs="?", help="Content directory (default: synthetic corpus)")
+    parser.add_argument("--files", type=int, default=1000, help="Synthetic corpus size")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes per strategy")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic corpus seed")
+    parser.add_argument("--output", help="Write the report to a JSON file")
+    args = parser.parse_args()
+
+    corpus = load_corpus(Path(args.directory) if args.directory else None, args.files, args.seed)
+    if not corpus:
+        print("No content files found")
+        sys.exit(1)
+
+    report = run_benchmark(corpus, args.repeat)
+
+    print(f"\n{'='*50}")
+    print(f"Files: {report['files']} ({report['bytes'] / 1024:.0f} KB)")
+    print(f"Per-check scanning: {report['per_check_ms_per_file']} ms/file")
+    print(f"Shared model:       {report['shared_model_ms_per_file']} ms/file "
+          f"(parse {report['parse_ms_per_file']} ms)")
+    print(f"Speed-up: {report['speedup']}x")
+    print(f"{'='*50}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
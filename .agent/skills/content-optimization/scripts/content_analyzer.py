@@ -7,13 +7,18 @@ Usage: python content_analyzer.py <file_or_directory> [--output report.json]
 
 import sys
 import os
-import re
 import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Union, Optional, Callable, Iterator, Tuple
 from datetime import datetime
 
+from document_model import FORMAT_BY_SUFFIX, Document, as_document, parse_document
+from analysis_cache import AnalysisCache, file_signature
+from content_rules import RULES
+from readability import fold_case
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -23,13 +28,22 @@ except AttributeError:
 
 CONTENT_EXTENSIONS = {'.md', '.mdx', '.html', '.txt'}
 
+# Bump whenever check logic or scoring changes, so cached results are dropped
+ANALYZER_VERSION = "6"
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / ".cache" / "analysis-cache.jsonl"
+
+# Upper bound on files per process-pool task
+MAX_CHUNK_SIZE = 64
+
 
 # ============================================================================
 #  QUALITY CHECKS
 # ============================================================================
 
-def check_title_quality(content: str) -> Dict[str, Any]:
+def check_title_quality(content: Union[str, Document]) -> Dict[str, Any]:
     """Check title/headline quality."""
+    doc = as_document(content)
     result = {
         "score": 0,
         "max_score": 20,
@@ -37,15 +51,13 @@ def check_title_quality(content: str) -> Dict[str, Any]:
     }
 
     # Find title
-    title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-    if not title_match:
-        title_match = re.search(r'title:\s*["\']?([^"\']+)["\']?', content)
+    title = doc.title
 
-    if not title_match:
+    if not title:
         result["findings"].append("No title found")
         return result
 
-    title = title_match.group(1).strip()
+    title = title.strip()
     title_len = len(title)
 
     # Length check
@@ -58,19 +70,19 @@ def check_title_quality(content: str) -> Dict[str, Any]:
         result["findings"].append(f"Title length ({title_len}) is not optimal")
 
     # Power words check
-    power_words = ['how', 'why', 'what', 'best', 'top', 'guide', 'tips', 'ways', 'step']
-    if any(word in title.lower() for word in power_words):
+    if RULES.matches("power_words", fold_case(title)):
         result["score"] += 5
 
     # Number check
-    if re.search(r'\d+', title):
+    if any(char.isdigit() for char in title):
         result["score"] += 5
 
     return result
 
 
-def check_structure_quality(content: str) -> Dict[str, Any]:
+def check_structure_quality(content: Union[str, Document]) -> Dict[str, Any]:
     """Check content structure quality."""
+    doc = as_document(content)
     result = {
         "score": 0,
         "max_score": 20,
@@ -78,7 +90,7 @@ def check_structure_quality(content: str) -> Dict[str, Any]:
     }
 
     # H1 check
-    h1_count = len(re.findall(r'^#\s+', content, re.MULTILINE))
+    h1_count = doc.count_headings(1)
     if h1_count == 1:
         result["score"] += 5
     elif h1_count == 0:
@@ -87,7 +99,7 @@ def check_structure_quality(content: str) -> Dict[str, Any]:
         result["findings"].append(f"Multiple H1 headings ({h1_count})")
 
     # H2+ check
-    h2_count = len(re.findall(r'^##\s+', content, re.MULTILINE))
+    h2_count = doc.count_headings(2)
     if h2_count >= 3:
         result["score"] += 5
     elif h2_count >= 1:
@@ -97,15 +109,13 @@ def check_structure_quality(content: str) -> Dict[str, Any]:
         result["findings"].append("No subheadings found")
 
     # Lists check
-    has_lists = bool(re.search(r'^\s*[-*+]\s+', content, re.MULTILINE))
-    if has_lists:
+    if doc.list_items:
         result["score"] += 5
     else:
         result["findings"].append("No bullet lists found")
 
     # Paragraphs check
-    paragraphs = [p for p in content.split('\n\n') if p.strip() and not p.strip().startswith('#')]
-    if len(paragraphs) >= 5:
+    if len(doc.paragraphs) >= 5:
         result["score"] += 5
     else:
         result["findings"].append("Content may be too short")
@@ -113,8 +123,9 @@ def check_structure_quality(content: str) -> Dict[str, Any]:
     return result
 
 
-def check_depth_quality(content: str) -> Dict[str, Any]:
+def check_depth_quality(content: Union[str, Document]) -> Dict[str, Any]:
     """Check content depth and value."""
+    doc = as_document(content)
     result = {
         "score": 0,
         "max_score": 20,
@@ -122,8 +133,7 @@ def check_depth_quality(content: str) -> Dict[str, Any]:
     }
 
     # Word count
-    words = re.findall(r'\b[a-zA-Z]+\b', content)
-    word_count = len(words)
+    word_count = doc.word_count
 
     if word_count >= 1500:
         result["score"] += 10
@@ -135,16 +145,13 @@ def check_depth_quality(content: str) -> Dict[str, Any]:
         result["findings"].append(f"Content too short ({word_count} words)")
 
     # Examples/case studies
-    example_patterns = ['example', 'case study', 'for instance', 'such as']
-    has_examples = any(p in content.lower() for p in example_patterns)
-    if has_examples:
+    if RULES.matches("examples", doc.lower):
         result["score"] += 5
     else:
         result["findings"].append("Consider adding examples")
 
     # Statistics/data
-    has_stats = bool(re.search(r'\d+%|\d+\s*(percent|million|billion)', content, re.IGNORECASE))
-    if has_stats:
+    if doc.has_statistics:
         result["score"] += 5
     else:
         result["findings"].append("Consider adding statistics or data")
@@ -152,8 +159,9 @@ def check_depth_quality(content: str) -> Dict[str, Any]:
     return result
 
 
-def check_engagement_quality(content: str) -> Dict[str, Any]:
+def check_engagement_quality(content: Union[str, Document]) -> Dict[str, Any]:
     """Check engagement elements."""
+    doc = as_document(content)
     result = {
         "score": 0,
         "max_score": 20,
@@ -161,33 +169,26 @@ def check_engagement_quality(content: str) -> Dict[str, Any]:
     }
 
     # Questions (engagement)
-    question_count = content.count('?')
+    question_count = doc.question_count
     if question_count >= 3:
         result["score"] += 5
     elif question_count >= 1:
         result["score"] += 2
 
     # CTA presence
-    cta_patterns = ['contact us', 'get started', 'learn more', 'sign up', 'subscribe',
-                    'download', 'try', 'click here', 'next step']
-    has_cta = any(p in content.lower() for p in cta_patterns)
-    if has_cta:
+    if RULES.matches("cta", doc.lower):
         result["score"] += 5
     else:
         result["findings"].append("No clear call-to-action found")
 
     # Hook in intro (first 100 words should be engaging)
-    first_100 = ' '.join(content.split()[:100]).lower()
-    hook_indicators = ['you', 'your', 'how', 'why', 'what if', 'imagine', '?']
-    has_hook = any(h in first_100 for h in hook_indicators)
-    if has_hook:
+    if RULES.matches("hook", doc.first_words(100)):
         result["score"] += 5
     else:
         result["findings"].append("Introduction may lack a hook")
 
     # Images
-    has_images = bool(re.search(r'!\[.*\]\(.*\)', content))
-    if has_images:
+    if doc.images:
         result["score"] += 5
     else:
         result["findings"].append("No images found")
@@ -195,8 +196,9 @@ def check_engagement_quality(content: str) -> Dict[str, Any]:
     return result
 
 
-def check_seo_basics(content: str) -> Dict[str, Any]:
+def check_seo_basics(content: Union[str, Document]) -> Dict[str, Any]:
     """Check basic SEO elements."""
+    doc = as_document(content)
     result = {
         "score": 0,
         "max_score": 20,
@@ -204,15 +206,14 @@ def check_seo_basics(content: str) -> Dict[str, Any]:
     }
 
     # Meta description
-    has_meta = 'description:' in content.lower() or 'meta' in content.lower()
+    has_meta = 'description' in doc.frontmatter or 'description:' in doc.lower or 'meta' in doc.lower
     if has_meta:
         result["score"] += 5
     else:
         result["findings"].append("No meta description found")
 
     # Internal links
-    links = re.findall(r'\[.*?\]\((.*?)\)', content)
-    internal_links = [l for l in links if not l.startswith('http')]
+    internal_links = [l for l in doc.links if not l.is_external]
     if len(internal_links) >= 2:
         result["score"] += 5
     elif len(internal_links) >= 1:
@@ -222,16 +223,15 @@ def check_seo_basics(content: str) -> Dict[str, Any]:
         result["findings"].append("No internal links found")
 
     # External links
-    external_links = [l for l in links if l.startswith('http')]
+    external_links = [l for l in doc.links if l.is_external]
     if external_links:
         result["score"] += 5
     else:
         result["findings"].append("No external links/references")
 
     # Alt texts
-    images = re.findall(r'!\[(.*?)\]\(.*?\)', content)
-    images_without_alt = [i for i in images if not i.strip()]
-    if images and not images_without_alt:
+    images_without_alt = [i for i in doc.images if not i.alt.strip()]
+    if doc.images and not images_without_alt:
         result["score"] += 5
     elif images_without_alt:
         result["findings"].append(f"{len(images_without_alt)} images missing alt text")
@@ -239,6 +239,18 @@ def check_seo_basics(content: str) -> Dict[str, Any]:
     return result
 
 
+def run_checks(content: Union[str, Document]) -> Dict[str, Dict[str, Any]]:
+    """Run all quality checks over one shared document model."""
+    doc = as_document(content)
+    return {
+        "title": check_title_quality(doc),
+        "structure": check_structure_quality(doc),
+        "depth": check_depth_quality(doc),
+        "engagement": check_engagement_quality(doc),
+        "seo": check_seo_basics(doc)
+    }
+
+
 # ============================================================================
 #  MAIN
 # ============================================================================
@@ -248,13 +260,7 @@ def analyze_file(file_path: Path) -> Dict[str, Any]:
     with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
         content = f.read()
 
-    checks = {
-        "title": check_title_quality(content),
-        "structure": check_structure_quality(content),
-        "depth": check_depth_quality(content),
-        "engagement": check_engagement_quality(content),
-        "seo": check_seo_basics(content)
-    }
+    checks = run_checks(parse_document(content, FORMAT_BY_SUFFIX.get(file_path.suffix.lower())))
 
     total_score = sum(c["score"] for c in checks.values())
     max_score = sum(c["max_score"] for c in checks.values())
@@ -289,34 +295,137 @@ def get_grade(percentage: float) -> str:
         return "F"
 
 
-def analyze_directory(dir_path: Path) -> List[Dict[str, Any]]:
-    """Analyze all content files in a directory."""
-    results = []
-
+def iter_content_files(dir_path: Path) -> Iterator[Path]:
+    """Yield content files under a directory, skipping build and VCS folders."""
     for root, dirs, files in os.walk(dir_path):
         # Skip common non-content directories
-        dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build'}]
+        dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.cache'}]
 
         for file in files:
             if Path(file).suffix.lower() in CONTENT_EXTENSIONS:
-                file_path = Path(root) / file
-                try:
-                    result = analyze_file(file_path)
-                    results.append(result)
-                except Exception as e:
-                    results.append({
-                        "file": str(file_path),
-                        "error": str(e)
-                    })
+                yield Path(root) / file
+
+
+def _analyze_safe(file_path: Path) -> Tuple[Optional[Dict[str, int]], Dict[str, Any]]:
+    """Analyze one file, returning its pre-read signature and result (or error)."""
+    try:
+        signature = file_signature(file_path)
+        return signature, analyze_file(file_path)
+    except Exception as e:
+        return None, {"file": str(file_path), "error": str(e)}
+
+
+def _analyze_chunk(paths: List[Path]) -> List[Tuple[Path, Optional[Dict[str, int]], Dict[str, Any]]]:
+    """Process-pool task: analyze a chunk of files."""
+    return [(path, *_analyze_safe(path)) for path in paths]
+
+
+def _chunk_size(files: int, workers: int) -> int:
+    """Several chunks per worker so slow files don't leave workers idle."""
+    return max(1, min(MAX_CHUNK_SIZE, files // (workers * 4)))
+
+
+def analyze_directory(
+    dir_path: Path,
+    workers: int = 1,
+    cache: Optional[AnalysisCache] = None,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Analyze all content files in a directory.
+
+    Args:
+        dir_path: Directory to walk
+        workers: Worker processes (1 = analyze in this process)
+        cache: Result cache; unchanged files are not re-analyzed
+        on_result: Called with each result as soon as it is available
+
+    Returns:
+        Results, cached files first, then in completion order
+    """
+    results = []
+
+    def emit(result: Dict[str, Any]):
+        results.append(result)
+        if on_result:
+            on_result(result)
+
+    def store(path: Path, signature: Optional[Dict[str, int]], result: Dict[str, Any]):
+        if cache is not None and signature is not None:
+            cache.put(path, result, signature)
+        emit(result)
+
+    pending = []
+    for file_path in iter_content_files(dir_path):
+        cached = cache.get(file_path) if cache is not None else None
+        if cached is not None:
+            emit(cached)
+        else:
+            pending.append(file_path)
+
+    if workers <= 1 or len(pending) <= 1:
+        for file_path in pending:
+            store(file_path, *_analyze_safe(file_path))
+        return results
+
+    size = _chunk_size(len(pending), workers)
+    chunks = [pending[i:i + size] for i in range(0, len(pending), size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_analyze_chunk, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            for path, signature, result in future.result():
+                store(path, signature, result)
 
     return results
 
 
+class StreamingReport:
+    """
+    JSON report written incrementally: each result is appended to the
+    "results" array as it arrives and the summary fields are written on
+    close, so large runs never hold the serialized report in memory.
+    """
+
+    def __init__(self, output_path: Path, path: Path):
+        self.file = open(output_path, 'w', encoding='utf-8')
+        self.count = 0
+        self.valid = 0
+        self.score_total = 0
+        self.file.write('{\n')
+        self.file.write(f'  "timestamp": {json.dumps(datetime.now().isoformat())},\n')
+        self.file.write(f'  "path": {json.dumps(str(path), ensure_ascii=False)},\n')
+        self.file.write('  "results": [')
+
+    def add(self, result: Dict[str, Any]):
+        """Append one result."""
+        self.file.write(',\n    ' if self.count else '\n    ')
+        self.file.write(json.dumps(result, ensure_ascii=False))
+        self.file.flush()
+        self.count += 1
+        if "error" not in result:
+            self.valid += 1
+            self.score_total += result["percentage"]
+
+    def close(self) -> float:
+        """Write the summary fields and return the average score."""
+        avg_score = self.score_total / self.valid if self.valid else 0
+        self.file.write('\n  ],\n' if self.count else '],\n')
+        self.file.write(f'  "files_analyzed": {self.count},\n')
+        self.file.write(f'  "average_score": {round(avg_score, 1)}\n')
+        self.file.write('}\n')
+        self.file.close()
+        return avg_score
+
+
 def main():
     parser = argparse.ArgumentParser(description="Content Quality Analyzer")
     parser.add_argument("path", help="File or directory to analyze")
     parser.add_argument("--output", "-o", help="Output JSON file")
     parser.add_argument("--json", action="store_true", help="Output JSON only")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                        help="Worker processes for directories (0 = one per CPU)")
+    parser.add_argument("--cache", default=str(DEFAULT_CACHE_PATH), help="Result cache file")
+    parser.add_argument("--no-cache", action="store_true", help="Re-analyze every file")
 
     args = parser.parse_args()
 
@@ -326,10 +435,25 @@ def main():
         print(f"Error: Path not found: {path}")
         sys.exit(1)
 
-    if path.is_file():
-        results = [analyze_file(path)]
-    else:
-        results = analyze_directory(path)
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    cache = None if args.no_cache else AnalysisCache(Path(args.cache), ANALYZER_VERSION)
+    stream = StreamingReport(Path(args.output), path) if args.output else None
+
+    try:
+        if path.is_file():
+            results = [analyze_file(path)]
+            if stream:
+                stream.add(results[0])
+        else:
+            results = analyze_directory(
+                path,
+                workers=workers,
+                cache=cache,
+                on_result=stream.add if stream else None
+            )
+    finally:
+        if stream:
+            stream.close()
 
     if not results:
         print("No content files found")
@@ -356,6 +480,9 @@ def main():
         print(f"Path: {path}")
         print(f"Files Analyzed: {len(results)}")
         print(f"Average Score: {avg_score:.1f}%")
+        if cache is not None and path.is_dir():
+            cache_stats = cache.stats()
+            print(f"Cache: {cache_stats['hits']} unchanged, {cache_stats['misses']} analyzed")
 
         for result in results:
             print(f"\n{'-'*60}")
@@ -371,8 +498,6 @@ def main():
         print(f"\n{'='*60}\n")
 
     if args.output:
-        with open(args.output, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
         print(f"Report saved to: {args.output}")
 
     sys.exit(0 if avg_score >= 70 else 1)
@@ -10,10 +10,15 @@ import re
 import json
 import argparse
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Union
 from collections import Counter
 import math
 
+from document_model import FORMAT_BY_SUFFIX, Document, as_document, parse_document
+from readability import get_engine, split_words
+from keyword_index import KeywordIndex
+from model_config import config_keywords
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -25,28 +30,9 @@ except AttributeError:
 #  ANALYSIS FUNCTIONS
 # ============================================================================
 
-def count_syllables(word: str) -> int:
+def count_syllables(word: str, language: str = "en") -> int:
     """Estimate syllable count for a word."""
-    word = word.lower()
-    if len(word) <= 3:
-        return 1
-
-    # Remove silent e
-    if word.endswith('e'):
-        word = word[:-1]
-
-    # Count vowel groups
-    vowels = 'aeiouy'
-    count = 0
-    prev_vowel = False
-
-    for char in word:
-        is_vowel = char in vowels
-        if is_vowel and not prev_vowel:
-            count += 1
-        prev_vowel = is_vowel
-
-    return max(1, count)
+    return get_engine(language).syllables(word)
 
 
 def extract_text(content: str) -> str:
@@ -69,17 +55,37 @@ def extract_text(content: str) -> str:
     return text
 
 
-def analyze_readability(text: str) -> Dict[str, Any]:
-    """Analyze text readability."""
-    # Split into sentences
-    sentences = re.split(r'[.!?]+', text)
-    sentences = [s.strip() for s in sentences if s.strip()]
+def analyze_readability(text: Union[str, Document], language: str = None) -> Dict[str, Any]:
+    """
+    Analyze text readability (plain text or a parsed Document).
+
+    Args:
+        text: Plain text or Document
+        language: Language code; defaults to the Document's frontmatter
+            `language`, then `defaults.language` from the model config
 
-    # Split into words
-    words = re.findall(r'\b[a-zA-Z]+\b', text)
+    Returns:
+        Readability metrics. `flesch_score` holds the reading-ease score of
+        the language's formula (Flesch for English, Ateşman for Turkish).
+    """
+    if isinstance(text, Document):
+        sentences = text.sentences
+        words = text.words
+        language = language or text.language
+    else:
+        # Split into sentences
+        sentences = re.split(r'[.!?]+', text)
+        sentences = [s.strip() for s in sentences if s.strip()]
+
+        # Split into words
+        words = split_words(text)
+
+    engine = get_engine(language)
 
     if not words or not sentences:
         return {
+            "language": engine.language,
+            "formula": engine.formula,
             "flesch_score": 0,
             "flesch_grade": "N/A",
             "avg_sentence_length": 0,
@@ -89,33 +95,19 @@ def analyze_readability(text: str) -> Dict[str, Any]:
             "issues": ["Content too short to analyze"]
         }
 
-    # Calculate metrics
+    # Calculate metrics (syllables once per distinct word)
     total_words = len(words)
     total_sentences = len(sentences)
-    total_syllables = sum(count_syllables(w) for w in words)
+    total_syllables = sum(
+        engine.syllables(word) * count for word, count in Counter(words).items()
+    )
 
     avg_sentence_length = total_words / total_sentences
     avg_syllables = total_syllables / total_words
 
-    # Flesch Reading Ease
-    flesch_score = 206.835 - (1.015 * avg_sentence_length) - (84.6 * avg_syllables)
-    flesch_score = max(0, min(100, flesch_score))
-
-    # Grade level
-    if flesch_score >= 90:
-        grade = "5th grade (Very Easy)"
-    elif flesch_score >= 80:
-        grade = "6th grade (Easy)"
-    elif flesch_score >= 70:
-        grade = "7th grade (Fairly Easy)"
-    elif flesch_score >= 60:
-        grade = "8-9th grade (Standard)"
-    elif flesch_score >= 50:
-        grade = "10-12th grade (Fairly Difficult)"
-    elif flesch_score >= 30:
-        grade = "College (Difficult)"
-    else:
-        grade = "Graduate (Very Difficult)"
+    # Reading ease and grade level
+    flesch_score = engine.reading_ease(avg_sentence_length, avg_syllables)
+    grade = engine.grade(flesch_score)
 
     # Find issues
     issues = []
@@ -124,7 +116,9 @@ def analyze_readability(text: str) -> Dict[str, Any]:
         issues.append(f"Average sentence too long ({avg_sentence_length:.1f} words, target: <25)")
 
     if flesch_score < 60:
-        issues.append(f"Content may be too difficult (Flesch: {flesch_score:.1f}, target: 60+)")
+        issues.append(
+            f"Content may be too difficult ({engine.formula_name}: {flesch_score:.1f}, target: 60+)"
+        )
 
     # Find long sentences
     long_sentences = [s for s in sentences if len(s.split()) > 30]
@@ -132,6 +126,8 @@ def analyze_readability(text: str) -> Dict[str, Any]:
         issues.append(f"{len(long_sentences)} sentences over 30 words")
 
     return {
+        "language": engine.language,
+        "formula": engine.formula,
         "flesch_score": round(flesch_score, 1),
         "flesch_grade": grade,
         "avg_sentence_length": round(avg_sentence_length, 1),
@@ -143,8 +139,9 @@ def analyze_readability(text: str) -> Dict[str, Any]:
     }
 
 
-def analyze_structure(content: str) -> Dict[str, Any]:
+def analyze_structure(content: Union[str, Document]) -> Dict[str, Any]:
     """Analyze content structure."""
+    doc = as_document(content)
     results = {
         "has_h1": False,
         "h1_count": 0,
@@ -159,31 +156,29 @@ def analyze_structure(content: str) -> Dict[str, Any]:
     }
 
     # Count headings
-    h1_matches = re.findall(r'^#\s+.+$', content, re.MULTILINE)
-    h2_matches = re.findall(r'^##\s+.+$', content, re.MULTILINE)
-    h3_matches = re.findall(r'^###\s+.+$', content, re.MULTILINE)
+    h1_count = sum(1 for h in doc.headings if h.level == 1 and h.text)
+    h2_count = sum(1 for h in doc.headings if h.level == 2 and h.text)
+    h3_count = sum(1 for h in doc.headings if h.level == 3 and h.text)
 
-    results["h1_count"] = len(h1_matches)
-    results["has_h1"] = len(h1_matches) > 0
-    results["heading_count"] = len(h1_matches) + len(h2_matches) + len(h3_matches)
+    results["h1_count"] = h1_count
+    results["has_h1"] = h1_count > 0
+    results["heading_count"] = h1_count + h2_count + h3_count
 
-    if len(h1_matches) > 1:
-        results["issues"].append(f"Multiple H1 tags found ({len(h1_matches)})")
+    if h1_count > 1:
+        results["issues"].append(f"Multiple H1 tags found ({h1_count})")
         results["heading_hierarchy_valid"] = False
 
-    if len(h1_matches) == 0:
+    if h1_count == 0:
         results["issues"].append("No H1 tag found")
 
     # Check for other elements
-    results["has_lists"] = bool(re.search(r'^\s*[-*+]\s+', content, re.MULTILINE))
-    results["has_tables"] = bool(re.search(r'\|.*\|', content))
-    results["has_images"] = bool(re.search(r'!\[.*\]\(.*\)', content))
-    results["has_links"] = bool(re.search(r'\[.*\]\(.*\)', content))
+    results["has_lists"] = bool(doc.list_items)
+    results["has_tables"] = doc.table_rows > 0
+    results["has_images"] = bool(doc.images)
+    results["has_links"] = bool(doc.links)
 
     # Count paragraphs
-    paragraphs = re.split(r'\n\n+', content)
-    paragraphs = [p for p in paragraphs if p.strip() and not p.strip().startswith('#')]
-    results["paragraph_count"] = len(paragraphs)
+    results["paragraph_count"] = len(doc.paragraphs)
 
     # Structure recommendations
     if not results["has_lists"]:
@@ -195,14 +190,34 @@ def analyze_structure(content: str) -> Dict[str, Any]:
     return results
 
 
-def analyze_seo(content: str, keyword: str = None) -> Dict[str, Any]:
-    """Analyze content for SEO factors."""
-    text = extract_text(content).lower()
+def analyze_seo(
+    content: Union[str, Document],
+    keyword: str = None,
+    keywords: List[str] = None,
+    match_suffixes: bool = False
+) -> Dict[str, Any]:
+    """
+    Analyze content for SEO factors.
+
+    Args:
+        content: Raw content or parsed Document
+        keyword: Primary keyword (reported as `keyword_analysis`)
+        keywords: Further keywords (all reported under `keywords`)
+        match_suffixes: Let a keyword's last word match suffixed forms
+            (Turkish "değerlendirmesi" -> "değerlendirmesinin"); off by
+            default since short keywords then over-match ("iş" -> "işçi")
+
+    Returns:
+        SEO metrics and issues
+    """
+    doc = as_document(content)
+    text = doc.text.lower()
     results = {
         "word_count": len(text.split()),
         "has_meta_description": False,
         "has_title": False,
         "keyword_analysis": None,
+        "keywords": [],
         "internal_links": 0,
         "external_links": 0,
         "images_with_alt": 0,
@@ -211,46 +226,52 @@ def analyze_seo(content: str, keyword: str = None) -> Dict[str, Any]:
     }
 
     # Check for frontmatter
-    if re.search(r'^---\s*\n', content):
-        if re.search(r'description:', content):
-            results["has_meta_description"] = True
-        if re.search(r'title:', content):
-            results["has_title"] = True
+    if doc.frontmatter:
+        results["has_meta_description"] = "description" in doc.frontmatter
+        results["has_title"] = "title" in doc.frontmatter
 
     # Link analysis
-    links = re.findall(r'\[.*?\]\((.*?)\)', content)
-    for link in links:
-        if link.startswith('http'):
+    for link in doc.links:
+        if link.is_external:
             results["external_links"] += 1
         else:
             results["internal_links"] += 1
 
     # Image analysis
-    images = re.findall(r'!\[(.*?)\]\(.*?\)', content)
-    for alt in images:
-        if alt.strip():
+    for image in doc.images:
+        if image.alt.strip():
             results["images_with_alt"] += 1
         else:
             results["images_without_alt"] += 1
 
-    # Keyword analysis
-    if keyword:
-        keyword_lower = keyword.lower()
-        keyword_count = text.count(keyword_lower)
-        word_count = len(text.split())
-        density = (keyword_count / word_count * 100) if word_count > 0 else 0
-
-        results["keyword_analysis"] = {
-            "keyword": keyword,
-            "count": keyword_count,
-            "density": round(density, 2),
-            "in_first_100_words": keyword_lower in ' '.join(text.split()[:100])
-        }
-
-        if keyword_count == 0:
-            results["issues"].append(f"Keyword '{keyword}' not found in content")
-        elif density > 3:
-            results["issues"].append(f"Keyword density too high ({density:.1f}%), risk of keyword stuffing")
+    # Keyword analysis (one index answers every keyword)
+    targets = ([keyword] if keyword else []) + [k for k in (keywords or []) if k != keyword]
+    if targets:
+        index = KeywordIndex(match_suffixes=match_suffixes)
+        index.add("page", doc)
+        analyses = []
+        for target in targets:
+            hits = index.query(target)
+            hit = hits[0] if hits else None
+            analyses.append({
+                "keyword": target,
+                "count": hit.count if hit else 0,
+                "density": hit.density if hit else 0,
+                "in_first_100_words": hit.in_first_100_words if hit else False,
+                "in_headings": hit.in_headings if hit else False
+            })
+        results["keywords"] = analyses
+
+        for analysis in analyses:
+            if analysis["count"] == 0:
+                results["issues"].append(f"Keyword '{analysis['keyword']}' not found in content")
+            elif analysis["density"] > 3:
+                results["issues"].append(
+                    f"Keyword '{analysis['keyword']}' density too high "
+                    f"({analysis['density']:.1f}%), risk of keyword stuffing"
+                )
+        if keyword:
+            results["keyword_analysis"] = analyses[0]
 
     # SEO recommendations
     if results["word_count"] < 300:
@@ -310,18 +331,23 @@ def calculate_score(readability: Dict, structure: Dict, seo: Dict) -> int:
 #  MAIN
 # ============================================================================
 
-def analyze_content(file_path: Path, keyword: str = None) -> Dict[str, Any]:
+def analyze_content(
+    file_path: Path,
+    keyword: str = None,
+    language: str = None,
+    keywords: List[str] = None
+) -> Dict[str, Any]:
     """Run full content analysis."""
     with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
         content = f.read()
 
-    text = extract_text(content)
+    doc = parse_document(content, FORMAT_BY_SUFFIX.get(Path(file_path).suffix.lower()))
 
     report = {
         "file": str(file_path),
-        "readability": analyze_readability(text),
-        "structure": analyze_structure(content),
-        "seo": analyze_seo(content, keyword),
+        "readability": analyze_readability(doc, language),
+        "structure": analyze_structure(doc),
+        "seo": analyze_seo(doc, keyword, keywords),
         "recommendations": []
     }
 
@@ -346,6 +372,10 @@ def main():
     parser = argparse.ArgumentParser(description="Content Optimization Analyzer")
     parser.add_argument("file_path", help="Path to content file")
     parser.add_argument("--keyword", "-k", help="Target keyword to check")
+    parser.add_argument("--keywords", help="Comma-separated extra keywords to check")
+    parser.add_argument("--config-keywords", action="store_true",
+                        help="Also check osgb_context.keywords from model-config.json")
+    parser.add_argument("--language", "-l", help="Content language (default: frontmatter, then config)")
     parser.add_argument("--output", "-o", help="Output JSON file")
     parser.add_argument("--json", action="store_true", help="Output JSON only")
 
@@ -356,7 +386,10 @@ def main():
         print(f"Error: File not found: {file_path}")
         sys.exit(1)
 
-    report = analyze_content(file_path, args.keyword)
+    keywords = [k.strip() for k in (args.keywords or "").split(",") if k.strip()]
+    if args.config_keywords:
+        keywords += config_keywords()
+    report = analyze_content(file_path, args.keyword, args.language, keywords)
 
     if args.json:
         print(json.dumps(report, indent=2, ensure_ascii=False))
@@ -369,7 +402,8 @@ def main():
 
         print(f"\n{'-'*60}")
         print("READABILITY")
-        print(f"  Flesch Score: {report['readability']['flesch_score']}")
+        print(f"  Language: {report['readability']['language']}")
+        print(f"  Reading Ease ({report['readability']['formula']}): {report['readability']['flesch_score']}")
         print(f"  Grade Level: {report['readability']['flesch_grade']}")
         print(f"  Avg Sentence: {report['readability']['avg_sentence_length']} words")
         print(f"  Total Words: {report['readability']['total_words']}")
@@ -386,8 +420,7 @@ def main():
         print(f"  Word Count: {report['seo']['word_count']}")
         print(f"  Internal Links: {report['seo']['internal_links']}")
         print(f"  External Links: {report['seo']['external_links']}")
-        if report['seo']['keyword_analysis']:
-            ka = report['seo']['keyword_analysis']
+        for ka in report['seo']['keywords']:
             print(f"  Keyword '{ka['keyword']}': {ka['count']} times ({ka['density']}%)")
 
         if report["recommendations"]:
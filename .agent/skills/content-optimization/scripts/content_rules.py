@@ -0,0 +1,94 @@
+"""
+Content Rules
+
+Phrase rules used by the content analyzer checks, kept as data. Each rule
+lists English and Turkish phrases. Phrases match anywhere in the
+case-folded text, so Turkish suffixed forms ("rehberi", "adımları") match
+their stem.
+
+The table is compiled once at import time: phrases are case-folded,
+de-duplicated, and phrases that contain a shorter phrase of the same rule
+are dropped, since the shorter one already decides the match. Matching is
+a plain substring search per phrase.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+from readability import fold_case
+
+# rule -> language -> phrases
+PHRASE_RULES: Dict[str, Dict[str, List[str]]] = {
+    # Title words that promise a concrete payoff
+    "power_words": {
+        "en": ['how', 'why', 'what', 'best', 'top', 'guide', 'tips', 'ways', 'step'],
+        "tr": ['nasıl', 'neden', 'nedir', 'nelerdir', 'en iyi', 'rehber', 'kılavuz',
+               'ipucu', 'ipuçları', 'yöntem', 'adım']
+    },
+    # Examples and case studies in the body
+    "examples": {
+        "en": ['example', 'case study', 'for instance', 'such as'],
+        "tr": ['örneğin', 'örnek', 'vaka çalışması', 'vaka analizi', 'mesela', 'söz gelimi']
+    },
+    # Calls to action in the body
+    "cta": {
+        "en": ['contact us', 'get started', 'learn more', 'sign up', 'subscribe',
+               'download', 'try', 'click here', 'next step'],
+        "tr": ['bize ulaşın', 'iletişime geçin', 'bizi arayın', 'hemen başlayın',
+               'daha fazla bilgi', 'teklif alın', 'randevu alın', 'abone olun',
+               'kayıt olun', 'indirin', 'tıklayın', 'ücretsiz deneyin']
+    },
+    # Reader-directed openers in the first 100 words
+    "hook": {
+        "en": ['you', 'your', 'how', 'why', 'what if', 'imagine', '?'],
+        "tr": ['sizin', 'nasıl', 'neden', 'hayal edin', 'düşünün', 'biliyor musunuz']
+    }
+}
+
+
+def _minimal_needles(phrases: Iterable[str]) -> Tuple[str, ...]:
+    """Folded phrases without duplicates or phrases containing a shorter one."""
+    needles: List[str] = []
+    for phrase in sorted({fold_case(p) for p in phrases if p}, key=len):
+        if not any(needle in phrase for needle in needles):
+            needles.append(phrase)
+    return tuple(needles)
+
+
+@dataclass(frozen=True)
+class PhraseRule:
+    """A compiled phrase rule."""
+    name: str
+    needles: Tuple[str, ...]
+
+    def matches(self, folded: str) -> bool:
+        """Whether any phrase occurs in already case-folded text."""
+        return any(needle in folded for needle in self.needles)
+
+
+class RuleTable:
+    """Phrase rules compiled for all languages."""
+
+    def __init__(self, rules: Dict[str, Dict[str, List[str]]]):
+        self.rules: Dict[str, PhraseRule] = {
+            name: PhraseRule(name, _minimal_needles(
+                phrase for phrases in languages.values() for phrase in phrases
+            ))
+            for name, languages in rules.items()
+        }
+
+    def matches(self, name: str, folded: str) -> bool:
+        """
+        Whether a rule matches.
+
+        Args:
+            name: Rule name
+            folded: Text already passed through fold_case()
+
+        Returns:
+            True if any of the rule's phrases occurs in the text
+        """
+        return self.rules[name].matches(folded)
+
+
+RULES = RuleTable(PHRASE_RULES)
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Script: corpus_analyzer.py
+Purpose: Score every post of a JSON/JSONL blog corpus without writing posts out as files
+Usage: python corpus_analyzer.py <corpus.json|corpus.jsonl> [--workers 4] [--output scores.csv]
+"""
+
+import os
+import sys
+import csv
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Iterable, TextIO
+
+from document_model import Heading, Image, parse_document
+from content_analyzer import run_checks, get_grade
+from content_optimizer import analyze_readability
+
+# Fix Windows console encoding
+try:
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+except AttributeError:
+    pass
+
+
+READ_CHUNK_SIZE = 1 << 16
+VALUE_DELIMITERS = frozenset(",]}: \t\r\n")
+
+# Post fields sent to workers (everything else stays in the reader)
+POST_FIELDS = ("id", "slug", "title", "excerpt", "content", "coverImage", "language")
+
+# Meta description length window for excerpts
+EXCERPT_MIN_CHARS = 120
+EXCERPT_MAX_CHARS = 160
+
+COLUMNS = [
+    "id", "slug", "format", "words", "percentage", "grade",
+    "title", "structure", "depth", "engagement", "seo",
+    "readability", "title_chars", "excerpt_chars", "findings"
+]
+
+
+# ============================================================================
+#  STREAMING READER
+# ============================================================================
+
+class JSONArrayReader:
+    """
+    Incremental reader for the elements of a JSON array.
+
+    The file is read in chunks and each array element is decoded with
+    raw_decode as soon as it is complete, so only one element (plus one
+    chunk) is held in memory. The array is either the top-level value or
+    the value of `key` in a top-level object.
+    """
+
+    def __init__(self, f: TextIO, key: str = "posts", chunk_size: int = READ_CHUNK_SIZE):
+        self.f = f
+        self.key = key
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, minimum: int = 0) -> bool:
+        """Read another chunk (at least `minimum` characters); False at EOF."""
+        if self.eof:
+            return False
+        self.buf = self.buf[self.pos:]
+        self.pos = 0
+        chunk = self.f.read(max(self.chunk_size, minimum))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf += chunk
+        return True
+
+    def _peek(self) -> str:
+        """Next non-whitespace character ('' at EOF)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos} of buffered input")
+        self.pos += 1
+
+    def _decode(self) -> Any:
+        """Decode the next complete value, reading more input as needed."""
+        self._peek()
+        missing = 0
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+                # A number is only complete once a delimiter follows it
+                if (
+                    self.eof
+                    or not isinstance(value, (int, float))
+                    or (end < len(self.buf) and self.buf[end] in VALUE_DELIMITERS)
+                ):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # Grow reads geometrically so very large elements stay linear
+            missing = max(self.chunk_size, missing * 2)
+            self._fill(missing)
+
+    def _seek_array(self):
+        """Position the reader just inside the target array."""
+        first = self._peek()
+        if first == "[":
+            self.pos += 1
+            return
+        self._expect("{")
+        while True:
+            if self._peek() == "}":
+                raise ValueError(f"No '{self.key}' array in the corpus")
+            key = self._decode()
+            self._expect(":")
+            if key == self.key:
+                self._expect("[")
+                return
+            self._decode()  # skip another top-level value
+            if self._peek() == ",":
+                self.pos += 1
+
+    def __iter__(self) -> Iterator[Any]:
+        self._seek_array()
+        while True:
+            char = self._peek()
+            if char == "]":
+                return
+            if char == ",":
+                self.pos += 1
+                continue
+            if not char:
+                raise ValueError("Unexpected end of corpus inside the array")
+            yield self._decode()
+
+
+def iter_posts(path: Path, key: str = "posts") -> Iterator[Dict[str, Any]]:
+    """
+    Stream posts from a JSON (array or {key: [...]}) or JSONL corpus.
+
+    Args:
+        path: Corpus file
+        key: Top-level key holding the posts in JSON objects
+
+    Yields:
+        Post dicts
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if path.suffix.lower() in (".jsonl", ".ndjson"):
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        else:
+            yield from JSONArrayReader(f, key)
+
+
+# ============================================================================
+#  SCORING
+# ============================================================================
+
+def score_post(post: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Score one post's content, title and excerpt.
+
+    The post title and excerpt stand in for the H1 and meta description
+    when the content has none, and the cover image counts as an image.
+
+    Args:
+        post: Post dict with at least `content`
+
+    Returns:
+        One score table row
+    """
+    title = (post.get("title") or "").strip()
+    excerpt = (post.get("excerpt") or "").strip()
+    row = {
+        "id": post.get("id", ""),
+        "slug": post.get("slug", ""),
+        "title_chars": len(title),
+        "excerpt_chars": len(excerpt)
+    }
+    try:
+        doc = parse_document(post.get("content") or "")
+        if title:
+            doc.frontmatter.setdefault("title", title)
+            # The page template renders the title as the H1
+            if not doc.count_headings(1):
+                doc.headings.insert(0, Heading(1, title))
+        if excerpt:
+            doc.frontmatter.setdefault("description", excerpt)
+        if post.get("language"):
+            doc.frontmatter.setdefault("language", post["language"])
+        if post.get("coverImage"):
+            doc.images.append(Image(title, post["coverImage"]))
+
+        checks = run_checks(doc)
+        readability = analyze_readability(doc)
+    except Exception as e:
+        return {**row, "error": str(e)}
+
+    total = sum(c["score"] for c in checks.values())
+    max_total = sum(c["max_score"] for c in checks.values())
+    percentage = round(total / max_total * 100) if max_total else 0
+
+    findings = [f"[{name.upper()}] {finding}" for name, check in checks.items() for finding in check["findings"]]
+    if not excerpt:
+        findings.append("[EXCERPT] Missing excerpt")
+    elif not EXCERPT_MIN_CHARS <= len(excerpt) <= EXCERPT_MAX_CHARS:
+        findings.append(
+            f"[EXCERPT] Excerpt length ({len(excerpt)}) outside {EXCERPT_MIN_CHARS}-{EXCERPT_MAX_CHARS}"
+        )
+
+    row.update({
+        "format": doc.format,
+        "words": doc.word_count,
+        "percentage": percentage,
+        "grade": get_grade(percentage),
+        **{name: check["score"] for name, check in checks.items()},
+        "readability": readability["flesch_score"],
+        "findings": " | ".join(findings)
+    })
+    return row
+
+
+def _score_batch(posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Process-pool task: score a batch of posts."""
+    return [score_post(post) for post in posts]
+
+
+def _batches(posts: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch = []
+    for post in posts:
+        batch.append({k: post[k] for k in POST_FIELDS if k in post})
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def score_corpus(
+    posts: Iterable[Dict[str, Any]],
+    workers: int = 1,
+    batch_size: int = 16
+) -> Iterator[Dict[str, Any]]:
+    """
+    Score posts, yielding rows as batches complete.
+
+    At most two batches per worker are in flight, so the corpus is never
+    fully loaded.
+
+    Args:
+        posts: Post stream
+        workers: Worker processes (1 = score in this process)
+        batch_size: Posts per worker task
+
+    Yields:
+        Score table rows (completion order)
+    """
+    if workers <= 1:
+        for post in posts:
+            yield score_post(post)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = set()
+        for batch in _batches(posts, batch_size):
+            if len(in_flight) >= workers * 2:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+            in_flight.add(executor.submit(_score_batch, batch))
+        for future in in_flight:
+            yield from future.result()
+
+
+# ============================================================================
+#  OUTPUT
+# ============================================================================
+
+def write_csv(rows: Iterable[Dict[str, Any]], out: TextIO) -> List[Dict[str, Any]]:
+    """Stream rows to CSV; returns the rows for the summary."""
+    writer = csv.DictWriter(out, fieldnames=COLUMNS + ["error"], extrasaction="ignore")
+    writer.writeheader()
+    written = []
+    for row in rows:
+        writer.writerow(row)
+        written.append(row)
+    return written
+
+
+def to_columns(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Row dicts -> column lists."""
+    columns = COLUMNS + (["error"] if any("error" in r for r in rows) else [])
+    return {name: [row.get(name) for row in rows] for name in columns}
+
+
+def write_parquet(rows: List[Dict[str, Any]], output_path: Path):
+    """Write the score table as Parquet (requires pyarrow)."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow not installed. Run: pip install pyarrow (or use --output scores.csv)")
+    pq.write_table(pa.table(to_columns(rows)), output_path)
+
+
+def write_columnar_json(rows: List[Dict[str, Any]], output_path: Path):
+    """Write the score table as {"columns": {name: [values...]}}."""
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump({"rows": len(rows), "columns": to_columns(rows)}, f, ensure_ascii=False)
+
+
+def summarize(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Corpus-level averages and grade distribution."""
+    valid = [r for r in rows if "error" not in r]
+    grades: Dict[str, int] = {}
+    for row in valid:
+        grades[row["grade"]] = grades.get(row["grade"], 0) + 1
+    return {
+        "posts": len(rows),
+        "errors": len(rows) - len(valid),
+        "average_score": round(sum(r["percentage"] for r in valid) / len(valid), 1) if valid else 0,
+        "grades": dict(sorted(grades.items()))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score every post of a JSON/JSONL blog corpus")
+    parser.add_argument("corpus", help="Corpus file (.json with a posts array, or .jsonl)")
+    parser.add_argument("--key", default="posts", help="Top-level key holding the posts array")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                        help="Worker processes (0 = one per CPU)")
+    parser.add_argument("--batch-size", type=int, default=16, help="Posts per worker task")
+    parser.add_argument("--output", "-o",
+                        help="Score table (.csv streams rows; .parquet needs pyarrow; .json is columnar)")
+    parser.add_argument("--worst", type=int, default=10, help="Lowest-scoring posts to list")
+
+    args = parser.parse_args()
+
+    corpus = Path(args.corpus)
+    if not corpus.exists():
+        print(f"Error: Corpus not found: {corpus}")
+        sys.exit(1)
+
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    rows_iter = score_corpus(iter_posts(corpus, args.key), workers, args.batch_size)
+
+    output = Path(args.output) if args.output else None
+    if output and output.suffix.lower() == ".csv":
+        with open(output, "w", encoding="utf-8", newline="") as f:
+            rows = write_csv(rows_iter, f)
+    else:
+        rows = list(rows_iter)
+        if output and output.suffix.lower() == ".parquet":
+            write_parquet(rows, output)
+        elif output:
+            write_columnar_json(rows, output)
+
+    summary = summarize(rows)
+
+    print(f"\n{'='*60}")
+    print(f"[CORPUS ANALYZER]")
+    print(f"{'='*60}")
+    print(f"Corpus: {corpus}")
+    print(f"Posts: {summary['posts']} ({summary['errors']} errors)")
+    print(f"Average Score: {summary['average_score']}%")
+    print(f"Grades: {summary['grades']}")
+
+    worst = sorted((r for r in rows if "error" not in r), key=lambda r: r["percentage"])[:args.worst]
+    if worst:
+        print(f"\n{'-'*60}")
+        print("LOWEST SCORING")
+        for row in worst:
+            print(f"  [{row['grade']}] {row['percentage']:>3}%  {row['slug'] or row['id']}")
+
+    print(f"\n{'='*60}\n")
+    if output:
+        print(f"Score table saved to: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,468 @@
+"""
+Document Model
+
+Single-pass tokenizer for content files. Content is scanned once into
+headings, paragraphs, list items, links, images, tables, plain text,
+sentences and words; the analyzer and optimizer checks read this model
+instead of re-scanning the raw text with their own regexes.
+
+Markdown is tokenized line by line; HTML is fed through a streaming
+html.parser backend that fills the same model.
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import cached_property
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple, Union
+
+from readability import WORD_PATTERN, fold_case, normalize_language
+
+HEADING_PATTERN = re.compile(r'(#{1,6})(?:\s+(.*)|\s*$)')
+LIST_ITEM_PATTERN = re.compile(r'\s*[-*+]\s+(.*)')
+ORDERED_ITEM_PATTERN = re.compile(r'\s*\d+\.\s+')
+INLINE_PATTERN = re.compile(r'(!?)\[([^\]]*)\]\(([^)\s]*)[^)]*\)')
+INLINE_CODE_PATTERN = re.compile(r'`[^`]+`')
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+EMPHASIS_PATTERN = re.compile(r'[*_]{1,2}([^*_]+)[*_]{1,2}')
+FRONTMATTER_LINE_PATTERN = re.compile(r'(\w[\w-]*):\s*(.*)')
+SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+# Block-level HTML tags in the opening of a file, used for format detection
+HTML_BLOCK_PATTERN = re.compile(
+    r'<(?:html|body|h[1-6]|p|div|section|article|ul|ol|li|table|img|a)[\s>/]', re.IGNORECASE
+)
+MARKDOWN_BLOCK_PATTERN = re.compile(r'^(?:#{1,6}\s|\s*[-*+]\s|\s*\d+\.\s)|\]\(', re.MULTILINE)
+DETECT_SAMPLE_SIZE = 8192
+
+# File suffixes whose format is known without detection
+FORMAT_BY_SUFFIX = {'.html': 'html', '.htm': 'html'}
+
+# Only presence matters, so a single digit is enough to anchor the match
+STATISTICS_PATTERN = re.compile(r'\d(?:%|\s*(?:percent|million|billion))', re.IGNORECASE)
+
+
+@dataclass
+class Heading:
+    level: int
+    text: str
+
+
+@dataclass
+class Link:
+    text: str
+    url: str
+
+    @property
+    def is_external(self) -> bool:
+        return self.url.startswith('http')
+
+
+@dataclass
+class Image:
+    alt: str
+    src: str
+
+
+@dataclass
+class Document:
+    """Tokenized content shared by all checks."""
+    source: str
+    format: str = "markdown"
+    frontmatter: Dict[str, str] = field(default_factory=dict)
+    headings: List[Heading] = field(default_factory=list)
+    paragraphs: List[str] = field(default_factory=list)
+    list_items: List[str] = field(default_factory=list)
+    links: List[Link] = field(default_factory=list)
+    images: List[Image] = field(default_factory=list)
+    table_rows: int = 0
+    title_field: Optional[str] = None
+    text: str = ""
+
+    @cached_property
+    def lower(self) -> str:
+        """Lowercased source, computed once."""
+        return fold_case(self.source)
+
+    @cached_property
+    def words(self) -> List[str]:
+        return WORD_PATTERN.findall(self.text)
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        return [s.strip() for s in SENTENCE_SPLIT_PATTERN.split(self.text) if s.strip()]
+
+    @property
+    def readable(self) -> str:
+        """Source for reader-facing checks (the extracted text for HTML, so markup doesn't count)."""
+        return self.text if self.format == "html" else self.source
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        """Whitespace-separated tokens of the lowercased readable source."""
+        return fold_case(self.readable).split()
+
+    @cached_property
+    def has_statistics(self) -> bool:
+        return bool(STATISTICS_PATTERN.search(self.readable))
+
+    @property
+    def word_count(self) -> int:
+        return len(self.words)
+
+    @property
+    def question_count(self) -> int:
+        return self.readable.count('?')
+
+    @property
+    def language(self) -> Optional[str]:
+        """Language code from the frontmatter `language` (or `lang`) field."""
+        return normalize_language(self.frontmatter.get("language") or self.frontmatter.get("lang"))
+
+    @property
+    def title(self) -> Optional[str]:
+        """First H1, falling back to a `title:` field."""
+        for heading in self.headings:
+            if heading.level == 1 and heading.text:
+                return heading.text
+        return self.frontmatter.get("title") or self.title_field
+
+    def count_headings(self, level: int) -> int:
+        return sum(1 for h in self.headings if h.level == level)
+
+    def first_words(self, count: int) -> str:
+        """First words of the lowercased source."""
+        return ' '.join(self.tokens[:count])
+
+
+def parse_markdown(content: str) -> Document:
+    """
+    Tokenize markdown content in one pass over its lines.
+
+    Args:
+        content: Raw markdown (optionally with YAML frontmatter)
+
+    Returns:
+        Document
+    """
+    doc = Document(source=content)
+    lines = content.split('\n')
+    text_lines: List[str] = []
+    block: List[str] = []
+    in_fence = False
+    start = 0
+
+    # Frontmatter
+    if lines and lines[0].strip() == '---':
+        for index in range(1, len(lines)):
+            if lines[index].strip() == '---':
+                start = index + 1
+                break
+            match = FRONTMATTER_LINE_PATTERN.match(lines[index].strip())
+            if match:
+                doc.frontmatter[match.group(1).lower()] = match.group(2).strip().strip('"\'')
+
+    def flush_block():
+        if block and not block[0].lstrip().startswith('#'):
+            doc.paragraphs.append('\n'.join(block))
+        block.clear()
+
+    for line in lines[start:]:
+        stripped = line.strip()
+
+        if stripped.startswith('```'):
+            in_fence = not in_fence
+            block.append(line)
+            continue
+        if in_fence:
+            block.append(line)
+            continue
+
+        if not stripped:
+            flush_block()
+            continue
+        block.append(line)
+
+        if doc.title_field is None and 'title:' in line:
+            doc.title_field = line.split('title:', 1)[1].strip().strip('"\'') or None
+
+        heading = HEADING_PATTERN.match(line)
+        if heading:
+            text = (heading.group(2) or '').strip()
+            doc.headings.append(Heading(len(heading.group(1)), text))
+            text_lines.append(text)
+            continue
+
+        list_item = LIST_ITEM_PATTERN.match(line)
+        if list_item:
+            doc.list_items.append(list_item.group(1))
+            line = list_item.group(1)
+        elif ORDERED_ITEM_PATTERN.match(line):
+            line = ORDERED_ITEM_PATTERN.sub('', line, count=1)
+        elif stripped.startswith('>'):
+            line = stripped.lstrip('>').strip()
+
+        if stripped.count('|') >= 2:
+            doc.table_rows += 1
+
+        if '[' in line:
+            for bang, label, url in INLINE_PATTERN.findall(line):
+                if bang:
+                    doc.images.append(Image(label, url))
+                else:
+                    doc.links.append(Link(label, url))
+            line = INLINE_PATTERN.sub(lambda m: '' if m.group(1) else m.group(2), line)
+
+        if '`' in line:
+            line = INLINE_CODE_PATTERN.sub('', line)
+        if '<' in line:
+            line = HTML_TAG_PATTERN.sub('', line)
+        if '*' in line or '_' in line:
+            line = EMPHASIS_PATTERN.sub(r'\1', line)
+        text_lines.append(line)
+
+    flush_block()
+    doc.text = '\n'.join(text_lines)
+    return doc
+
+
+# ============================================================================
+#  HTML
+# ============================================================================
+
+class HTMLDocumentParser(HTMLParser):
+    """
+    Streaming html.parser backend that fills a Document.
+
+    Tags are handled as they are encountered: headings, paragraphs and list
+    items buffer their own text, links and images are recorded from their
+    attributes, and <title>, <meta name="description"> and <html lang> are
+    stored as frontmatter fields. Script, style and code text is dropped,
+    matching the markdown path. Unclosed <p> and <li> tags are closed
+    implicitly.
+    """
+
+    SKIP_TAGS = frozenset({'script', 'style', 'pre', 'code', 'template', 'noscript', 'svg'})
+    HEADING_TAGS = {f'h{level}': level for level in range(1, 7)}
+    BLOCK_TAGS = frozenset({
+        'p', 'div', 'section', 'article', 'header', 'footer', 'main', 'aside', 'nav',
+        'ul', 'ol', 'li', 'table', 'tr', 'td', 'th', 'blockquote', 'br', 'hr',
+        'figure', 'figcaption', 'dl', 'dt', 'dd', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'
+    })
+    # Block tags that implicitly end an open <p>
+    PARAGRAPH_CLOSERS = BLOCK_TAGS - {'br', 'li', 'td', 'th', 'dt', 'dd'}
+
+    def __init__(self, content: str):
+        super().__init__(convert_charrefs=True)
+        self.doc = Document(source=content, format="html")
+        self.text_parts: List[str] = []
+        self.skip_depth = 0
+        self.title_parts: Optional[List[str]] = None
+        self.heading: Optional[Tuple[int, List[str]]] = None
+        self.paragraph: Optional[List[str]] = None
+        self.list_depth = 0
+        self.list_block: Optional[List[str]] = None
+        self.list_items: List[Tuple[int, List[str]]] = []
+        self.link: Optional[Tuple[str, List[str]]] = None
+
+    @staticmethod
+    def _join(parts: List[str]) -> str:
+        return ' '.join(''.join(parts).split())
+
+    def _close_paragraph(self):
+        if self.paragraph is not None:
+            text = self._join(self.paragraph)
+            if text:
+                self.doc.paragraphs.append(text)
+            self.paragraph = None
+
+    def _close_heading(self):
+        if self.heading is not None:
+            level, parts = self.heading
+            self.doc.headings.append(Heading(level, self._join(parts)))
+            self.heading = None
+
+    def _close_list_items(self, depth: int):
+        """Close open <li> elements at or below a list depth."""
+        while self.list_items and self.list_items[-1][0] >= depth:
+            _, parts = self.list_items.pop()
+            self.doc.list_items.append(self._join(parts))
+
+    def _close_link(self):
+        if self.link is not None:
+            href, parts = self.link
+            self.doc.links.append(Link(self._join(parts), href))
+            self.link = None
+
+    def _open_buffers(self) -> List[List[str]]:
+        """Text buffers of the elements currently open."""
+        return [
+            buffer for buffer in (
+                self.heading[1] if self.heading else None,
+                self.paragraph,
+                self.list_block,
+                self.list_items[-1][1] if self.list_items else None,
+                self.link[1] if self.link else None
+            )
+            if buffer is not None
+        ]
+
+    def _block_boundary(self):
+        """Separate text on either side of a block tag or <br>."""
+        self.text_parts.append('\n')
+        for buffer in self._open_buffers():
+            buffer.append(' ')
+
+    def handle_starttag(self, tag: str, attrs):
+        if tag in self.SKIP_TAGS:
+            self.skip_depth += 1
+            return
+        attrs = dict(attrs)
+
+        if tag in self.BLOCK_TAGS:
+            self._block_boundary()
+            if tag in self.PARAGRAPH_CLOSERS:
+                self._close_paragraph()
+                self._close_heading()
+
+        if tag in self.HEADING_TAGS:
+            self.heading = (self.HEADING_TAGS[tag], [])
+        elif tag == 'p':
+            self.paragraph = []
+        elif tag in ('ul', 'ol'):
+            self.list_depth += 1
+            if self.list_block is None:
+                self.list_block = []
+        elif tag == 'li':
+            self._close_list_items(self.list_depth)
+            self.list_items.append((self.list_depth, []))
+        elif tag == 'a':
+            self._close_link()
+            if attrs.get('href') is not None:
+                self.link = (attrs['href'].strip(), [])
+        elif tag == 'img':
+            self.doc.images.append(Image(attrs.get('alt') or '', attrs.get('src') or ''))
+        elif tag == 'tr':
+            self.doc.table_rows += 1
+        elif tag == 'title':
+            self.title_parts = []
+        elif tag == 'meta':
+            name = (attrs.get('name') or attrs.get('property') or '').lower()
+            if name in ('description', 'og:description', 'keywords') and attrs.get('content'):
+                self.doc.frontmatter.setdefault(name.split(':')[-1], attrs['content'].strip())
+        elif tag == 'html' and attrs.get('lang'):
+            self.doc.frontmatter.setdefault('language', attrs['lang'])
+
+    def handle_endtag(self, tag: str):
+        if tag in self.SKIP_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+            return
+
+        if tag in self.HEADING_TAGS:
+            self._close_heading()
+        elif tag == 'p':
+            self._close_paragraph()
+        elif tag == 'li':
+            self._close_list_items(self.list_depth)
+        elif tag in ('ul', 'ol') and self.list_depth:
+            self._close_list_items(self.list_depth)
+            self.list_depth -= 1
+            if self.list_depth == 0 and self.list_block is not None:
+                text = self._join(self.list_block)
+                if text:
+                    self.doc.paragraphs.append(text)
+                self.list_block = None
+        elif tag == 'a':
+            self._close_link()
+        elif tag == 'title' and self.title_parts is not None:
+            title = self._join(self.title_parts)
+            if title:
+                self.doc.frontmatter.setdefault('title', title)
+            self.title_parts = None
+
+        if tag in self.BLOCK_TAGS:
+            self._block_boundary()
+
+    def handle_data(self, data: str):
+        if self.skip_depth:
+            return
+        if self.title_parts is not None:
+            self.title_parts.append(data)
+            return
+
+        self.text_parts.append(data)
+        for buffer in self._open_buffers():
+            buffer.append(data)
+
+    def finish(self) -> Document:
+        """Flush the parser and any implicitly open elements."""
+        self.close()
+        self._close_link()
+        self._close_heading()
+        self._close_paragraph()
+        self._close_list_items(0)
+        if self.list_block:
+            text = self._join(self.list_block)
+            if text:
+                self.doc.paragraphs.append(text)
+        self.doc.text = '\n'.join(
+            ' '.join(line.split())
+            for line in ''.join(self.text_parts).split('\n')
+            if line.strip()
+        )
+        return self.doc
+
+
+def parse_html(content: str) -> Document:
+    """
+    Tokenize HTML content in one streaming pass.
+
+    Args:
+        content: HTML document or fragment
+
+    Returns:
+        Document
+    """
+    parser = HTMLDocumentParser(content)
+    parser.feed(content)
+    return parser.finish()
+
+
+def detect_format(content: str) -> str:
+    """
+    Guess whether content is HTML or markdown from its opening.
+
+    Args:
+        content: Raw content
+
+    Returns:
+        "html" or "markdown"
+    """
+    sample = content[:DETECT_SAMPLE_SIZE]
+    html_blocks = len(HTML_BLOCK_PATTERN.findall(sample))
+    if not html_blocks:
+        return "markdown"
+    markdown_blocks = len(MARKDOWN_BLOCK_PATTERN.findall(sample))
+    return "html" if html_blocks > markdown_blocks else "markdown"
+
+
+def parse_document(content: str, format: Optional[str] = None) -> Document:
+    """
+    Tokenize content into a Document.
+
+    Args:
+        content: Raw content
+        format: "html" or "markdown" (None = detect)
+
+    Returns:
+        Document
+    """
+    if (format or detect_format(content)) == "html":
+        return parse_html(content)
+    return parse_markdown(content)
+
+
+def as_document(content: Union[str, Document], format: Optional[str] = None) -> Document:
+    """Accept raw content or an already parsed Document."""
+    if isinstance(content, Document):
+        return content
+    return parse_document(content, format)
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Script: keyword_index.py
+Purpose: Corpus-level keyword index (unigrams, bigrams, trigrams with positions)
+Usage: python keyword_index.py <directory|corpus.json> [--keywords "iş güvenliği,OSGB"] [--output report.json]
+
+The index is built once per run and answers density, first-occurrence and
+heading-presence queries for many keywords across many pages, and reports
+cannibalisation where several pages target the same phrase.
+
+Tokens are case-folded with I, İ, ı and i treated as one letter, so
+"ISG" matches "isg" and "Industrial" matches "industrial" whatever the
+page language. By default the last keyword token also matches longer
+words ("risk değerlendirmesi" matches "risk değerlendirmesinin"), since
+Turkish attaches case suffixes.
+"""
+
+import re
+import sys
+import json
+import bisect
+import argparse
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional, Union
+
+from document_model import FORMAT_BY_SUFFIX, Document, as_document, parse_document
+from readability import fold_case
+from model_config import config_keywords
+
+# Fix Windows console encoding
+try:
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+except AttributeError:
+    pass
+
+
+# Letters and digits, so phrases like "6331 sayılı kanun" are indexable
+TOKEN_PATTERN = re.compile(r"[^\W_]+(?:['’][^\W_]+)*")
+
+MAX_NGRAM = 3
+INTRO_WORDS = 100
+
+# Density (%) at which a page counts as targeting a keyword
+TARGET_DENSITY = 1.0
+
+
+def fold_token(token: str) -> str:
+    """Lowercase with the dotted and dotless i merged, so English and Turkish casing agree."""
+    return fold_case(token).replace('ı', 'i')
+
+
+def tokenize(text: str) -> List[str]:
+    """Case-folded index tokens."""
+    return [fold_token(token) for token in TOKEN_PATTERN.findall(text)]
+
+
+@dataclass
+class KeywordHit:
+    """One keyword's occurrences in one page."""
+    page: str
+    count: int
+    density: float
+    first_position: int
+    in_first_100_words: bool
+    in_title: bool
+    in_headings: bool
+
+
+class KeywordIndex:
+    """
+    Positional n-gram index over a set of pages.
+
+    postings[ngram][page] holds the token positions where the n-gram
+    starts, for n = 1..MAX_NGRAM. Phrases longer than MAX_NGRAM are
+    matched by chaining postings.
+    """
+
+    def __init__(self, match_suffixes: bool = True):
+        """
+        Args:
+            match_suffixes: Let the last keyword token match longer words
+        """
+        self.match_suffixes = match_suffixes
+        self.postings: Dict[str, Dict[str, List[int]]] = {}
+        self.tokens: Dict[str, List[str]] = {}
+        self.word_counts: Dict[str, int] = {}
+        self.headings: Dict[str, List[List[str]]] = {}
+        self.titles: Dict[str, List[str]] = {}
+        self._vocabulary: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def add(self, page: str, content: Union[str, Document]):
+        """
+        Index one page.
+
+        Args:
+            page: Page identifier (path, slug, ...)
+            content: Raw content or parsed Document
+        """
+        doc = as_document(content)
+        tokens = tokenize(doc.text)
+        self.tokens[page] = tokens
+        self.word_counts[page] = doc.word_count
+        self.headings[page] = [tokenize(h.text) for h in doc.headings]
+        self.titles[page] = tokenize(doc.title or "")
+        self._vocabulary = None
+
+        for n in range(1, MAX_NGRAM + 1):
+            for position in range(len(tokens) - n + 1):
+                ngram = ' '.join(tokens[position:position + n])
+                self.postings.setdefault(ngram, {}).setdefault(page, []).append(position)
+
+    @property
+    def vocabulary(self) -> List[str]:
+        """Sorted unigrams, for suffix lookups."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(k for k in self.postings if ' ' not in k)
+        return self._vocabulary
+
+    def _expansions(self, token: str) -> List[str]:
+        """Indexed tokens the last keyword token matches."""
+        if not self.match_suffixes:
+            return [token]
+        vocabulary = self.vocabulary
+        start = bisect.bisect_left(vocabulary, token)
+        end = bisect.bisect_left(vocabulary, token + '\uffff')
+        return vocabulary[start:end]
+
+    def _phrase_positions(self, tokens: List[str]) -> Dict[str, List[int]]:
+        """Start positions of an exact token phrase per page."""
+        head = tokens[:MAX_NGRAM]
+        positions = self.postings.get(' '.join(head), {})
+        if len(tokens) <= MAX_NGRAM:
+            return positions
+        rest = tokens[MAX_NGRAM:]
+        matches = {}
+        for page, starts in positions.items():
+            page_tokens = self.tokens[page]
+            hits = [
+                p for p in starts
+                if page_tokens[p + MAX_NGRAM:p + len(tokens)] == rest
+            ]
+            if hits:
+                matches[page] = hits
+        return matches
+
+    def occurrences(self, keyword: str) -> Dict[str, List[int]]:
+        """
+        Start positions of a keyword per page.
+
+        Args:
+            keyword: Keyword or phrase
+
+        Returns:
+            {page: [positions]}
+        """
+        tokens = tokenize(keyword)
+        if not tokens:
+            return {}
+        *lead, last = tokens
+        matches: Dict[str, List[int]] = {}
+        for variant in self._expansions(last):
+            for page, starts in self._phrase_positions(lead + [variant]).items():
+                matches.setdefault(page, []).extend(starts)
+        return {page: sorted(starts) for page, starts in matches.items()}
+
+    def _in_phrases(self, tokens: List[str], phrases: Iterable[List[str]]) -> bool:
+        """Whether the keyword tokens occur inside any of the token lists."""
+        *lead, last = tokens
+        size = len(tokens)
+        for phrase in phrases:
+            for i in range(len(phrase) - size + 1):
+                if phrase[i:i + size - 1] != lead:
+                    continue
+                word = phrase[i + size - 1]
+                if word == last or (self.match_suffixes and word.startswith(last)):
+                    return True
+        return False
+
+    def query(self, keyword: str) -> List[KeywordHit]:
+        """
+        Per-page statistics for one keyword, densest first.
+
+        Args:
+            keyword: Keyword or phrase
+
+        Returns:
+            KeywordHit list (pages without the keyword are omitted)
+        """
+        tokens = tokenize(keyword)
+        if not tokens:
+            return []
+        hits = []
+        for page, starts in self.occurrences(keyword).items():
+            word_count = self.word_counts[page] or len(self.tokens[page])
+            hits.append(KeywordHit(
+                page=page,
+                count=len(starts),
+                density=round(len(starts) / word_count * 100, 2) if word_count else 0,
+                first_position=starts[0],
+                in_first_100_words=starts[0] < INTRO_WORDS,
+                in_title=self._in_phrases(tokens, [self.titles[page]]),
+                in_headings=self._in_phrases(tokens, self.headings[page])
+            ))
+        hits.sort(key=lambda h: (-h.density, h.page))
+        return hits
+
+    def query_many(self, keywords: Iterable[str]) -> Dict[str, List[KeywordHit]]:
+        """query() for several keywords."""
+        return {keyword: self.query(keyword) for keyword in keywords}
+
+    def cannibalization(
+        self,
+        keywords: Iterable[str],
+        min_density: float = TARGET_DENSITY
+    ) -> List[Dict[str, Any]]:
+        """
+        Keywords targeted by more than one page.
+
+        A page targets a keyword when it appears in the page title or a
+        heading, or reaches `min_density`.
+
+        Args:
+            keywords: Keywords to check
+            min_density: Density (%) that counts as targeting
+
+        Returns:
+            [{"keyword", "pages": [{"page", "density", "in_title", "in_headings"}]}]
+        """
+        report = []
+        for keyword, hits in self.query_many(keywords).items():
+            targeting = [
+                h for h in hits
+                if h.in_title or h.in_headings or h.density >= min_density
+            ]
+            if len(targeting) > 1:
+                report.append({
+                    "keyword": keyword,
+                    "pages": [
+                        {
+                            "page": h.page,
+                            "density": h.density,
+                            "in_title": h.in_title,
+                            "in_headings": h.in_headings
+                        }
+                        for h in targeting
+                    ]
+                })
+        report.sort(key=lambda r: -len(r["pages"]))
+        return report
+
+
+def keyword_summary(keyword: str, hits: List[KeywordHit], pages: int) -> Dict[str, Any]:
+    """Corpus-level numbers for one keyword."""
+    return {
+        "keyword": keyword,
+        "pages_with_keyword": len(hits),
+        "coverage": round(len(hits) / pages * 100, 1) if pages else 0,
+        "occurrences": sum(h.count for h in hits),
+        "in_title": sum(1 for h in hits if h.in_title),
+        "in_headings": sum(1 for h in hits if h.in_headings),
+        "in_first_100_words": sum(1 for h in hits if h.in_first_100_words),
+        "top_pages": [asdict(h) for h in hits[:5]]
+    }
+
+
+def build_index(path: Path, key: str = "posts", match_suffixes: bool = True) -> KeywordIndex:
+    """
+    Index a content directory, a single file, or a JSON/JSONL post corpus.
+
+    Args:
+        path: Directory, content file, or .json/.jsonl corpus
+        key: Top-level key holding the posts in JSON corpora
+        match_suffixes: See KeywordIndex
+
+    Returns:
+        KeywordIndex
+    """
+    index = KeywordIndex(match_suffixes)
+    if path.is_file() and path.suffix.lower() in ('.json', '.jsonl', '.ndjson'):
+        from corpus_analyzer import iter_posts
+        for post in iter_posts(path, key):
+            doc = parse_document(post.get("content") or "")
+            if post.get("title"):
+                doc.frontmatter.setdefault("title", post["title"])
+            index.add(str(post.get("slug") or post.get("id")), doc)
+        return index
+
+    from content_analyzer import iter_content_files
+    files = [path] if path.is_file() else iter_content_files(path)
+    for file_path in files:
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+        index.add(str(file_path), parse_document(content, FORMAT_BY_SUFFIX.get(file_path.suffix.lower())))
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Corpus keyword index")
+    parser.add_argument("path", help="Content directory, file, or JSON/JSONL post corpus")
+    parser.add_argument("--keywords", "-k", help="Comma-separated keywords (default: osgb_context.keywords)")
+    parser.add_argument("--config", help="model-config.json with osgb_context.keywords")
+    parser.add_argument("--key", default="posts", help="Top-level key holding posts in JSON corpora")
+    parser.add_argument("--exact", action="store_true", help="Don't match suffixed forms of the last word")
+    parser.add_argument("--min-density", type=float, default=TARGET_DENSITY,
+                        help="Density (%%) at which a page counts as targeting a keyword")
+    parser.add_argument("--output", "-o", help="Output JSON file")
+    parser.add_argument("--json", action="store_true", help="Output JSON only")
+
+    args = parser.parse_args()
+
+    path = Path(args.path)
+    if not path.exists():
+        print(f"Error: Path not found: {path}")
+        sys.exit(1)
+
+    if args.keywords:
+        keywords = [k.strip() for k in args.keywords.split(',') if k.strip()]
+    else:
+        keywords = config_keywords(args.config)
+    if not keywords:
+        print("Error: No keywords given and none configured in osgb_context.keywords")
+        sys.exit(1)
+
+    index = build_index(path, args.key, match_suffixes=not args.exact)
+    results = index.query_many(keywords)
+
+    report = {
+        "path": str(path),
+        "pages": len(index),
+        "keywords": [keyword_summary(k, hits, len(index)) for k, hits in results.items()],
+        "cannibalization": index.cannibalization(keywords, args.min_density)
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print(f"\n{'='*60}")
+        print(f"[KEYWORD INDEX]")
+        print(f"{'='*60}")
+        print(f"Path: {path}")
+        print(f"Pages: {report['pages']}")
+
+        print(f"\n{'-'*60}")
+        print("KEYWORDS")
+        for summary in report["keywords"]:
+            print(f"  {summary['keyword']}: {summary['pages_with_keyword']} pages "
+                  f"({summary['coverage']}%), {summary['occurrences']} occurrences, "
+                  f"{summary['in_headings']} in headings")
+
+        if report["cannibalization"]:
+            print(f"\n{'-'*60}")
+            print("CANNIBALIZATION")
+            for entry in report["cannibalization"]:
+                print(f"  '{entry['keyword']}' targeted by {len(entry['pages'])} pages")
+                for page in entry["pages"][:5]:
+                    print(f"    - {page['page']} ({page['density']}%)")
+
+        print(f"\n{'='*60}\n")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Report saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
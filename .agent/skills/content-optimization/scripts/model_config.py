@@ -0,0 +1,42 @@
+"""
+Model Config
+
+Locates and loads the shared model-config.json (scripts/ai/config) so the
+content scripts can read project defaults such as `defaults.language` and
+`osgb_context.keywords`.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+MODEL_CONFIG = Path("scripts") / "ai" / "config" / "model-config.json"
+
+
+@lru_cache(maxsize=None)
+def load_model_config(config_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load model-config.json.
+
+    Args:
+        config_path: Config file (default: searched upwards from this file)
+
+    Returns:
+        Config dict (empty if none is found)
+    """
+    candidates = [Path(config_path)] if config_path else [
+        parent / MODEL_CONFIG for parent in Path(__file__).resolve().parents
+    ]
+    for candidate in candidates:
+        try:
+            with open(candidate, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+    return {}
+
+
+def config_keywords(config_path: Optional[str] = None) -> List[str]:
+    """Target keywords from `osgb_context.keywords`."""
+    return list(load_model_config(config_path).get("osgb_context", {}).get("keywords", []))
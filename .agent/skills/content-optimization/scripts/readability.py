@@ -0,0 +1,186 @@
+"""
+Readability Engines
+
+Language-specific syllable counting and reading-ease formulas:
+
+- en: English vowel-group syllables, Flesch Reading Ease
+- tr: Turkish syllable count (one vowel per syllable), Ateşman (1997)
+
+The language comes from the content's frontmatter `language` field, or
+from `defaults.language` in the model config when the content has none.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Type
+
+from model_config import load_model_config
+
+# Unicode letters only (no digits or underscores); an apostrophe followed by
+# letters stays in the word, so Turkish suffixes like "OSGB'ler" are one word
+WORD_PATTERN = re.compile(r"[^\W\d_]+(?:['’][^\W\d_]+)*")
+
+FALLBACK_LANGUAGE = "en"
+
+# Distinct words remembered per language
+SYLLABLE_CACHE_SIZE = 65536
+
+
+def split_words(text: str) -> List[str]:
+    """Unicode-aware word segmentation."""
+    return WORD_PATTERN.findall(text)
+
+
+# ============================================================================
+#  ENGLISH
+# ============================================================================
+
+@lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
+def english_syllables(word: str) -> int:
+    """Estimate syllable count for an English word."""
+    word = word.lower()
+    if len(word) <= 3:
+        return 1
+
+    # Remove silent e
+    if word.endswith('e'):
+        word = word[:-1]
+
+    # Count vowel groups
+    vowels = 'aeiouy'
+    count = 0
+    prev_vowel = False
+
+    for char in word:
+        is_vowel = char in vowels
+        if is_vowel and not prev_vowel:
+            count += 1
+        prev_vowel = is_vowel
+
+    return max(1, count)
+
+
+# ============================================================================
+#  TURKISH
+# ============================================================================
+
+TURKISH_VOWELS = frozenset('aeıioöuüâîû')
+TURKISH_LOWER = str.maketrans({'I': 'ı', 'İ': 'i'})
+
+
+def turkish_lower(word: str) -> str:
+    """Lowercase with Turkish dotted/dotless i rules."""
+    return word.translate(TURKISH_LOWER).lower()
+
+
+def fold_case(text: str) -> str:
+    """Lowercase for phrase matching; "İ" folds to a plain "i" (not "i" + combining dot)."""
+    return text.replace('İ', 'i').lower()
+
+
+@lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
+def turkish_syllables(word: str) -> int:
+    """Syllable count of a Turkish word (its vowel count)."""
+    return max(1, sum(1 for char in turkish_lower(word) if char in TURKISH_VOWELS))
+
+
+# ============================================================================
+#  ENGINES
+# ============================================================================
+
+class ReadabilityEngine:
+    """Reading-ease formula and syllable counter for one language."""
+
+    language = FALLBACK_LANGUAGE
+    formula = "flesch"
+    formula_name = "Flesch"
+
+    def syllables(self, word: str) -> int:
+        return english_syllables(word)
+
+    def reading_ease(self, avg_sentence_length: float, avg_syllables: float) -> float:
+        """Flesch Reading Ease, clamped to 0-100."""
+        score = 206.835 - (1.015 * avg_sentence_length) - (84.6 * avg_syllables)
+        return max(0, min(100, score))
+
+    def grade(self, score: float) -> str:
+        if score >= 90:
+            return "5th grade (Very Easy)"
+        elif score >= 80:
+            return "6th grade (Easy)"
+        elif score >= 70:
+            return "7th grade (Fairly Easy)"
+        elif score >= 60:
+            return "8-9th grade (Standard)"
+        elif score >= 50:
+            return "10-12th grade (Fairly Difficult)"
+        elif score >= 30:
+            return "College (Difficult)"
+        else:
+            return "Graduate (Very Difficult)"
+
+
+class TurkishReadabilityEngine(ReadabilityEngine):
+    """Ateşman readability for Turkish text."""
+
+    language = "tr"
+    formula = "atesman"
+    formula_name = "Ateşman"
+
+    def syllables(self, word: str) -> int:
+        return turkish_syllables(word)
+
+    def reading_ease(self, avg_sentence_length: float, avg_syllables: float) -> float:
+        """Ateşman score, clamped to 0-100."""
+        score = 198.825 - (40.175 * avg_syllables) - (2.610 * avg_sentence_length)
+        return max(0, min(100, score))
+
+    def grade(self, score: float) -> str:
+        if score >= 90:
+            return "Çok kolay (Very Easy)"
+        elif score >= 70:
+            return "Kolay (Easy)"
+        elif score >= 50:
+            return "Orta güçlükte (Moderate)"
+        elif score >= 30:
+            return "Zor (Difficult)"
+        else:
+            return "Çok zor (Very Difficult)"
+
+
+ENGINES: Dict[str, Type[ReadabilityEngine]] = {
+    "en": ReadabilityEngine,
+    "tr": TurkishReadabilityEngine
+}
+
+
+def normalize_language(language: Optional[str]) -> Optional[str]:
+    """"tr-TR" / "Turkish" style values -> "tr"; None if empty."""
+    if not language:
+        return None
+    language = language.strip().lower()
+    if language.startswith("turk"):
+        return "tr"
+    if language.startswith("engl"):
+        return "en"
+    return language.replace('_', '-').split('-')[0] or None
+
+
+def default_language(config_path: Optional[str] = None) -> str:
+    """
+    `defaults.language` from the model config.
+
+    Args:
+        config_path: model-config.json (default: searched upwards from this file)
+
+    Returns:
+        Language code ("en" if the config sets none)
+    """
+    language = load_model_config(config_path).get("defaults", {}).get("language")
+    return normalize_language(language) or FALLBACK_LANGUAGE
+
+
+def get_engine(language: Optional[str] = None) -> ReadabilityEngine:
+    """Engine for a language (configured default if None, English if unsupported)."""
+    language = normalize_language(language) or default_language()
+    return ENGINES.get(language, ReadabilityEngine)()
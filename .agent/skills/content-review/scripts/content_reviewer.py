@@ -5,16 +5,26 @@ GPT-4 powered content quality assessment and revision workflow.
 """
 
 import os
+import re
 import sys
 import json
+import time
 import logging
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
 # Add parent paths for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "multi-model-connector" / "scripts"))
 
+from review_gate import PreReviewGate
+from section_diff import SectionDiff, diff_sections, section_hashes, split_sections
+from review_cache import ReviewCache, review_key, rubric_version
+from revision_controller import RevisionController, STOP
+from duplicate_index import DuplicateIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,15 +65,48 @@ class ContentReviewer:
     with actionable feedback and revision support.
     """
 
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        connector_manager=None,
+        overrides: Optional[Dict[str, Any]] = None
+    ):
         """
         Initialize the content reviewer.
 
         Args:
             config_path: Path to content-thresholds.json
+            connector_manager: Shared ConnectorManager (created lazily if omitted)
+            overrides: Top-level settings replacing those in content-thresholds.json
         """
         self.config = self._load_config(config_path)
-        self._connector_manager = None
+        self.config.update(overrides or {})
+        self._connector_manager = connector_manager
+        self._cache: Optional[ReviewCache] = None
+        self._duplicate_index: Optional[DuplicateIndex] = None
+        self.gate = PreReviewGate(self.config.get("pre_review_gate", {"enabled": False}))
+        self.stats = {
+            "model_reviews": 0,
+            "model_review_ms": 0.0,
+            "gate_checks": 0,
+            "gate_rejections": 0,
+            "gate_ms": 0.0,
+            "packed_requests": 0,
+            "packed_documents": 0,
+            "packed_fallbacks": 0,
+            "section_rereviews": 0,
+            "full_rereviews": 0,
+            "rereview_chars_reviewed": 0,
+            "rereview_chars_total": 0,
+            "revision_loops": 0,
+            "revision_rounds": 0,
+            "revision_early_stops": 0,
+            "revision_escalations": 0,
+            "revision_saved_iterations": 0,
+            "duplicate_checks": 0,
+            "duplicates_flagged": 0
+        }
+        self._stats_lock = threading.Lock()
 
     def _load_config(self, config_path: Optional[str] = None) -> Dict[str, Any]:
         """Load threshold configuration."""
@@ -116,7 +159,9 @@ class ContentReviewer:
         content: str,
         content_type: str = "default",
         criteria: Optional[List[str]] = None,
-        threshold: Optional[int] = None
+        threshold: Optional[int] = None,
+        use_gate: bool = True,
+        use_cache: bool = True
     ) -> ReviewResult:
         """
         Review content and provide quality assessment.
@@ -126,10 +171,178 @@ class ContentReviewer:
             content_type: Type of content (blog, landing, faq, etc.)
             criteria: Custom criteria to evaluate (optional)
             threshold: Custom pass threshold (optional)
+            use_gate: Run the local pre-review gate before the model review
+            use_cache: Reuse a cached review of identical content
 
         Returns:
             ReviewResult with scores and feedback
         """
+        type_config, review_criteria, pass_threshold = self._review_settings(
+            content_type, criteria, threshold
+        )
+
+        cache_key = None
+        if use_cache:
+            cache_key, cached = self._cached_review(
+                content, content_type, type_config, review_criteria, pass_threshold
+            )
+            if cached is not None:
+                return cached
+
+        # Clear local failures skip the paid model review
+        if use_gate:
+            gate_review = self._run_gate(content, content_type, pass_threshold, review_criteria)
+            if gate_review is not None:
+                return gate_review
+
+        # Get connector manager and perform review
+        manager = self._get_connector_manager()
+        review_start = time.time()
+        raw_result = manager.review(
+            content=content,
+            criteria=review_criteria,
+            content_type=content_type
+        )
+        self._record_stat("model_reviews", 1, "model_review_ms", (time.time() - review_start) * 1000)
+
+        review = self._score_review(
+            raw_result, content_type, type_config, review_criteria, pass_threshold
+        )
+        self._store_review(cache_key, review)
+        return review
+
+    def _get_cache(self) -> Optional[ReviewCache]:
+        """Lazy load the persistent review cache (None when disabled)."""
+        cache_config = self.config.get("review_cache", {})
+        if not cache_config.get("enabled", False):
+            return None
+        with self._stats_lock:
+            if self._cache is None:
+                path = Path(cache_config.get("path", ".cache/review-cache.jsonl"))
+                if not path.is_absolute():
+                    path = Path(__file__).parent.parent / path
+                self._cache = ReviewCache(path, rubric_version(self.config))
+        return self._cache
+
+    def _cached_review(
+        self,
+        content: str,
+        content_type: str,
+        type_config: Dict[str, Any],
+        review_criteria: List[str],
+        pass_threshold: int
+    ):
+        """Look up a cached review; returns (cache key, ReviewResult or None)."""
+        cache = self._get_cache()
+        if cache is None:
+            return None, None
+
+        manager = self._get_connector_manager()
+        reviewer_name = getattr(manager, "reviewer", "gpt4")
+        reviewer = getattr(manager, "connectors", {}).get(reviewer_name)
+        key = review_key(
+            content,
+            content_type,
+            review_criteria,
+            type_config.get("weights", {}),
+            pass_threshold,
+            f"{reviewer_name}:{getattr(reviewer, 'model_id', '')}"
+        )
+
+        cached = cache.get(key)
+        if cached is None:
+            return key, None
+
+        review = ReviewResult(**cached)
+        review.metadata = dict(review.metadata, cached=True, tokens_used=0)
+        return key, review
+
+    def _store_review(self, cache_key: Optional[str], review: ReviewResult):
+        """Cache a successful model review."""
+        if cache_key is None or not review.success:
+            return
+        cache = self._get_cache()
+        if cache is not None:
+            cache.put(cache_key, review.to_dict())
+
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Review cache hit rate (None when the cache is disabled)."""
+        cache = self._get_cache()
+        return cache.stats() if cache is not None else None
+
+    def _get_duplicate_index(self) -> Optional[DuplicateIndex]:
+        """Lazy load the near-duplicate index (None when disabled)."""
+        dup_config = self.config.get("duplicate_check", {})
+        if not dup_config.get("enabled", False):
+            return None
+        with self._stats_lock:
+            if self._duplicate_index is None:
+                path = dup_config.get("path")
+                if path and not Path(path).is_absolute():
+                    path = Path(__file__).parent.parent / path
+                self._duplicate_index = DuplicateIndex(
+                    threshold=dup_config.get("threshold", 0.8),
+                    num_perm=dup_config.get("num_perm", 128),
+                    bands=dup_config.get("bands", 16),
+                    shingle_size=dup_config.get("shingle_size", 5),
+                    path=path
+                )
+        return self._duplicate_index
+
+    def check_duplicates(self, content_id: str, content: str) -> List[Dict[str, Any]]:
+        """
+        Pre-publish near-duplicate check against generated and stored content.
+
+        The content is not indexed here; call index_content once the page is
+        accepted, so blocked pages never become duplicate targets.
+
+        Args:
+            content_id: Identifier of the content (request ID, slug, path)
+            content: Content to check
+
+        Returns:
+            [{"id", "similarity"}] of near-duplicates (empty when disabled)
+        """
+        index = self._get_duplicate_index()
+        if index is None:
+            return []
+        matches = index.query(content, exclude=content_id)
+        self._record_stat("duplicate_checks", 1, "duplicates_flagged", 1 if matches else 0)
+        return matches
+
+    def index_content(self, content_id: str, content: str):
+        """
+        Add accepted content to the near-duplicate index, so later pages in
+        the same run (and later runs) are compared against it.
+
+        Args:
+            content_id: Identifier of the content (request ID, slug, path)
+            content: Content to index
+        """
+        index = self._get_duplicate_index()
+        if index is not None:
+            index.add(content_id, content)
+
+    def get_duplicate_stats(self) -> Optional[Dict[str, Any]]:
+        """Near-duplicate checks run and flagged (None when disabled)."""
+        index = self._get_duplicate_index()
+        if index is None:
+            return None
+        with self._stats_lock:
+            stats = dict(self.stats)
+        return {
+            "checked": stats["duplicate_checks"],
+            "flagged": stats["duplicates_flagged"],
+            "indexed_pages": len(index)
+        }
+
+    def _review_settings(
+        self,
+        content_type: str,
+        criteria: Optional[List[str]] = None,
+        threshold: Optional[int] = None
+    ):
+        """Resolve type config, criteria and pass threshold for a content type."""
         # Get type-specific config
         type_config = self.config.get("content_types", {}).get(
             content_type,
@@ -145,15 +358,34 @@ class ContentReviewer:
             "threshold",
             self.config.get("default_threshold", 70)
         )
+        return type_config, review_criteria, pass_threshold
 
-        # Get connector manager and perform review
-        manager = self._get_connector_manager()
-        raw_result = manager.review(
-            content=content,
-            criteria=review_criteria,
-            content_type=content_type
-        )
+    def _run_gate(
+        self,
+        content: str,
+        content_type: str,
+        pass_threshold: int,
+        review_criteria: List[str]
+    ) -> Optional[ReviewResult]:
+        """Run the pre-review gate; returns a failing result or None to continue."""
+        if not self.gate.enabled:
+            return None
+        gate_result = self.gate.check(content, content_type)
+        self._record_stat("gate_checks", 1, "gate_ms", gate_result["elapsed_ms"])
+        if gate_result["passed"]:
+            return None
+        self._record_stat("gate_rejections", 1)
+        return self._gate_result(gate_result, content_type, pass_threshold, review_criteria)
 
+    def _score_review(
+        self,
+        raw_result: Dict[str, Any],
+        content_type: str,
+        type_config: Dict[str, Any],
+        review_criteria: List[str],
+        pass_threshold: int
+    ) -> ReviewResult:
+        """Apply weights, critical criteria and thresholds to a raw model review."""
         if not raw_result.get("success", False):
             return ReviewResult(
                 success=False,
@@ -164,7 +396,10 @@ class ContentReviewer:
                 critical_issues=[raw_result.get("error", "Review failed")],
                 recommendation="reject",
                 passed=False,
-                metadata={"error": raw_result.get("error")}
+                metadata={
+                    "error": raw_result.get("error"),
+                    "tokens_used": raw_result.get("tokens_used", 0)
+                }
             )
 
         # Calculate weighted score
@@ -179,12 +414,15 @@ class ContentReviewer:
                 weighted_sum += score_data.get("score", 0) * weight
                 total_weight += weight
             if total_weight > 0:
-                overall_score = int(weighted_sum / total_weight)
+                # Rounded first so float summation order cannot flip the score
+                overall_score = int(round(weighted_sum / total_weight, 6))
 
         # Check critical criteria
         critical_criteria = type_config.get("critical_criteria", [])
         critical_failed = False
-        critical_issues = raw_result.get("critical_issues", [])
+        # Issues the model reported; criterion failures below are recomputed on every scoring
+        model_critical_issues = list(raw_result.get("critical_issues", []))
+        critical_issues = list(model_critical_issues)
 
         for criterion in critical_criteria:
             if criterion in raw_result.get("criteria_scores", {}):
@@ -221,10 +459,386 @@ class ContentReviewer:
             metadata={
                 "content_type": content_type,
                 "threshold": pass_threshold,
-                "criteria_used": review_criteria
+                "criteria_used": review_criteria,
+                "tokens_used": raw_result.get("tokens_used", 0),
+                "model_critical_issues": model_critical_issues
+            }
+        )
+
+    def rereview(
+        self,
+        previous_content: str,
+        previous_review: ReviewResult,
+        content: str,
+        content_type: str = "default"
+    ) -> ReviewResult:
+        """
+        Re-review a revision, scoring only the sections that changed.
+
+        Sections are heading-delimited and hashed. Unchanged sections keep
+        their previous criterion scores; changed sections are sent to the
+        model reviewer, and the document scores are recombined weighted
+        by section size. Falls back to a full review when most of the
+        document changed, the previous review has no criterion scores, or
+        it reported critical issues: those are not tied to a section, so
+        only a full review can tell whether the revision fixed them.
+
+        Args:
+            previous_content: Content the previous review was made on
+            previous_review: ReviewResult for previous_content
+            content: Revised content
+            content_type: Type of content
+
+        Returns:
+            ReviewResult for the revised content
+        """
+        type_config, review_criteria, pass_threshold = self._review_settings(content_type)
+
+        gate_review = self._run_gate(content, content_type, pass_threshold, review_criteria)
+        if gate_review is not None:
+            return gate_review
+
+        previous_scores = previous_review.criteria_scores
+        diff = diff_sections(previous_content, content)
+        max_changed_ratio = self.config.get("section_rereview", {}).get("max_changed_ratio", 0.6)
+
+        # Reviews scored before model issues were recorded separately count all as model issues
+        previous_issues = previous_review.metadata.get(
+            "model_critical_issues", previous_review.critical_issues
+        )
+
+        if (
+            not previous_review.success or
+            not previous_scores or
+            previous_issues or
+            diff.changed_ratio > max_changed_ratio
+        ):
+            self._record_stat("full_rereviews", 1)
+            return self.review(content, content_type, use_gate=False)
+
+        total_chars = sum(s.size for s in diff.unchanged) + sum(s.size for s in diff.changed)
+        changed_chars = sum(s.size for s in diff.changed)
+
+        # Score only the changed sections
+        raw_result = {"success": True, "criteria_scores": {}, "tokens_used": 0}
+        if diff.changed:
+            manager = self._get_connector_manager()
+            review_start = time.time()
+            raw_result = manager.review(
+                content="\n\n".join(s.text for s in diff.changed),
+                criteria=review_criteria,
+                content_type=f"{content_type} (revised sections only; the rest of the document is unchanged)"
+            )
+            self._record_stat("model_reviews", 1, "model_review_ms", (time.time() - review_start) * 1000)
+            if not raw_result.get("success", False):
+                return self._score_review(
+                    raw_result, content_type, type_config, review_criteria, pass_threshold
+                )
+
+        self._record_stat(
+            "section_rereviews", 1,
+            "rereview_chars_reviewed", changed_chars,
+            "rereview_chars_total", total_chars
+        )
+
+        # Per-section criterion scores; sections of a first-pass review inherit document scores
+        document_scores = {c: d.get("score", 0) for c, d in previous_scores.items()}
+        previous_section_scores = previous_review.metadata.get("section_scores") or {
+            section_hash: document_scores for section_hash in section_hashes(previous_content)
+        }
+        changed_scores = {
+            c: d.get("score", 0) for c, d in raw_result.get("criteria_scores", {}).items()
+        }
+
+        section_scores = {}
+        sizes = {}
+        for section in diff.unchanged:
+            section_scores[section.hash] = previous_section_scores.get(section.hash, document_scores)
+            sizes[section.hash] = section.size
+        for section in diff.changed:
+            section_scores[section.hash] = {
+                c: changed_scores.get(c, document_scores.get(c, 0))
+                for c in set(document_scores) | set(changed_scores)
+            }
+            sizes[section.hash] = section.size
+
+        size_total = sum(sizes.values()) or 1
+        criteria_scores = {}
+        for criterion in set(document_scores) | set(changed_scores):
+            score = sum(
+                scores.get(criterion, document_scores.get(criterion, 0)) * sizes[h]
+                for h, scores in section_scores.items()
+            ) / size_total
+            feedback_source = raw_result.get("criteria_scores", {}).get(criterion) or \
+                previous_scores.get(criterion, {})
+            criteria_scores[criterion] = {
+                "score": int(round(score)),
+                "feedback": feedback_source.get("feedback", "")
+            }
+
+        changed_share = changed_chars / size_total
+        merged_overall = int(round(
+            previous_review.overall_score * (1 - changed_share) +
+            raw_result.get("overall_score", previous_review.overall_score) * changed_share
+        ))
+
+        review = self._score_review(
+            {
+                "success": True,
+                "overall_score": merged_overall,
+                "criteria_scores": criteria_scores,
+                "strengths": raw_result.get("strengths", previous_review.strengths),
+                "improvements": raw_result.get("improvements", []),
+                "critical_issues": list(raw_result.get("critical_issues", [])),
+                "tokens_used": raw_result.get("tokens_used", 0)
+            },
+            content_type, type_config, review_criteria, pass_threshold
+        )
+        if not review.passed:
+            # Only the changed sections were reviewed; earlier advice still applies elsewhere
+            review.improvements = review.improvements + self._carried_improvements(
+                previous_review.improvements, review.improvements, previous_content, diff
+            )
+        review.metadata["section_scores"] = section_scores
+        review.metadata["rereview"] = {
+            "changed_sections": len(diff.changed),
+            "unchanged_sections": len(diff.unchanged),
+            "changed_ratio": round(changed_share, 3)
+        }
+        return review
+
+    def _carried_improvements(
+        self,
+        previous: List[str],
+        current: List[str],
+        previous_content: str,
+        diff: SectionDiff
+    ) -> List[str]:
+        """
+        Previous improvements a partial re-review has not superseded.
+
+        An improvement is superseded when the re-review repeats it, or when
+        it names the heading of a section the revision changed or removed
+        (that section was re-reviewed, so its new feedback replaces it).
+        """
+        def normalize(text: str) -> str:
+            return " ".join(text.lower().split())
+
+        revised_headings = {
+            normalize(re.sub(r'<[^>]+>|^#+', '', section.heading))
+            for section in diff.changed + [
+                s for s in split_sections(previous_content) if s.hash in diff.removed_hashes
+            ]
+        } - {""}
+        seen = {normalize(item) for item in current}
+
+        carried = []
+        for item in previous:
+            text = normalize(item)
+            if text in seen or any(heading in text for heading in revised_headings):
+                continue
+            seen.add(text)
+            carried.append(item)
+        return carried
+
+    def get_rereview_stats(self) -> Dict[str, Any]:
+        """Savings from section-diff re-reviews."""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        total = stats["rereview_chars_total"]
+        return {
+            "section_rereviews": stats["section_rereviews"],
+            "full_rereviews": stats["full_rereviews"],
+            "reviewed_chars_pct": round(
+                stats["rereview_chars_reviewed"] / total * 100, 1
+            ) if total else 0
+        }
+
+    def review_packed(
+        self,
+        items: List[Dict[str, Any]],
+        content_type: str = "default",
+        use_gate: bool = True
+    ) -> Dict[str, ReviewResult]:
+        """
+        Review several short documents of one content type in one request.
+
+        Documents the packed response does not cover (or cannot be parsed
+        for) fall back to single-document review.
+
+        Args:
+            items: List of {"id": str, "content": str}
+            content_type: Content type shared by all items
+            use_gate: Run the local pre-review gate on each item first
+
+        Returns:
+            Item ID (as str) -> ReviewResult
+        """
+        type_config, review_criteria, pass_threshold = self._review_settings(content_type)
+        results: Dict[str, ReviewResult] = {}
+        documents = []
+
+        cache_keys: Dict[str, Optional[str]] = {}
+
+        for item in items:
+            item_id = str(item["id"])
+            cache_keys[item_id], cached = self._cached_review(
+                item.get("content", ""), content_type, type_config, review_criteria, pass_threshold
+            )
+            if cached is not None:
+                results[item_id] = cached
+                continue
+            if use_gate:
+                gate_review = self._run_gate(
+                    item.get("content", ""), content_type, pass_threshold, review_criteria
+                )
+                if gate_review is not None:
+                    results[item_id] = gate_review
+                    continue
+            documents.append({"id": item_id, "content": item.get("content", "")})
+
+        if len(documents) == 1:
+            doc = documents[0]
+            results[doc["id"]] = self.review(doc["content"], content_type, use_gate=False)
+            return results
+        if not documents:
+            return results
+
+        manager = self._get_connector_manager()
+        review_start = time.time()
+        packed = manager.review_packed(documents, review_criteria, content_type)
+        self._record_stat("model_reviews", 1, "model_review_ms", (time.time() - review_start) * 1000)
+
+        parsed = packed.get("results", {}) if packed.get("success") else {}
+        tokens_per_document = packed.get("tokens_used", 0) // max(1, len(parsed))
+        self._record_stat("packed_requests", 1, "packed_documents", len(parsed))
+
+        for doc in documents:
+            raw_result = parsed.get(doc["id"])
+            if raw_result is None:
+                self._record_stat("packed_fallbacks", 1)
+                results[doc["id"]] = self.review(doc["content"], content_type, use_gate=False)
+                continue
+
+            raw_result["tokens_used"] = tokens_per_document
+            review = self._score_review(
+                raw_result, content_type, type_config, review_criteria, pass_threshold
+            )
+            review.metadata["packed"] = True
+            self._store_review(cache_keys[doc["id"]], review)
+            results[doc["id"]] = review
+
+        return results
+
+    def get_packing_stats(self) -> Dict[str, Any]:
+        """Request savings from packed reviews."""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        return {
+            "packed_requests": stats["packed_requests"],
+            "packed_documents": stats["packed_documents"],
+            "packed_fallbacks": stats["packed_fallbacks"],
+            "saved_requests": max(0, stats["packed_documents"] - stats["packed_requests"])
+        }
+
+    def _pack_items(self, items: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Group batch items into review units.
+
+        Short items of packable content types are binned greedily up to
+        the configured token budget; everything else is reviewed alone.
+        """
+        packing = self.config.get("packed_review", {})
+        if not packing.get("enabled", False):
+            return [[item] for item in items]
+
+        packable_types = set(packing.get("content_types", []))
+        max_tokens = packing.get("max_tokens", 6000)
+        max_documents = packing.get("max_documents", 8)
+        max_document_tokens = packing.get("max_document_tokens", 1500)
+
+        units = []
+        open_bins: Dict[str, List[Dict[str, Any]]] = {}
+        bin_tokens: Dict[str, int] = {}
+
+        for item in items:
+            content_type = item.get("content_type", "default")
+            tokens = len(item.get("content", "")) // 4
+            if content_type not in packable_types or tokens > max_document_tokens:
+                units.append([item])
+                continue
+
+            current = open_bins.get(content_type)
+            if current and (
+                bin_tokens[content_type] + tokens > max_tokens or
+                len(current) >= max_documents
+            ):
+                units.append(current)
+                current = None
+            if not current:
+                current = open_bins[content_type] = []
+                bin_tokens[content_type] = 0
+            current.append(item)
+            bin_tokens[content_type] += tokens
+
+        units.extend(unit for unit in open_bins.values() if unit)
+        return units
+
+    def _gate_result(
+        self,
+        gate_result: Dict[str, Any],
+        content_type: str,
+        pass_threshold: int,
+        review_criteria: List[str]
+    ) -> ReviewResult:
+        """Build a failing ReviewResult from local gate findings."""
+        return ReviewResult(
+            success=True,
+            overall_score=min(gate_result["local_score"], pass_threshold - 1),
+            criteria_scores={},
+            strengths=[],
+            improvements=gate_result["feedback"],
+            critical_issues=gate_result["failures"],
+            recommendation="revise",
+            passed=False,
+            metadata={
+                "content_type": content_type,
+                "threshold": pass_threshold,
+                "criteria_used": review_criteria,
+                "source": "pre_review_gate",
+                "tokens_used": 0
             }
         )
 
+    def _record_stat(self, *pairs):
+        """Increment stats counters: _record_stat(key, value, key, value, ...)."""
+        with self._stats_lock:
+            for key, value in zip(pairs[::2], pairs[1::2]):
+                self.stats[key] += value
+
+    def get_gate_stats(self) -> Dict[str, Any]:
+        """Saved review calls and latency impact of the pre-review gate."""
+        with self._stats_lock:
+            stats = dict(self.stats)
+
+        avg_model_ms = (
+            stats["model_review_ms"] / stats["model_reviews"]
+            if stats["model_reviews"] > 0 else 0
+        )
+        avg_gate_ms = (
+            stats["gate_ms"] / stats["gate_checks"]
+            if stats["gate_checks"] > 0 else 0
+        )
+        return {
+            "gate_checks": stats["gate_checks"],
+            "saved_review_calls": stats["gate_rejections"],
+            "model_reviews": stats["model_reviews"],
+            "avg_gate_ms": round(avg_gate_ms, 1),
+            "avg_model_review_ms": round(avg_model_ms, 1),
+            "gate_overhead_ms": round(stats["gate_ms"], 1),
+            "estimated_saved_ms": round(stats["gate_rejections"] * avg_model_ms, 1)
+        }
+
     def revise_content(
         self,
         content: str,
@@ -278,13 +892,20 @@ class ContentReviewer:
             Final content, review history, and status
         """
         max_iter = max_iterations or self.config.get("max_revision_iterations", 2)
+        controller = self.revision_controller(max_iter, content_type)
         current_content = content
+        previous_content = None
+        review = None
         history = []
         iteration = 0
 
         while iteration <= max_iter:
-            # Review current content
-            review = self.review(current_content, content_type)
+            # Review current content; revisions only re-score changed sections
+            if review is None:
+                review = self.review(current_content, content_type)
+            else:
+                review = self.rereview(previous_content, review, current_content, content_type)
+            controller.record(review)
             history.append({
                 "iteration": iteration,
                 "score": review.overall_score,
@@ -292,17 +913,31 @@ class ContentReviewer:
                 "recommendation": review.recommendation
             })
 
+            if not review.success:
+                return {
+                    "success": False,
+                    "content": current_content,
+                    "final_score": 0,
+                    "iterations": iteration,
+                    "history": history,
+                    "error": review.critical_issues[0] if review.critical_issues else "Review failed"
+                }
+
             if review.passed:
+                self.record_revision_outcome(controller)
                 return {
                     "success": True,
                     "content": current_content,
                     "final_score": review.overall_score,
                     "iterations": iteration,
                     "history": history,
-                    "review": review.to_dict()
+                    "review": review.to_dict(),
+                    "revision_control": controller.summary()
                 }
 
-            if iteration >= max_iter:
+            # Stop when the trajectory says another round will not pay off
+            decision = controller.next_step()
+            if decision.action == STOP:
                 break
 
             # Revise based on feedback
@@ -313,7 +948,8 @@ class ContentReviewer:
             revision_result = self.revise_content(
                 content=current_content,
                 feedback=feedback,
-                content_type=content_type
+                content_type=content_type,
+                model=decision.model
             )
 
             if not revision_result["success"]:
@@ -326,44 +962,250 @@ class ContentReviewer:
                     "error": revision_result["error"]
                 }
 
+            previous_content = current_content
             current_content = revision_result["content"]
             iteration += 1
 
-        # Max iterations reached without passing
+        # Max iterations reached (or stopped early) without passing
+        self.record_revision_outcome(controller)
+        error = (
+            f"Revision stopped early ({controller.stop_reason}) without passing threshold"
+            if controller.saved_iterations
+            else "Max revision iterations reached without passing threshold"
+        )
         return {
             "success": False,
             "content": current_content,
             "final_score": history[-1]["score"] if history else 0,
             "iterations": iteration,
             "history": history,
-            "error": "Max revision iterations reached without passing threshold"
+            "revision_control": controller.summary(),
+            "error": error
+        }
+
+    def revision_controller(
+        self,
+        max_revisions: int,
+        content_type: str = "default",
+        model: Optional[str] = None
+    ) -> RevisionController:
+        """
+        Create a score-trajectory controller for one item's revision loop.
+
+        Args:
+            max_revisions: Revision rounds allowed
+            content_type: Type of content (sets the pass threshold and route)
+            model: Model forced for revisions (disables escalation)
+
+        Returns:
+            RevisionController
+        """
+        _, _, pass_threshold = self._review_settings(content_type)
+
+        escalation_models = []
+        if model is None:
+            manager = self._get_connector_manager()
+            chain = manager._get_model_chain(content_type)
+            escalation_models = [
+                name for name in chain[1:]
+                if name in manager.connectors and name != getattr(manager, "reviewer", None)
+            ]
+
+        return RevisionController(
+            max_revisions,
+            pass_threshold,
+            self.config.get("revision_control", {}),
+            model=model,
+            escalation_models=escalation_models
+        )
+
+    def record_revision_outcome(self, controller: RevisionController):
+        """Add a finished revision loop to the stats."""
+        self._record_stat(
+            "revision_loops", 1,
+            "revision_rounds", controller.revisions,
+            "revision_early_stops", 1 if controller.saved_iterations else 0,
+            "revision_escalations", len(controller.escalations),
+            "revision_saved_iterations", controller.saved_iterations
+        )
+
+    def get_revision_stats(self) -> Dict[str, Any]:
+        """Revision rounds run and saved by the revision controller."""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        return {
+            "loops": stats["revision_loops"],
+            "rounds": stats["revision_rounds"],
+            "early_stops": stats["revision_early_stops"],
+            "escalations": stats["revision_escalations"],
+            "saved_iterations": stats["revision_saved_iterations"]
         }
 
     def batch_review(
         self,
-        contents: List[Dict[str, Any]]
+        contents: List[Dict[str, Any]],
+        max_workers: int = 1,
+        checkpoint_path: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Review multiple pieces of content.
 
         Args:
             contents: List of {"content": str, "content_type": str, "id": str}
+            max_workers: Concurrent reviews (bounded by the reviewer's limits)
+            checkpoint_path: JSONL file of finished results; resumes from it
 
         Returns:
-            List of review results with IDs
+            List of review results with IDs, in completion order
         """
-        results = []
-        for item in contents:
-            review = self.review(
-                content=item.get("content", ""),
-                content_type=item.get("content_type", "default")
-            )
-            results.append({
-                "id": item.get("id"),
+        return list(self.iter_batch_review(contents, max_workers, checkpoint_path))
+
+    def iter_batch_review(
+        self,
+        contents: List[Dict[str, Any]],
+        max_workers: int = 1,
+        checkpoint_path: Optional[str] = None,
+        pack: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Review multiple pieces of content, yielding results as they finish.
+
+        Reviews run on a thread pool. Submission waits on the reviewer
+        connector's rate limiter, and ConnectorManager caps in-flight
+        requests per provider. Each finished result is appended to the
+        checkpoint file so an interrupted batch can resume.
+
+        Args:
+            contents: List of {"content": str, "content_type": str, "id": str}
+            max_workers: Concurrent reviews
+            checkpoint_path: JSONL file of finished results (optional)
+            pack: Pack short items into multi-document requests (see packed_review config)
+
+        Yields:
+            {"id", "content_type", "review"} dicts in completion order
+        """
+        items = [
+            dict(item, id=item.get("id", index))
+            for index, item in enumerate(contents)
+        ]
+
+        # Resume: replay finished results, then review only what is left
+        done = {}
+        if checkpoint_path:
+            done = self._load_checkpoint(checkpoint_path)
+            if done:
+                logger.info(f"Resuming batch: {len(done)} results loaded from checkpoint")
+        for item in items:
+            if str(item["id"]) in done:
+                yield done[str(item["id"])]
+        pending = [item for item in items if str(item["id"]) not in done]
+        units = self._pack_items(pending) if pack else [[item] for item in pending]
+
+        checkpoint = open(checkpoint_path, "a", encoding="utf-8") if checkpoint_path else None
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                in_flight = {}
+                queue = iter(units)
+
+                while True:
+                    # Keep the pool full, pacing submissions by the rate limiter
+                    while len(in_flight) < max(1, max_workers):
+                        unit = next(queue, None)
+                        if unit is None:
+                            break
+                        self._wait_for_reviewer_capacity()
+                        in_flight[executor.submit(self._review_unit, unit)] = unit
+
+                    if not in_flight:
+                        break
+
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        unit = in_flight.pop(future)
+                        try:
+                            unit_results = future.result()
+                        except Exception as e:
+                            logger.error(f"Review failed for {[item['id'] for item in unit]}: {e}")
+                            unit_results = [
+                                {
+                                    "id": item["id"],
+                                    "content_type": item.get("content_type"),
+                                    "review": None,
+                                    "error": str(e)
+                                }
+                                for item in unit
+                            ]
+
+                        for result in unit_results:
+                            # Only successful reviews are checkpointed, failures are retried
+                            if checkpoint and (result.get("review") or {}).get("success"):
+                                checkpoint.write(json.dumps(result, ensure_ascii=False) + "\n")
+                                checkpoint.flush()
+                            yield result
+        finally:
+            if checkpoint:
+                checkpoint.close()
+
+    def _review_unit(self, unit: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Review a batch unit: a single item or a pack of same-type items."""
+        if len(unit) == 1:
+            return [self._review_item(unit[0])]
+
+        content_type = unit[0].get("content_type", "default")
+        reviews = self.review_packed(unit, content_type)
+        return [
+            {
+                "id": item["id"],
                 "content_type": item.get("content_type"),
-                "review": review.to_dict()
-            })
-        return results
+                "review": reviews[str(item["id"])].to_dict()
+            }
+            for item in unit
+        ]
+
+    def _review_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Review a single batch item."""
+        review = self.review(
+            content=item.get("content", ""),
+            content_type=item.get("content_type", "default")
+        )
+        return {
+            "id": item["id"],
+            "content_type": item.get("content_type"),
+            "review": review.to_dict()
+        }
+
+    def _wait_for_reviewer_capacity(self, max_wait: float = 60.0):
+        """Block until the reviewer connector's rate limiter admits a request."""
+        manager = self._get_connector_manager()
+        connector = getattr(manager, "connectors", {}).get(getattr(manager, "reviewer", "gpt4"))
+        if connector is None:
+            return
+
+        limiter = connector.rate_limiter
+        waited = 0.0
+        while not limiter.can_request() and waited < max_wait:
+            delay = min(max(limiter.wait_time(), 0.5), max_wait - waited)
+            time.sleep(delay)
+            waited += delay
+
+    def _load_checkpoint(self, checkpoint_path: str) -> Dict[str, Dict[str, Any]]:
+        """Load finished results from a JSONL checkpoint, keyed by ID."""
+        done = {}
+        try:
+            with open(checkpoint_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        result = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Partially written last line of an interrupted run
+                        continue
+                    done[str(result.get("id"))] = result
+        except FileNotFoundError:
+            pass
+        return done
 
     def get_criteria_info(self, criterion: str) -> Dict[str, Any]:
         """Get information about a review criterion."""
@@ -384,6 +1226,10 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Content quality reviewer")
     parser.add_argument("--file", "-f", help="File to review")
     parser.add_argument("--content", "-c", help="Content string to review")
+    parser.add_argument("--batch", "-b", help="JSON file of items to review (list or {\"posts\": [...]})")
+    parser.add_argument("--workers", "-w", type=int, default=4, help="Concurrent reviews for --batch")
+    parser.add_argument("--checkpoint", help="JSONL checkpoint for --batch (resumes if present)")
+    parser.add_argument("--no-pack", action="store_true", help="Review --batch items one per request")
     parser.add_argument("--type", "-t", default="default", help="Content type")
     parser.add_argument("--threshold", type=int, help="Pass threshold")
     parser.add_argument("--revise", "-r", action="store_true", help="Auto-revise if needed")
@@ -393,6 +1239,40 @@ if __name__ == "__main__":
 
     logging.basicConfig(level=logging.INFO)
 
+    reviewer = ContentReviewer()
+
+    if args.batch:
+        with open(args.batch, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        posts = data.get("posts", []) if isinstance(data, dict) else data
+        items = [
+            {
+                "id": post.get("id") or post.get("slug") or index,
+                "content": post.get("content", ""),
+                "content_type": post.get("content_type", args.type)
+            }
+            for index, post in enumerate(posts)
+        ]
+
+        results = []
+        for count, result in enumerate(reviewer.iter_batch_review(
+            items, max_workers=args.workers, checkpoint_path=args.checkpoint,
+            pack=not args.no_pack
+        ), start=1):
+            results.append(result)
+            review = result.get("review") or {}
+            print(f"[{count}/{len(items)}] {result['id']}: {review.get('overall_score', 'error')}")
+
+        print(f"\nPacking: {json.dumps(reviewer.get_packing_stats())}")
+        print(f"Pre-review gate: {json.dumps(reviewer.get_gate_stats())}")
+        print(f"Review cache: {json.dumps(reviewer.get_cache_stats())}")
+
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
+            print(f"\nResults saved to {args.output}")
+        sys.exit(0)
+
     # Get content
     if args.file:
         with open(args.file, "r", encoding="utf-8") as f:
@@ -400,11 +1280,9 @@ if __name__ == "__main__":
     elif args.content:
         content = args.content
     else:
-        print("Error: Provide --file or --content")
+        print("Error: Provide --file, --content or --batch")
         sys.exit(1)
 
-    reviewer = ContentReviewer()
-
     if args.revise:
         result = reviewer.review_and_revise(
             content=content,
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Index
+
+MinHash signatures with locality-sensitive hashing (LSH) buckets for
+spotting near-identical pages, e.g. bulk-generated company pages that only
+differ in the company name. Candidates come from shared LSH buckets, so
+checking a page never compares it against the whole corpus.
+
+Signatures use one-permutation MinHash: each word shingle is hashed once
+and lands in one of `num_perm` bins, which keeps signing linear in the
+content length without numpy.
+
+Usage:
+    python duplicate_index.py scan <directory|corpus.json> [--threshold 0.8] [--output report.json]
+    python duplicate_index.py add <directory|corpus.json> [--index .cache/duplicate-index.jsonl]
+    python duplicate_index.py check <file> [--index .cache/duplicate-index.jsonl]
+"""
+
+import re
+import sys
+import json
+import zlib
+import argparse
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterator, Tuple
+
+# Local analyzers (corpus readers) from the content-optimization skill
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "content-optimization" / "scripts"))
+# Shared JSONL store from the quality-gate skill
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "quality-gate" / "scripts"))
+from jsonl_store import JsonlStore
+
+INDEX_VERSION = 1
+
+TAG_PATTERN = re.compile(r'<[^>]+>')
+TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
+MASK64 = (1 << 64) - 1
+SHINGLE_BASE = 0x100000001B3
+EMPTY_BIN = MASK64
+
+DEFAULT_INDEX_PATH = Path(__file__).parent.parent / ".cache" / "duplicate-index.jsonl"
+
+
+def _mix64(value: int) -> int:
+    """splitmix64 finalizer: spreads rolling-hash bits over the whole word."""
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & MASK64
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & MASK64
+    return value ^ (value >> 31)
+
+
+def tokenize(content: str) -> List[str]:
+    """Lowercased word tokens with markup stripped."""
+    return TOKEN_PATTERN.findall(TAG_PATTERN.sub(' ', content).lower())
+
+
+class DuplicateIndex:
+    """
+    MinHash + LSH index of page signatures.
+
+    Pages whose estimated Jaccard similarity (over word shingles) reaches
+    `threshold` are near-duplicates. Signatures can be persisted to an
+    append-only JSONL file so stored and previously generated content is
+    checked too.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 5,
+        path: Optional[Path] = None
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            threshold: Estimated Jaccard similarity that counts as a near-duplicate
+            num_perm: Signature length (MinHash bins)
+            bands: LSH bands; num_perm / bands rows per band. More bands
+                find lower similarities at the cost of more candidates
+            shingle_size: Words per shingle
+            path: JSONL file to load signatures from and append new ones to
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.path = Path(path) if path else None
+        self.signatures: Dict[str, List[int]] = {}
+        self.buckets: List[Dict[Tuple[int, ...], List[str]]] = [{} for _ in range(bands)]
+        self._lock = threading.Lock()
+        self._token_hashes: Dict[str, int] = {}
+        self._store = JsonlStore(self.path, {
+            "version": INDEX_VERSION,
+            "num_perm": num_perm,
+            "shingle_size": shingle_size
+        }) if self.path else None
+        if self._store:
+            self._load()
+
+    # ------------------------------------------------------------------
+    #  Signatures
+    # ------------------------------------------------------------------
+
+    def _token_hash(self, token: str) -> int:
+        cached = self._token_hashes.get(token)
+        if cached is None:
+            cached = zlib.crc32(token.encode('utf-8')) + 1
+            if len(self._token_hashes) < 500000:
+                self._token_hashes[token] = cached
+        return cached
+
+    def signature(self, content: str) -> List[int]:
+        """
+        One-permutation MinHash signature of the content's word shingles.
+
+        Args:
+            content: Raw markdown, HTML or text
+
+        Returns:
+            num_perm minimum hash values (empty for content without words)
+        """
+        hashes = [self._token_hash(t) for t in tokenize(content)]
+        if not hashes:
+            return []
+        size = min(self.shingle_size, len(hashes)) or 1
+        bins = [EMPTY_BIN] * self.num_perm
+        drop = pow(SHINGLE_BASE, size - 1, 1 << 64)
+
+        rolling = 0
+        for i, value in enumerate(hashes):
+            if i >= size:
+                rolling = (rolling - hashes[i - size] * drop) & MASK64
+            rolling = (rolling * SHINGLE_BASE + value) & MASK64
+            if i >= size - 1:
+                mixed = _mix64(rolling)
+                slot = mixed % self.num_perm
+                value_in_bin = mixed // self.num_perm
+                if value_in_bin < bins[slot]:
+                    bins[slot] = value_in_bin
+
+        # Densify: empty bins borrow the next filled bin's value
+        if EMPTY_BIN in bins and any(b != EMPTY_BIN for b in bins):
+            for slot in range(self.num_perm):
+                offset = 1
+                while bins[slot] == EMPTY_BIN:
+                    source = bins[(slot + offset) % self.num_perm]
+                    if source != EMPTY_BIN:
+                        bins[slot] = _mix64(source + offset) // self.num_perm
+                    offset += 1
+        return bins
+
+    @staticmethod
+    def similarity(first: List[int], second: List[int]) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        if not first or len(first) != len(second):
+            return 0.0
+        return sum(1 for a, b in zip(first, second) if a == b) / len(first)
+
+    def _band_keys(self, signature: List[int]) -> Iterator[Tuple[int, Tuple[int, ...]]]:
+        for band in range(self.bands):
+            yield band, tuple(signature[band * self.rows:(band + 1) * self.rows])
+
+    # ------------------------------------------------------------------
+    #  Index
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def _insert(self, page_id: str, signature: List[int]):
+        if page_id in self.signatures:
+            self._remove(page_id)
+        self.signatures[page_id] = signature
+        if not signature:
+            return
+        for band, key in self._band_keys(signature):
+            self.buckets[band].setdefault(key, []).append(page_id)
+
+    def _remove(self, page_id: str):
+        signature = self.signatures.pop(page_id)
+        if not signature:
+            return
+        for band, key in self._band_keys(signature):
+            bucket = self.buckets[band].get(key, [])
+            if page_id in bucket:
+                bucket.remove(page_id)
+
+    def _candidates(self, signature: List[int]) -> List[str]:
+        seen = set()
+        for band, key in self._band_keys(signature):
+            for page_id in self.buckets[band].get(key, ()):
+                seen.add(page_id)
+        return list(seen)
+
+    def _matches(self, signature: List[int], exclude: Optional[str] = None) -> List[Dict[str, Any]]:
+        matches = []
+        if not signature:
+            return matches
+        for candidate in self._candidates(signature):
+            if candidate == exclude:
+                continue
+            score = self.similarity(signature, self.signatures[candidate])
+            if score >= self.threshold:
+                matches.append({"id": candidate, "similarity": round(score, 3)})
+        matches.sort(key=lambda m: -m["similarity"])
+        return matches
+
+    def add(self, page_id: str, content: str):
+        """Index (or re-index) a page."""
+        signature = self.signature(content)
+        with self._lock:
+            self._insert(page_id, signature)
+            self._append(page_id, signature)
+
+    def query(self, content: str, exclude: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Indexed pages similar to the content.
+
+        Args:
+            content: Content to check
+            exclude: Page ID to ignore (the content's own entry)
+
+        Returns:
+            [{"id", "similarity"}], most similar first
+        """
+        signature = self.signature(content)
+        with self._lock:
+            return self._matches(signature, exclude)
+
+    def duplicate_pairs(self) -> List[Tuple[str, str, float]]:
+        """All near-duplicate pairs, found through shared buckets only."""
+        pairs = {}
+        with self._lock:
+            for band_buckets in self.buckets:
+                for bucket in band_buckets.values():
+                    if len(bucket) < 2:
+                        continue
+                    for i, first in enumerate(bucket):
+                        for second in bucket[i + 1:]:
+                            key = (first, second) if first < second else (second, first)
+                            if key in pairs:
+                                continue
+                            pairs[key] = self.similarity(
+                                self.signatures[first], self.signatures[second]
+                            )
+        return sorted(
+            ((a, b, round(s, 3)) for (a, b), s in pairs.items() if s >= self.threshold),
+            key=lambda p: -p[2]
+        )
+
+    def clusters(self) -> List[List[str]]:
+        """Groups of pages connected by near-duplicate pairs (largest first)."""
+        parent: Dict[str, str] = {}
+
+        def find(node: str) -> str:
+            parent.setdefault(node, node)
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        for first, second, _ in self.duplicate_pairs():
+            parent[find(first)] = find(second)
+
+        groups: Dict[str, List[str]] = {}
+        for node in parent:
+            groups.setdefault(find(node), []).append(node)
+        return sorted((sorted(g) for g in groups.values()), key=lambda g: (-len(g), g[0]))
+
+    # ------------------------------------------------------------------
+    #  Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self):
+        """Load persisted signatures, discarding files built with other parameters."""
+        entries = self._store.load(lambda entry: entry["id"])
+        for page_id, entry in entries.items():
+            self._insert(page_id, entry["signature"])
+
+    def _append(self, page_id: str, signature: List[int]):
+        if self._store:
+            self._store.append({"id": page_id, "signature": signature})
+
+    def stats(self) -> Dict[str, Any]:
+        """Index size and bucket occupancy."""
+        with self._lock:
+            buckets = sum(len(b) for b in self.buckets)
+            return {
+                "pages": len(self.signatures),
+                "buckets": buckets,
+                "threshold": self.threshold
+            }
+
+
+# ============================================================================
+#  CLI
+# ============================================================================
+
+def iter_corpus(path: Path, key: str = "posts") -> Iterator[Tuple[str, str]]:
+    """(page id, content) pairs from a content directory, file, or JSON/JSONL post corpus."""
+    if path.is_file() and path.suffix.lower() in ('.json', '.jsonl', '.ndjson'):
+        from corpus_analyzer import iter_posts
+        for post in iter_posts(path, key):
+            yield str(post.get("slug") or post.get("id")), post.get("content") or ""
+        return
+
+    from content_analyzer import iter_content_files
+    files = [path] if path.is_file() else iter_content_files(path)
+    for file_path in files:
+        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+            yield str(file_path), f.read()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Near-duplicate content detection")
+    parser.add_argument("command", choices=["scan", "add", "check"],
+                        help="scan: duplicates within a corpus; add: store signatures; "
+                             "check: compare a file against stored signatures")
+    parser.add_argument("path", help="Content directory, file, or JSON/JSONL post corpus")
+    parser.add_argument("--index", default=str(DEFAULT_INDEX_PATH), help="Stored signature file")
+    parser.add_argument("--threshold", type=float, default=0.8, help="Similarity threshold (0-1)")
+    parser.add_argument("--key", default="posts", help="Top-level key holding posts in JSON corpora")
+    parser.add_argument("--output", "-o", help="Output JSON file")
+
+    args = parser.parse_args()
+
+    path = Path(args.path)
+    if not path.exists():
+        print(f"Error: Path not found: {path}")
+        sys.exit(1)
+
+    if args.command == "scan":
+        index = DuplicateIndex(threshold=args.threshold)
+        for page_id, content in iter_corpus(path, args.key):
+            index.add(page_id, content)
+        clusters = index.clusters()
+        report = {
+            "path": str(path),
+            "pages": len(index),
+            "pairs": [{"a": a, "b": b, "similarity": s} for a, b, s in index.duplicate_pairs()],
+            "clusters": clusters
+        }
+        print(f"\n{'='*60}")
+        print(f"Pages: {report['pages']}")
+        print(f"Near-duplicate pairs: {len(report['pairs'])} (threshold {args.threshold})")
+        for cluster in clusters[:20]:
+            print(f"  [{len(cluster)}] {', '.join(cluster[:4])}{' ...' if len(cluster) > 4 else ''}")
+        print(f"{'='*60}\n")
+
+    elif args.command == "add":
+        index = DuplicateIndex(threshold=args.threshold, path=Path(args.index))
+        added = 0
+        for page_id, content in iter_corpus(path, args.key):
+            index.add(page_id, content)
+            added += 1
+        report = {"added": added, "index": args.index, **index.stats()}
+        print(f"Added {added} pages to {args.index} ({len(index)} stored)")
+
+    else:
+        index = DuplicateIndex(threshold=args.threshold, path=Path(args.index))
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            matches = index.query(f.read(), exclude=str(path))
+        report = {"file": str(path), "matches": matches}
+        if matches:
+            print(f"{len(matches)} near-duplicates of {path}:")
+            for match in matches[:20]:
+                print(f"  {match['similarity']:.2f}  {match['id']}")
+        else:
+            print(f"No near-duplicates of {path} among {len(index)} stored pages")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Report saved to {args.output}")
+
+    if args.command == "check" and report["matches"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Review Cache
+
+Persistent cache of model review results. Entries are keyed by a hash
+of the content plus everything that shapes its score (content type,
+criteria, weights, threshold and reviewer model); the whole cache is
+dropped when the rubric in content-thresholds.json changes.
+"""
+
+import sys
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+# Shared JSONL store from the quality-gate skill
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "quality-gate" / "scripts"))
+from jsonl_store import JsonlStore
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+
+def rubric_version(config: Dict[str, Any]) -> str:
+    """Hash of the threshold configuration."""
+    payload = json.dumps(config, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def review_key(
+    content: str,
+    content_type: str,
+    criteria: List[str],
+    weights: Dict[str, float],
+    threshold: int,
+    reviewer: str
+) -> str:
+    """
+    Cache key for one review.
+
+    Args:
+        content: Reviewed content
+        content_type: Type of content
+        criteria: Review criteria
+        weights: Criterion weights
+        threshold: Pass threshold
+        reviewer: Reviewer connector and model ID
+
+    Returns:
+        Hex digest
+    """
+    payload = json.dumps(
+        {
+            "content": hashlib.sha256(content.encode("utf-8")).hexdigest(),
+            "content_type": content_type,
+            "criteria": list(criteria),
+            "weights": weights,
+            "threshold": threshold,
+            "reviewer": reviewer
+        },
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ReviewCache:
+    """
+    Review results kept in a JSONL file (see jsonl_store).
+
+    The header records the cache and rubric versions; each entry is
+    {"key": ..., "review": ReviewResult dict}. A version mismatch on load
+    starts a fresh file.
+    """
+
+    def __init__(self, path: Path, rubric: str):
+        """
+        Open (or create) a cache.
+
+        Args:
+            path: JSONL cache file
+            rubric: rubric_version() of the active thresholds config
+        """
+        self.path = Path(path)
+        self.rubric = rubric
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._store = JsonlStore(self.path, {"version": CACHE_VERSION, "rubric": rubric})
+        self.entries: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load entries, discarding caches built for another rubric."""
+        entries = self._store.load(lambda entry: entry["key"])
+        if self._store.discarded == "header":
+            logger.info("Review rubric changed, discarding review cache")
+        elif self._store.discarded == "corrupt":
+            logger.warning(f"Ignoring corrupt review cache {self.path}")
+        return {key: entry["review"] for key, entry in entries.items()}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached review dict."""
+        with self._lock:
+            review = self.entries.get(key)
+            if review is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return review
+
+    def put(self, key: str, review: Dict[str, Any]):
+        """Store a review dict and append it to the cache file."""
+        with self._lock:
+            self.entries[key] = review
+            self._store.append({"key": key, "review": review})
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counts for this process."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0
+            }
@@ -0,0 +1,126 @@
+"""
+Pre-Review Gate
+
+Cheap local checks that run before the paid model review.
+Content that clearly fails (no H1, too short, missing META_TITLE) is
+sent straight to revision with locally generated feedback.
+"""
+
+import re
+import sys
+import time
+import logging
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+# Local analyzers from the content-optimization skill
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "content-optimization" / "scripts"))
+
+logger = logging.getLogger(__name__)
+
+HTML_H1_PATTERN = re.compile(r'<h1[\s>]', re.IGNORECASE)
+META_TITLE_PATTERN = re.compile(r'META_TITLE:\s*\S|<title>\s*\S|^title:\s*\S', re.IGNORECASE | re.MULTILINE)
+
+
+class PreReviewGate:
+    """
+    Local heuristic gate in front of the model reviewer.
+
+    Only hard failures reject content; everything else is passed on to
+    the model reviewer so borderline content still gets a real score.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the gate.
+
+        Args:
+            config: `pre_review_gate` section of content-thresholds.json
+        """
+        self.config = config or {}
+        self.enabled = self.config.get("enabled", True)
+        self._analyzer = None
+        self._optimizer = None
+
+    def _load_analyzers(self) -> bool:
+        """Lazy load content_analyzer / content_optimizer."""
+        if self._analyzer is None:
+            try:
+                import content_analyzer
+                import content_optimizer
+                self._analyzer = content_analyzer
+                self._optimizer = content_optimizer
+            except ImportError as e:
+                logger.warning(f"Local analyzers unavailable, pre-review gate disabled: {e}")
+                self.enabled = False
+        return self.enabled
+
+    def check(self, content: str, content_type: str = "default") -> Dict[str, Any]:
+        """
+        Run local checks on content.
+
+        Args:
+            content: Content to check
+            content_type: Type of content
+
+        Returns:
+            {"passed": bool, "failures": [...], "feedback": [...],
+             "local_score": int, "word_count": int, "elapsed_ms": float}
+        """
+        start_time = time.time()
+
+        if not self.enabled or not self._load_analyzers():
+            return {"passed": True, "failures": [], "feedback": [], "local_score": 0, "elapsed_ms": 0}
+
+        analyzer = self._analyzer
+        optimizer = self._optimizer
+
+        doc = analyzer.as_document(content)
+        checks = analyzer.run_checks(doc)
+        total = sum(c["score"] for c in checks.values())
+        max_total = sum(c["max_score"] for c in checks.values())
+        local_score = round(total / max_total * 100) if max_total else 0
+
+        structure = optimizer.analyze_structure(doc)
+        word_count = optimizer.analyze_seo(doc)["word_count"]
+
+        failures = []
+
+        # Missing H1 (markdown or HTML)
+        if content_type in self.config.get("require_h1", []):
+            if not structure["has_h1"] and not HTML_H1_PATTERN.search(content):
+                failures.append("Missing H1 heading: add exactly one top-level title")
+
+        # Too short
+        min_words = self.config.get("min_words", {})
+        required_words = min_words.get(content_type, min_words.get("default", 0))
+        if word_count < required_words:
+            failures.append(
+                f"Content too short ({word_count} words, minimum {required_words})"
+            )
+
+        # Missing META_TITLE
+        if content_type in self.config.get("require_meta_title", []):
+            if not META_TITLE_PATTERN.search(content):
+                failures.append("Missing META_TITLE line (max 60 characters)")
+
+        # Very low local score
+        min_local_score = self.config.get("min_local_score", 0)
+        if local_score < min_local_score:
+            failures.append(
+                f"Local quality score too low ({local_score}% < {min_local_score}%)"
+            )
+
+        feedback = []
+        for check_name, check_result in checks.items():
+            for finding in check_result["findings"]:
+                feedback.append(f"[{check_name.upper()}] {finding}")
+
+        return {
+            "passed": not failures,
+            "failures": failures,
+            "feedback": feedback[:self.config.get("max_feedback_items", 8)],
+            "local_score": local_score,
+            "word_count": word_count,
+            "elapsed_ms": (time.time() - start_time) * 1000
+        }
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Review Store
+
+Columnar store of historic review results for corpus analytics.
+Criterion scores are kept in one float array per criterion, so a new
+content-thresholds.json (weights, thresholds, critical criteria) can be
+applied to every stored review in a single pass per content type.
+Uses numpy when installed and plain arrays otherwise.
+
+Usage:
+    python review_store.py results.jsonl --thresholds new-thresholds.json
+    python review_store.py results.json --save ./review-store
+    python review_store.py ./review-store --thresholds new.json --baseline old.json
+"""
+
+import sys
+import json
+import math
+import argparse
+from array import array
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MISSING = float("nan")
+DEFAULT_WEIGHT = 0.1
+DEFAULT_MIN_SCORE = 60
+REJECT_BELOW = 60
+# Scores are rounded to this many decimals before flooring, matching
+# ContentReviewer so summation order cannot flip a score
+SCORE_DECIMALS = 6
+
+
+class ReviewStore:
+    """
+    Array-backed review results, one column per criterion.
+
+    Missing criterion scores are NaN. Reviews without any criterion
+    scores (e.g. pre-review gate rejections) keep their stored outcome
+    when re-scored.
+    """
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.content_types: List[str] = []
+        self.overall = array("d")
+        self.passed = array("b")
+        self.columns: Dict[str, array] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, review_id: str, content_type: str, review: Dict[str, Any]):
+        """
+        Append one review.
+
+        Args:
+            review_id: Item ID
+            content_type: Type of content
+            review: ReviewResult dict
+        """
+        row = len(self.ids)
+        self.ids.append(str(review_id))
+        self.content_types.append(content_type or "default")
+        self.overall.append(float(review.get("overall_score", 0)))
+        self.passed.append(1 if review.get("passed") else 0)
+
+        scores = review.get("criteria_scores") or {}
+        for criterion in scores:
+            if criterion not in self.columns:
+                self.columns[criterion] = array("d", [MISSING] * row)
+        for criterion, column in self.columns.items():
+            data = scores.get(criterion)
+            column.append(float(data.get("score", 0)) if isinstance(data, dict) else MISSING)
+
+    def extend(self, results: Iterable[Dict[str, Any]]):
+        """
+        Append batch review results.
+
+        Accepts {"id", "content_type", "review": {...}} records (batch
+        review output and checkpoints) and bare ReviewResult dicts.
+        """
+        for index, result in enumerate(results):
+            review = result.get("review", result)
+            if not review or not review.get("success", True):
+                continue
+            content_type = (
+                result.get("content_type") or
+                review.get("metadata", {}).get("content_type") or
+                "default"
+            )
+            self.add(result.get("id", index), content_type, review)
+
+    @classmethod
+    def from_file(cls, path: Path) -> "ReviewStore":
+        """Load a saved store directory, a JSONL checkpoint or a JSON results file."""
+        path = Path(path)
+        if path.is_dir():
+            return cls.load(path)
+
+        store = cls()
+        with open(path, "r", encoding="utf-8") as f:
+            if path.suffix == ".jsonl":
+                store.extend(json.loads(line) for line in f if line.strip())
+            else:
+                data = json.load(f)
+                store.extend(data if isinstance(data, list) else data.get("results", []))
+        return store
+
+    def save(self, directory: Path):
+        """Write the store as one binary file per column plus meta.json."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / "meta.json", "w", encoding="utf-8") as f:
+            json.dump({
+                "ids": self.ids,
+                "content_types": self.content_types,
+                "criteria": list(self.columns)
+            }, f, ensure_ascii=False)
+        with open(directory / "overall.f64", "wb") as f:
+            self.overall.tofile(f)
+        with open(directory / "passed.i8", "wb") as f:
+            self.passed.tofile(f)
+        for criterion, column in self.columns.items():
+            with open(directory / f"{criterion}.f64", "wb") as f:
+                column.tofile(f)
+
+    @classmethod
+    def load(cls, directory: Path) -> "ReviewStore":
+        """Read a store written by save()."""
+        directory = Path(directory)
+        with open(directory / "meta.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        store = cls()
+        store.ids = meta["ids"]
+        store.content_types = meta["content_types"]
+        rows = len(store.ids)
+        with open(directory / "overall.f64", "rb") as f:
+            store.overall.fromfile(f, rows)
+        with open(directory / "passed.i8", "rb") as f:
+            store.passed.fromfile(f, rows)
+        for criterion in meta["criteria"]:
+            column = array("d")
+            with open(directory / f"{criterion}.f64", "rb") as f:
+                column.fromfile(f, rows)
+            store.columns[criterion] = column
+        return store
+
+    def rescore(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply a thresholds config to every stored review.
+
+        Mirrors ContentReviewer's scoring: weighted mean over the criteria
+        each review has (unlisted criteria weigh 0.1), critical criteria
+        below their min_score_for_pass fail the review.
+
+        Args:
+            config: Parsed content-thresholds.json
+
+        Returns:
+            {"overall": [...], "passed": [...], "recommendation": [...]}
+        """
+        rows = len(self.ids)
+        overall = list(self.overall)
+        passed = [bool(p) for p in self.passed]
+        recommendation = ["approve" if p else "revise" for p in passed]
+
+        for content_type, indices in self._rows_by_type().items():
+            rules = self._rules(config, content_type)
+            if np is not None:
+                scored = self._rescore_numpy(indices, rules)
+            else:
+                scored = self._rescore_python(indices, rules)
+            for row, score, critical_failed in scored:
+                overall[row] = score
+                passed[row] = score >= rules["threshold"] and not critical_failed
+                if critical_failed or score < REJECT_BELOW:
+                    recommendation[row] = "reject"
+                elif score < rules["threshold"]:
+                    recommendation[row] = "revise"
+                else:
+                    recommendation[row] = "approve"
+
+        return {
+            "overall": overall[:rows],
+            "passed": passed,
+            "recommendation": recommendation
+        }
+
+    def compare(self, config: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Pass rates under a config, and pass/fail flips against a baseline.
+
+        Args:
+            config: Candidate thresholds config
+            baseline: Thresholds config to compare with (default: stored outcomes)
+
+        Returns:
+            Per-type and overall pass rates plus flipped item IDs
+        """
+        candidate = self.rescore(config)["passed"]
+        before = self.rescore(baseline)["passed"] if baseline else [bool(p) for p in self.passed]
+
+        by_type: Dict[str, Dict[str, Any]] = {}
+        for content_type, indices in self._rows_by_type().items():
+            by_type[content_type] = {
+                "reviews": len(indices),
+                "pass_rate_before": _rate(before[i] for i in indices),
+                "pass_rate_after": _rate(candidate[i] for i in indices)
+            }
+
+        return {
+            "reviews": len(self.ids),
+            "pass_rate_before": _rate(before),
+            "pass_rate_after": _rate(candidate),
+            "by_type": by_type,
+            "newly_failing": [self.ids[i] for i in range(len(self.ids)) if before[i] and not candidate[i]],
+            "newly_passing": [self.ids[i] for i in range(len(self.ids)) if candidate[i] and not before[i]]
+        }
+
+    def _rows_by_type(self) -> Dict[str, List[int]]:
+        groups: Dict[str, List[int]] = {}
+        for row, content_type in enumerate(self.content_types):
+            groups.setdefault(content_type, []).append(row)
+        return groups
+
+    def _rules(self, config: Dict[str, Any], content_type: str) -> Dict[str, Any]:
+        """Weights, threshold and critical minimums for a content type."""
+        types = config.get("content_types", {})
+        type_config = types.get(content_type, types.get("default", {}))
+        definitions = config.get("criteria_definitions", {})
+        return {
+            "weights": type_config.get("weights", {}),
+            "threshold": type_config.get("threshold", config.get("default_threshold", 70)),
+            "critical": {
+                criterion: definitions.get(criterion, {}).get("min_score_for_pass", DEFAULT_MIN_SCORE)
+                for criterion in type_config.get("critical_criteria", [])
+            }
+        }
+
+    def _rescore_numpy(self, indices: List[int], rules: Dict[str, Any]):
+        """Score rows of one content type with numpy."""
+        criteria = list(self.columns)
+        if not criteria:
+            return []
+        rows = np.asarray(indices)
+        scores = np.column_stack([
+            np.frombuffer(self.columns[c], dtype=np.float64)[rows] for c in criteria
+        ])
+        present = ~np.isnan(scores)
+        has_scores = present.any(axis=1)
+
+        if rules["weights"]:
+            weights = np.array([rules["weights"].get(c, DEFAULT_WEIGHT) for c in criteria])
+            weight_sum = (present * weights).sum(axis=1)
+            weighted = np.where(present, scores, 0.0) @ weights
+            overall = np.where(
+                weight_sum > 0,
+                np.floor(np.round(weighted / np.where(weight_sum > 0, weight_sum, 1), SCORE_DECIMALS)),
+                np.frombuffer(self.overall, dtype=np.float64)[rows]
+            )
+        else:
+            overall = np.frombuffer(self.overall, dtype=np.float64)[rows]
+
+        critical_failed = np.zeros(len(indices), dtype=bool)
+        for criterion, min_score in rules["critical"].items():
+            if criterion in self.columns:
+                column = scores[:, criteria.index(criterion)]
+                critical_failed |= ~np.isnan(column) & (column < min_score)
+
+        return [
+            (row, float(overall[i]), bool(critical_failed[i]))
+            for i, row in enumerate(indices)
+            if has_scores[i]
+        ]
+
+    def _rescore_python(self, indices: List[int], rules: Dict[str, Any]):
+        """Score rows of one content type column by column without numpy."""
+        weighted = [0.0] * len(indices)
+        weight_sum = [0.0] * len(indices)
+        has_scores = [False] * len(indices)
+        critical_failed = [False] * len(indices)
+
+        for criterion, column in self.columns.items():
+            weight = rules["weights"].get(criterion, DEFAULT_WEIGHT)
+            min_score = rules["critical"].get(criterion)
+            for i, row in enumerate(indices):
+                score = column[row]
+                if math.isnan(score):
+                    continue
+                has_scores[i] = True
+                weighted[i] += score * weight
+                weight_sum[i] += weight
+                if min_score is not None and score < min_score:
+                    critical_failed[i] = True
+
+        scored = []
+        for i, row in enumerate(indices):
+            if not has_scores[i]:
+                continue
+            if rules["weights"] and weight_sum[i] > 0:
+                score = float(math.floor(round(weighted[i] / weight_sum[i], SCORE_DECIMALS)))
+            else:
+                score = self.overall[row]
+            scored.append((row, score, critical_failed[i]))
+        return scored
+
+
+def _rate(values: Iterable[bool]) -> float:
+    values = list(values)
+    return round(sum(values) / len(values) * 100, 1) if values else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score historic reviews with new thresholds")
+    parser.add_argument("source", help="Batch review JSON/JSONL or a saved store directory")
+    parser.add_argument("--thresholds", help="Candidate content-thresholds.json")
+    parser.add_argument("--baseline", help="Thresholds to compare against (default: stored outcomes)")
+    parser.add_argument("--save", help="Save the columnar store to this directory")
+    parser.add_argument("--output", "-o", help="Write the comparison to a JSON file")
+    args = parser.parse_args()
+
+    store = ReviewStore.from_file(Path(args.source))
+    print(f"Loaded {len(store)} reviews, {len(store.columns)} criteria "
+          f"({'numpy' if np is not None else 'array'} backend)")
+
+    if args.save:
+        store.save(Path(args.save))
+        print(f"Store saved to {args.save}")
+
+    if not args.thresholds:
+        sys.exit(0)
+
+    with open(args.thresholds, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    report = store.compare(config, baseline)
+    print(f"Pass rate: {report['pass_rate_before']}% -> {report['pass_rate_after']}%")
+    for content_type, stats in sorted(report["by_type"].items()):
+        print(f"  {content_type}: {stats['pass_rate_before']}% -> {stats['pass_rate_after']}% "
+              f"({stats['reviews']} reviews)")
+    print(f"Newly failing: {len(report['newly_failing'])}, newly passing: {len(report['newly_passing'])}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Revision Controller
+
+Decides whether another revision round is worth its generation and
+review calls, based on the score trajectory so far. Flat or falling
+scores stop the loop early or hand the content to a different model.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List
+
+# Revision decisions
+CONTINUE = "continue"    # revise again with the current model
+ESCALATE = "escalate"    # revise again with a different model
+STOP = "stop"            # stop revising
+
+
+@dataclass
+class RevisionDecision:
+    """What to do before the next revision round."""
+    action: str
+    model: Optional[str]
+    reason: str
+    expected_gain: float = 0.0
+
+
+class RevisionController:
+    """
+    Score-trajectory controller for a single item's revision loop.
+
+    Usage:
+        controller.record(review)            # initial review
+        while not review.passed:
+            decision = controller.next_step()
+            if decision.action == STOP:
+                break
+            ...revise with decision.model, re-review...
+            controller.record(review, model)
+    """
+
+    def __init__(
+        self,
+        max_revisions: int,
+        threshold: int,
+        config: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+        escalation_models: Optional[List[str]] = None
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            max_revisions: Revision rounds allowed
+            threshold: Pass threshold of the content type
+            config: `revision_control` section of content-thresholds.json
+            model: Model producing the revisions (None = routed)
+            escalation_models: Models to try when the current one plateaus
+        """
+        config = config or {}
+        self.enabled = config.get("enabled", True)
+        self.min_expected_gain = config.get("min_expected_gain", 2.0)
+        self.min_criterion_gain = config.get("min_criterion_gain", 5)
+        self.window = max(1, config.get("window", 2))
+        self.max_revisions = max_revisions
+        self.threshold = threshold
+        self.model = model
+        self.escalation_models = list(escalation_models or [])
+        self.scores: List[int] = []
+        self.criteria: List[Dict[str, int]] = []
+        self.models: List[Optional[str]] = []
+        self.escalations: List[str] = []
+        self.stop_reason: Optional[str] = None
+
+    @property
+    def revisions(self) -> int:
+        """Revision rounds recorded so far."""
+        return max(0, len(self.scores) - 1)
+
+    def record(self, review, model: Optional[str] = None):
+        """Record a review of the latest version (the first call is the initial review)."""
+        self.scores.append(review.overall_score)
+        self.criteria.append({
+            criterion: data.get("score", 0)
+            for criterion, data in (review.criteria_scores or {}).items()
+        })
+        self.models.append(model or self.model)
+
+    def criterion_deltas(self) -> Dict[str, int]:
+        """Per-criterion change from the previous review."""
+        if len(self.criteria) < 2:
+            return {}
+        previous, latest = self.criteria[-2], self.criteria[-1]
+        return {
+            criterion: latest[criterion] - previous[criterion]
+            for criterion in latest
+            if criterion in previous
+        }
+
+    def expected_gain(self) -> Optional[float]:
+        """Mean score change over the current model's recent rounds (None if unknown)."""
+        deltas = []
+        for i in range(len(self.scores) - 1, 0, -1):
+            if self.models[i] != self.model or len(deltas) >= self.window:
+                break
+            deltas.append(self.scores[i] - self.scores[i - 1])
+        if not deltas:
+            return None
+        return sum(deltas) / len(deltas)
+
+    def next_step(self) -> RevisionDecision:
+        """Decide whether to run another revision round."""
+        if self.revisions >= self.max_revisions:
+            return self._stop("max_revisions")
+
+        gain = self.expected_gain()
+        if not self.enabled or gain is None:
+            return RevisionDecision(CONTINUE, self.model, "no_trajectory")
+
+        improving_criteria = [
+            criterion for criterion, delta in self.criterion_deltas().items()
+            if delta >= self.min_criterion_gain
+        ]
+        if gain >= self.min_expected_gain or improving_criteria:
+            return RevisionDecision(CONTINUE, self.model, "improving", gain)
+
+        # Current model has plateaued: try another one before giving up
+        if self.escalation_models:
+            self.model = self.escalation_models.pop(0)
+            self.escalations.append(self.model)
+            return RevisionDecision(ESCALATE, self.model, "plateau", gain)
+
+        return self._stop("plateau", gain)
+
+    def _stop(self, reason: str, gain: float = 0.0) -> RevisionDecision:
+        self.stop_reason = reason
+        return RevisionDecision(STOP, self.model, reason, gain)
+
+    @property
+    def saved_iterations(self) -> int:
+        """Revision rounds skipped by stopping early."""
+        if self.stop_reason in (None, "max_revisions"):
+            return 0
+        return self.max_revisions - self.revisions
+
+    def summary(self) -> Dict[str, Any]:
+        """Trajectory and outcome for result metadata."""
+        return {
+            "scores": list(self.scores),
+            "criterion_deltas": self.criterion_deltas(),
+            "escalations": list(self.escalations),
+            "stop_reason": self.stop_reason,
+            "saved_iterations": self.saved_iterations
+        }
@@ -0,0 +1,92 @@
+"""
+Section Diff
+
+Splits content into heading-delimited sections and compares revisions,
+so re-reviews only need to score the sections that changed.
+"""
+
+import re
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, List
+
+# Markdown ATX headings or HTML <h1>-<h6> open a new section
+HEADING_PATTERN = re.compile(r'^(?=#{1,6}\s)|(?=<h[1-6][\s>])', re.MULTILINE | re.IGNORECASE)
+
+
+@dataclass
+class Section:
+    """A heading-delimited slice of a document."""
+    index: int
+    heading: str
+    text: str
+    hash: str
+
+    @property
+    def size(self) -> int:
+        return len(self.text)
+
+
+def _normalize(text: str) -> str:
+    """Whitespace-insensitive form used for hashing."""
+    return " ".join(text.split())
+
+
+def split_sections(content: str) -> List[Section]:
+    """
+    Split content at markdown/HTML headings.
+
+    Text before the first heading becomes a section with an empty heading.
+    """
+    starts = sorted({m.start() for m in HEADING_PATTERN.finditer(content)} | {0})
+    starts.append(len(content))
+
+    sections = []
+    for begin, end in zip(starts, starts[1:]):
+        text = content[begin:end]
+        if not text.strip():
+            continue
+        first_line = text.strip().splitlines()[0]
+        heading = first_line if re.match(r'#{1,6}\s|<h[1-6]', first_line, re.IGNORECASE) else ""
+        sections.append(Section(
+            index=len(sections),
+            heading=heading.strip(),
+            text=text,
+            hash=hashlib.sha1(_normalize(text).encode("utf-8")).hexdigest()
+        ))
+    return sections
+
+
+@dataclass
+class SectionDiff:
+    """Comparison of two revisions of a document."""
+    unchanged: List[Section]
+    changed: List[Section]
+    removed_hashes: List[str]
+
+    @property
+    def changed_ratio(self) -> float:
+        """Share of the new document's characters that changed."""
+        total = sum(s.size for s in self.unchanged) + sum(s.size for s in self.changed)
+        if total == 0:
+            return 0.0
+        return sum(s.size for s in self.changed) / total
+
+
+def diff_sections(old_content: str, new_content: str) -> SectionDiff:
+    """Classify the new document's sections as unchanged or changed."""
+    old_sections = split_sections(old_content)
+    new_sections = split_sections(new_content)
+    old_hashes = {s.hash for s in old_sections}
+    new_hashes = {s.hash for s in new_sections}
+
+    return SectionDiff(
+        unchanged=[s for s in new_sections if s.hash in old_hashes],
+        changed=[s for s in new_sections if s.hash not in old_hashes],
+        removed_hashes=[s.hash for s in old_sections if s.hash not in new_hashes]
+    )
+
+
+def section_hashes(content: str) -> Dict[str, int]:
+    """Section hash -> section size for a document."""
+    return {s.hash: s.size for s in split_sections(content)}
@@ -20,6 +20,10 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+# Shared project file index from the quality-gate skill
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "quality-gate" / "scripts"))
+from file_index import load_index
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -29,16 +33,10 @@ except:
 
 def find_html_files(project_path: Path) -> list:
     """Find all HTML/JSX/TSX files."""
-    patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
+    extensions = {'.html', '.jsx', '.tsx'}
     skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
     
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in skip_dirs):
-                files.append(f)
-    
-    return files[:50]
+    return load_index(project_path).files(extensions, skip_dirs)[:50]
 
 
 def check_accessibility(file_path: Path) -> list:
@@ -95,12 +95,20 @@ import re
 import json
 from pathlib import Path
 
+# Shared project file index from the quality-gate skill
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "quality-gate" / "scripts"))
+from file_index import load_index
+from results_store import run_auditor_incremental
+
 class UXAuditor:
+    CHECKER_VERSION = "1"
+
     def __init__(self):
         self.issues = []
         self.warnings = []
         self.passed_count = 0
         self.files_checked = 0
+        self.incremental = None
     
     def audit_file(self, filepath: str) -> None:
         try:
@@ -671,13 +679,23 @@ class UXAuditor:
         if re.search(r'<img(?![^>]*alt=)[^>]*>', content):
             self.issues.append(f"[Accessibility] {filename}: Missing img alt text")
 
-    def audit_directory(self, directory: str) -> None:
+    def audit_directory(self, directory: str, incremental: bool = False, since: str = None) -> None:
+        """
+        Audit every matching file in a project.
+
+        With `incremental` (or a git revision in `since`), only files whose
+        content changed are re-audited; the rest reuse their stored results.
+        """
         extensions = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+        skip_dirs = {'node_modules', '.git', 'dist', 'build', '.next'}
+        index = load_index(directory)
+        paths = index.files(extensions, skip_dirs)
+        if not (incremental or since):
+            for path in paths:
+                self.audit_file(str(path))
+            return
+
+        self.incremental = run_auditor_incremental(self, index, paths, "ux_audit", since)
 
     def get_report(self):
         return {
@@ -685,7 +703,8 @@ class UXAuditor:
             "issues": self.issues,
             "warnings": self.warnings,
             "passed_checks": self.passed_count,
-            "compliant": len(self.issues) == 0
+            "compliant": len(self.issues) == 0,
+            **({"incremental": self.incremental} if self.incremental else {})
         }
 
 def main():
@@ -693,10 +712,17 @@ def main():
     
     path = sys.argv[1]
     is_json = "--json" in sys.argv
+    incremental = "--incremental" in sys.argv
+    since = sys.argv[sys.argv.index("--since") + 1] if "--since" in sys.argv[:-1] else None
     
     auditor = UXAuditor()
     if os.path.isfile(path): auditor.audit_file(path)
-    else: auditor.audit_directory(path)
+    else:
+        try:
+            auditor.audit_directory(path, incremental, since)
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
     
     report = auditor.get_report()
     
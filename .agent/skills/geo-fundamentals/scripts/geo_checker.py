@@ -21,6 +21,10 @@ import re
 import json
 from pathlib import Path
 
+# Shared project file index from the quality-gate skill
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "quality-gate" / "scripts"))
+from file_index import load_index
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -80,18 +84,13 @@ def is_page_file(file_path: Path) -> bool:
 
 def find_web_pages(project_path: Path) -> list:
     """Find public-facing web pages only."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
+    extensions = {'.html', '.htm', '.jsx', '.tsx'}
     
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
+    for f in load_index(project_path).files(extensions, SKIP_DIRS):
+        # Check if it's likely a page
+        if is_page_file(f):
+            files.append(f)
     
     return files[:30]  # Limit to 30 pages
 
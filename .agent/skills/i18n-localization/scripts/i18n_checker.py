@@ -8,6 +8,10 @@ import re
 import json
 from pathlib import Path
 
+# Shared project file index from the quality-gate skill
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "quality-gate" / "scripts"))
+from file_index import load_index
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -52,20 +56,19 @@ I18N_PATTERNS = [
 
 def find_locale_files(project_path: Path) -> list:
     """Find translation/locale files."""
-    patterns = [
-        "**/locales/**/*.json",
-        "**/translations/**/*.json",
-        "**/lang/**/*.json",
-        "**/i18n/**/*.json",
-        "**/messages/*.json",
-        "**/*.po",  # gettext
-    ]
+    locale_dirs = {'locales', 'translations', 'lang', 'i18n'}
     
     files = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
+    for f in load_index(project_path).files({'.json', '.po'}):
+        if f.suffix == '.po':  # gettext
+            files.append(f)
+            continue
+        folders = f.relative_to(project_path.resolve()).parts[:-1]
+        # **/<locale dir>/**/*.json or **/messages/*.json
+        if not locale_dirs.isdisjoint(folders) or folders[-1:] == ('messages',):
+            files.append(f)
     
-    return [f for f in files if 'node_modules' not in str(f)]
+    return files
 
 def check_locale_completeness(locale_files: list) -> dict:
     """Check if all locales have the same keys."""
@@ -140,9 +143,7 @@ def check_hardcoded_strings(project_path: Path) -> dict:
         '.py': 'python'
     }
     
-    code_files = []
-    for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
+    code_files = load_index(project_path).files(extensions)
     
     code_files = [f for f in code_files if not any(x in str(f) for x in 
                   ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
@@ -3,6 +3,7 @@
 Script: local_seo_checker.py
 Purpose: Audit local SEO elements on a website
 Usage: python local_seo_checker.py <project_path> [--output report.json]
+       python local_seo_checker.py --sites-dir /root/generated_sites [--workers 4] [--output report.json]
 """
 
 import os
@@ -10,9 +11,15 @@ import sys
 import re
 import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Any
 
+# Shared project file index from the quality-gate skill
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "quality-gate" / "scripts"))
+from file_index import load_index
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -118,75 +125,150 @@ def check_contact_page(project_path: Path) -> Dict[str, Any]:
 
     contact_patterns = ['contact', 'iletisim', 'iletişim', 'bize-ulasin', 'bize-ulaşın']
 
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+    for filepath in load_index(project_path).files(PAGE_EXTENSIONS, SKIP_DIRS):
+        file_lower = filepath.name.lower()
+        if any(pattern in file_lower for pattern in contact_patterns):
+            results["has_contact_page"] = True
+            results["contact_files"].append(str(filepath))
 
-        for file in files:
-            if Path(file).suffix not in PAGE_EXTENSIONS:
-                continue
+    return results
 
-            file_lower = file.lower()
-            if any(pattern in file_lower for pattern in contact_patterns):
-                results["has_contact_page"] = True
-                results["contact_files"].append(str(Path(root) / file))
 
-    return results
+@dataclass
+class PageFacts:
+    """Local SEO facts extracted from one page."""
+    phones: List[str] = field(default_factory=list)
+    addresses: List[str] = field(default_factory=list)
+    schema_types: List[str] = field(default_factory=list)
+    nap: Dict[str, List[str]] = field(default_factory=dict)
+    maps: Dict[str, bool] = field(default_factory=dict)
+
+
+def extract_page_facts(content: str) -> PageFacts:
+    """Run the phone, address, schema, NAP and map checks on one page."""
+    schema = check_schema_markup(content)
+    return PageFacts(
+        phones=find_phone_numbers(content),
+        addresses=find_addresses(content),
+        schema_types=[schema_type for schema_type, found in schema.items() if found],
+        nap={element: values for element, values in check_nap_markup(content).items() if values},
+        maps=check_google_maps(content)
+    )
+
+
+def merge_page_facts(results: Dict[str, Any], facts: PageFacts) -> None:
+    """
+    Fold one page's facts into the project results.
+
+    Phones, addresses and NAP values are kept once each, in first-seen
+    order; schema types and map embeds count if any page has them.
+    """
+    for phone in facts.phones:
+        results["phones_found"].setdefault(phone, None)
+    for address in facts.addresses:
+        results["addresses_found"].setdefault(address, None)
+    for schema_type in facts.schema_types:
+        results["schema_markup"][schema_type] = True
+    for element, values in facts.nap.items():
+        for value in values:
+            results["nap_markup"][element].setdefault(value, None)
+    for check, found in facts.maps.items():
+        results["google_maps"][check] = results["google_maps"][check] or found
 
 
 def scan_project(project_path: Path) -> Dict[str, Any]:
-    """Scan project for local SEO elements."""
+    """
+    Scan project for local SEO elements.
+
+    Each page is read once and reduced to its PageFacts; the project
+    results are merged from those, so memory and time stay linear in the
+    site size.
+    """
     results = {
-        "phones_found": [],
-        "addresses_found": [],
-        "schema_markup": {},
-        "nap_markup": {},
-        "google_maps": {},
+        "phones_found": {},
+        "addresses_found": {},
+        "schema_markup": {schema_type: False for schema_type in SCHEMA_PATTERNS},
+        "nap_markup": {element: {} for element in NAP_ELEMENTS},
+        "google_maps": {check: False for check in check_google_maps("")},
         "pages_scanned": 0,
         "issues": [],
         "recommendations": []
     }
 
-    all_content = ""
+    for filepath in load_index(project_path).files(PAGE_EXTENSIONS, SKIP_DIRS):
+        results["pages_scanned"] += 1
+        try:
+            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+        except OSError:
+            continue
+        merge_page_facts(results, extract_page_facts(content))
+
+    # Ordered sets -> lists for the report
+    results["phones_found"] = list(results["phones_found"])
+    results["addresses_found"] = list(results["addresses_found"])
+    results["nap_markup"] = {element: list(values) for element, values in results["nap_markup"].items()}
+    results["contact_page"] = check_contact_page(project_path)
 
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+    # Generate issues and recommendations
+    analyze_results(results)
 
-        for file in files:
-            if Path(file).suffix not in PAGE_EXTENSIONS:
-                continue
+    return results
 
-            filepath = Path(root) / file
-            results["pages_scanned"] += 1
 
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    all_content += content
+def audit_site(project_path: Path) -> Dict[str, Any]:
+    """Full local SEO audit of one project: scan, issues and score."""
+    results = scan_project(project_path)
+    results["score"] = calculate_score(results)
+    results["project"] = str(project_path)
+    return results
 
-                    # Find phones and addresses
-                    phones = find_phone_numbers(content)
-                    addresses = find_addresses(content)
 
-                    results["phones_found"].extend(phones)
-                    results["addresses_found"].extend(addresses)
+def _site_error(site: Path, error: Exception) -> Dict[str, Any]:
+    """Report entry for a site whose audit failed."""
+    return {"project": str(site), "error": str(error), "score": 0}
 
-            except Exception:
-                pass
 
-    # Deduplicate
-    results["phones_found"] = list(set(results["phones_found"]))
-    results["addresses_found"] = list(set(results["addresses_found"]))
+def find_sites(sites_dir: Path) -> List[Path]:
+    """Site folders (one per domain) under a generated sites directory."""
+    return sorted(
+        path for path in Path(sites_dir).iterdir()
+        if path.is_dir() and not path.name.startswith('.')
+    )
 
-    # Check schema and NAP in all content
-    results["schema_markup"] = check_schema_markup(all_content)
-    results["nap_markup"] = check_nap_markup(all_content)
-    results["google_maps"] = check_google_maps(all_content)
-    results["contact_page"] = check_contact_page(project_path)
 
-    # Generate issues and recommendations
-    analyze_results(results)
+def audit_sites(sites_dir: Path, workers: int = 1) -> Dict[str, Dict[str, Any]]:
+    """
+    Audit every site under a sites directory, one site per worker process.
 
-    return results
+    A site whose audit fails is reported with an "error" entry; the other
+    sites are still audited.
+
+    Args:
+        sites_dir: Directory holding one folder per domain, e.g. /root/generated_sites
+        workers: Worker processes (1 = audit in this process)
+
+    Returns:
+        {domain: audit results}, sorted by domain
+    """
+    sites = find_sites(sites_dir)
+    reports: Dict[str, Dict[str, Any]] = {}
+    if workers <= 1 or len(sites) <= 1:
+        for site in sites:
+            try:
+                reports[site.name] = audit_site(site)
+            except Exception as e:
+                reports[site.name] = _site_error(site, e)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(sites))) as executor:
+            futures = {executor.submit(audit_site, site): site for site in sites}
+            for future in as_completed(futures):
+                site = futures[future]
+                try:
+                    reports[site.name] = future.result()
+                except Exception as e:
+                    reports[site.name] = _site_error(site, e)
+    return dict(sorted(reports.items()))
 
 
 def analyze_results(results: Dict) -> None:
@@ -278,14 +360,61 @@ def calculate_score(results: Dict) -> int:
 #  MAIN
 # ============================================================================
 
+def run_sites(args: argparse.Namespace) -> None:
+    """Audit every site under --sites-dir and print one line per domain."""
+    sites_dir = Path(args.sites_dir).resolve()
+    if not sites_dir.is_dir():
+        print(f"Error: Not a directory: {sites_dir}")
+        sys.exit(1)
+
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+
+    print(f"\n{'='*60}")
+    print(f"[LOCAL SEO AUDIT - ALL SITES]")
+    print(f"{'='*60}")
+    print(f"Sites directory: {sites_dir}")
+
+    reports = audit_sites(sites_dir, workers)
+    failing = [domain for domain, report in reports.items() if report["score"] < 60]
+
+    print(f"Sites audited: {len(reports)} ({len(failing)} below 60)")
+    print(f"\n{'-'*60}")
+    for domain, report in reports.items():
+        if "error" in report:
+            print(f"  [ERROR] {domain}: {report['error']}")
+            continue
+        status = "[OK]" if report["score"] >= 60 else "[FAIL]"
+        print(f"  {status} {domain}: {report['score']}/100, "
+              f"{report['pages_scanned']} pages, {len(report['issues'])} issues")
+        if not args.summary:
+            for issue in report["issues"]:
+                print(f"      [{issue['severity'].upper()}] {issue['message']}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"sites_dir": str(sites_dir), "sites": reports}, f, indent=2, ensure_ascii=False)
+        print(f"\nReport saved to: {args.output}")
+
+    print(f"\n{'='*60}\n")
+
+    sys.exit(0 if not failing else 1)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Local SEO Audit")
     parser.add_argument("project_path", nargs="?", default=".", help="Project directory")
     parser.add_argument("--output", "-o", help="Output JSON file")
     parser.add_argument("--summary", "-s", action="store_true", help="Print summary only")
+    parser.add_argument("--sites-dir", help="Audit every site folder in this directory (e.g. /root/generated_sites)")
+    parser.add_argument("--workers", "-w", type=int, default=0,
+                        help="Worker processes for --sites-dir (0 = one per CPU)")
 
     args = parser.parse_args()
 
+    if args.sites_dir:
+        run_sites(args)
+        return
+
     project_path = Path(args.project_path).resolve()
 
     if not project_path.is_dir():
@@ -298,9 +427,7 @@ def main():
     print(f"Project: {project_path}")
 
     # Run scan
-    results = scan_project(project_path)
-    results["score"] = calculate_score(results)
-    results["project"] = str(project_path)
+    results = audit_site(project_path)
 
     # Print summary
     print(f"\nScore: {results['score']}/100")
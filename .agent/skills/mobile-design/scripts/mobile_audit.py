@@ -71,12 +71,20 @@ import re
 import json
 from pathlib import Path
 
+# Shared project file index from the quality-gate skill
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "quality-gate" / "scripts"))
+from file_index import load_index
+from results_store import run_auditor_incremental
+
 class MobileAuditor:
+    CHECKER_VERSION = "1"
+
     def __init__(self):
         self.issues = []
         self.warnings = []
         self.passed_count = 0
         self.files_checked = 0
+        self.incremental = None
 
     def audit_file(self, filepath: str) -> None:
         try:
@@ -610,13 +618,23 @@ class MobileAuditor:
             # This is more of a configuration check, not code pattern
             self.passed_count += 1  # Hermes is default in RN 0.70+
 
-    def audit_directory(self, directory: str) -> None:
+    def audit_directory(self, directory: str, incremental: bool = False, since: str = None) -> None:
+        """
+        Audit every matching file in a project.
+
+        With `incremental` (or a git revision in `since`), only files whose
+        content changed are re-audited; the rest reuse their stored results.
+        """
         extensions = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', 'build', '.idea'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+        skip_dirs = {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', '.idea'}
+        index = load_index(directory)
+        paths = index.files(extensions, skip_dirs)
+        if not (incremental or since):
+            for path in paths:
+                self.audit_file(str(path))
+            return
+
+        self.incremental = run_auditor_incremental(self, index, paths, "mobile_audit", since)
 
     def get_report(self):
         return {
@@ -624,23 +642,30 @@ class MobileAuditor:
             "issues": self.issues,
             "warnings": self.warnings,
             "passed_checks": self.passed_count,
-            "compliant": len(self.issues) == 0
+            "compliant": len(self.issues) == 0,
+            **({"incremental": self.incremental} if self.incremental else {})
         }
 
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python mobile_audit.py <directory>")
+        print("Usage: python mobile_audit.py <directory> [--json] [--incremental] [--since REV]")
         sys.exit(1)
 
     path = sys.argv[1]
     is_json = "--json" in sys.argv
+    incremental = "--incremental" in sys.argv
+    since = sys.argv[sys.argv.index("--since") + 1] if "--since" in sys.argv[:-1] else None
 
     auditor = MobileAuditor()
     if os.path.isfile(path):
         auditor.audit_file(path)
     else:
-        auditor.audit_directory(path)
+        try:
+            auditor.audit_directory(path, incremental, since)
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
 
     report = auditor.get_report()
 
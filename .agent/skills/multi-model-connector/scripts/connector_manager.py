@@ -9,7 +9,9 @@ import os
 import json
 import time
 import logging
+import threading
 from pathlib import Path
+from contextlib import contextmanager
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, field
 
@@ -20,6 +22,7 @@ from connectors import (
     GeminiConnector,
     GLMConnector,
     OpenAIConnector,
+    LocalReviewConnector,
 )
 
 logger = logging.getLogger(__name__)
@@ -79,6 +82,7 @@ class ConnectorManager:
     - Fallback chain execution
     - Metrics collection
     - Caching support
+    - Per-provider concurrency limits for parallel callers
     """
 
     def __init__(self, config_path: Optional[str] = None):
@@ -93,6 +97,9 @@ class ConnectorManager:
         self.connectors: Dict[str, BaseConnector] = {}
         self.metrics = PipelineMetrics()
         self._cache: Dict[str, ConnectorResponse] = {}
+        self._provider_slots: Dict[str, threading.BoundedSemaphore] = {}
+        # Connector that answers review requests ("local" for offline runs)
+        self.reviewer = self.config.get("reviewer", "gpt4")
 
         self._initialize_connectors()
 
@@ -135,13 +142,19 @@ class ConnectorManager:
             "claude": ClaudeConnector,
             "gemini": GeminiConnector,
             "glm": GLMConnector,
-            "gpt4": OpenAIConnector
+            "gpt4": OpenAIConnector,
+            "local": LocalReviewConnector
         }
+        # Test-only connectors are created only when configured
+        optional = {"local"}
 
         # Global CLI setting (can be overridden per model)
         global_use_cli = self.config.get("use_cli", True)
 
         for name, cls in connector_classes.items():
+            if name in optional and name not in self.config.get("models", {}):
+                continue
+
             model_config = self.config.get("models", {}).get(name, {})
             # Per-model CLI setting, defaults to global
             use_cli = model_config.get("use_cli", global_use_cli)
@@ -151,9 +164,18 @@ class ConnectorManager:
                     model_id=model_config.get("model_id"),
                     max_tokens=model_config.get("max_tokens", 4096),
                     temperature=model_config.get("temperature", 0.7),
-                    use_cli=use_cli
+                    use_cli=use_cli,
+                    **model_config.get("options", {})
                 )
                 self.connectors[name] = connector
+
+                # In-flight request cap; default keeps long calls within the RPM limit
+                max_concurrency = model_config.get(
+                    "max_concurrency",
+                    max(1, connector.rate_limiter.rpm // 10)
+                )
+                self._provider_slots[name] = threading.BoundedSemaphore(max_concurrency)
+
                 method = "CLI" if use_cli else "API"
                 logger.debug(f"Initialized {name} connector ({method} mode)")
             except Exception as e:
@@ -183,9 +205,10 @@ class ConnectorManager:
             ConnectorResponse with generated content
         """
         context = context or {}
+        use_cache = use_cache and self.config.get("cache", {}).get("enabled", False)
 
         # Check cache
-        if use_cache and self.config.get("cache", {}).get("enabled"):
+        if use_cache:
             cache_key = self._cache_key(content_type, prompt, context)
             if cache_key in self._cache:
                 logger.debug("Cache hit for content generation")
@@ -210,7 +233,8 @@ class ConnectorManager:
                 used_fallback = True
                 continue
 
-            response = connector.generate(prompt, context, **kwargs)
+            with self._provider_slot(model_name):
+                response = connector.generate(prompt, context, **kwargs)
 
             if response.success:
                 # Record metrics
@@ -257,7 +281,7 @@ class ConnectorManager:
         content_type: str = "general"
     ) -> Dict[str, Any]:
         """
-        Review content using GPT-4.
+        Review content using the reviewer model (GPT-4 by default).
 
         Args:
             content: Content to review
@@ -267,25 +291,55 @@ class ConnectorManager:
         Returns:
             Review result with scores and feedback
         """
-        if "gpt4" not in self.connectors:
+        if self.reviewer not in self.connectors:
             return {
                 "success": False,
-                "error": "GPT-4 connector not available",
+                "error": f"{self.reviewer} connector not available",
                 "score": 0,
                 "passed": False
             }
 
-        gpt4 = self.connectors["gpt4"]
+        reviewer = self.connectors[self.reviewer]
 
-        if not gpt4.is_available():
+        if not reviewer.is_available():
             return {
                 "success": False,
-                "error": "GPT-4 not available",
+                "error": f"{self.reviewer} not available",
                 "score": 0,
                 "passed": False
             }
 
-        return gpt4.review(content, criteria, content_type)
+        with self._provider_slot(self.reviewer):
+            return reviewer.review(content, criteria, content_type)
+
+    def review_packed(
+        self,
+        documents: List[Dict[str, Any]],
+        criteria: Optional[List[str]] = None,
+        content_type: str = "general"
+    ) -> Dict[str, Any]:
+        """
+        Review several short documents in one reviewer request.
+
+        Args:
+            documents: List of {"id": str, "content": str}
+            criteria: Review criteria shared by all documents
+            content_type: Type of content for context
+
+        Returns:
+            {"success": bool, "results": {id: review dict}, "tokens_used": int}
+        """
+        reviewer = self.connectors.get(self.reviewer)
+        if reviewer is None or not reviewer.is_available():
+            return {
+                "success": False,
+                "error": f"{self.reviewer} not available",
+                "results": {},
+                "tokens_used": 0
+            }
+
+        with self._provider_slot(self.reviewer):
+            return reviewer.review_packed(documents, criteria, content_type)
 
     def revise(
         self,
@@ -327,6 +381,16 @@ Provide the revised content only, maintaining the same format and structure."""
             model=model
         )
 
+    @contextmanager
+    def _provider_slot(self, model_name: str):
+        """Hold one of the provider's concurrency slots for a request."""
+        slot = self._provider_slots.get(model_name)
+        if slot is None:
+            yield
+            return
+        with slot:
+            yield
+
     def _get_model_chain(self, content_type: str) -> List[str]:
         """Get the model chain for a content type."""
         content_routes = self.config.get("content_routes", {})
@@ -355,6 +419,13 @@ Provide the revised content only, maintaining the same format and structure."""
         """Get pipeline metrics."""
         return self.metrics.summary()
 
+    def get_review_parse_stats(self) -> Optional[Dict[str, Any]]:
+        """Parse outcomes of the reviewer's responses."""
+        reviewer = self.connectors.get(self.reviewer)
+        if reviewer is None or not hasattr(reviewer, "get_parse_stats"):
+            return None
+        return reviewer.get_parse_stats()
+
     def clear_cache(self):
         """Clear the response cache."""
         self._cache.clear()
@@ -6,6 +6,7 @@ Provides unified interface for multiple AI models:
 - Gemini (Google)
 - GLM 4.7 (Zhipu)
 - GPT-4 (OpenAI)
+- Local reviewer (offline testing)
 """
 
 from .base_connector import BaseConnector, ConnectorResponse, ModelInfo
@@ -13,6 +14,7 @@ from .claude_connector import ClaudeConnector
 from .gemini_connector import GeminiConnector
 from .glm_connector import GLMConnector
 from .openai_connector import OpenAIConnector
+from .local_connector import LocalReviewConnector
 
 __all__ = [
     "BaseConnector",
@@ -22,4 +24,5 @@ __all__ = [
     "GeminiConnector",
     "GLMConnector",
     "OpenAIConnector",
+    "LocalReviewConnector",
 ]
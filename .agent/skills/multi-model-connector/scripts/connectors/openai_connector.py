@@ -9,13 +9,27 @@ import os
 import time
 import json
 import logging
+import threading
 import subprocess
 from typing import Optional, Dict, Any, List
 
 from .base_connector import BaseConnector, ConnectorResponse, ModelInfo
+from .json_extract import extract_json
 
 logger = logging.getLogger(__name__)
 
+CRITERIA_DESCRIPTIONS = {
+    "accuracy": "Factual correctness and claims verification",
+    "clarity": "Readability and ease of understanding",
+    "tone": "Appropriate voice and style for target audience",
+    "seo": "SEO optimization (keywords, structure, meta elements)",
+    "engagement": "Hook, flow, and reader engagement",
+    "grammar": "Grammar, spelling, and punctuation",
+    "structure": "Logical organization and heading hierarchy",
+    "cta": "Call-to-action effectiveness",
+    "eeat": "E-E-A-T signals (expertise, authority, trust)"
+}
+
 
 class OpenAIConnector(BaseConnector):
     """Connector for OpenAI GPT-4 via CLI or API."""
@@ -26,7 +40,8 @@ class OpenAIConnector(BaseConnector):
         model_id: str = "gpt-4o",
         max_tokens: int = 4096,
         temperature: float = 0.3,
-        use_cli: bool = True
+        use_cli: bool = True,
+        structured_output: bool = True
     ):
         super().__init__(
             name="gpt4",
@@ -39,7 +54,10 @@ class OpenAIConnector(BaseConnector):
         self.max_tokens = max_tokens
         self.temperature = temperature
         self.use_cli = use_cli
+        self.structured_output = structured_output
         self._cli_available = None
+        self.parse_stats = {"parsed": 0, "repaired": 0, "failed": 0}
+        self._parse_lock = threading.Lock()
 
     def _check_cli_available(self) -> bool:
         """Check if openai CLI is available."""
@@ -174,11 +192,16 @@ class OpenAIConnector(BaseConnector):
             client = self._get_client()
             messages = self._build_messages(prompt, context)
 
+            request_args = {}
+            if kwargs.get("response_format") and self.structured_output:
+                request_args["response_format"] = kwargs["response_format"]
+
             response = client.chat.completions.create(
                 model=self.model_id,
                 messages=messages,
                 max_tokens=kwargs.get("max_tokens", self.max_tokens),
                 temperature=kwargs.get("temperature", self.temperature),
+                **request_args
             )
 
             content = response.choices[0].message.content if response.choices else ""
@@ -219,7 +242,8 @@ class OpenAIConnector(BaseConnector):
         response = self.generate(
             prompt=review_prompt,
             context={"task": "review"},
-            temperature=0.2
+            temperature=0.2,
+            response_format={"type": "json_object"}
         )
 
         if not response.success:
@@ -228,10 +252,53 @@ class OpenAIConnector(BaseConnector):
                 "error": response.error,
                 "score": 0,
                 "feedback": [],
-                "passed": False
+                "passed": False,
+                "tokens_used": 0
             }
 
-        return self._parse_review_response(response.content, criteria)
+        result = self._parse_review_response(response.content, criteria)
+        result["tokens_used"] = response.tokens_used
+        return result
+
+    def review_packed(
+        self,
+        documents: List[Dict[str, Any]],
+        criteria: Optional[List[str]] = None,
+        content_type: str = "general"
+    ) -> Dict[str, Any]:
+        """
+        Review several short documents in one request.
+
+        The rubric is sent once and the model answers with a JSON array
+        holding one review object per document ID.
+
+        Args:
+            documents: List of {"id": str, "content": str}
+            criteria: Review criteria (shared by all documents)
+            content_type: Type of content for context
+
+        Returns:
+            {"success": bool, "results": {id: review dict}, "tokens_used": int}.
+            Documents missing from "results" could not be parsed and
+            should be reviewed individually.
+        """
+        criteria = criteria or ["accuracy", "clarity", "tone", "seo", "engagement"]
+        review_prompt = self._build_packed_review_prompt(documents, criteria, content_type)
+
+        response = self.generate(
+            prompt=review_prompt,
+            context={"task": "review"},
+            temperature=0.2
+        )
+
+        if not response.success:
+            return {"success": False, "error": response.error, "results": {}, "tokens_used": 0}
+
+        return {
+            "success": True,
+            "results": self._parse_packed_review_response(response.content, documents),
+            "tokens_used": response.tokens_used
+        }
 
     def _build_messages(self, prompt: str, context: Dict[str, Any]) -> list:
         """Build message list."""
@@ -261,22 +328,7 @@ class OpenAIConnector(BaseConnector):
         content_type: str
     ) -> str:
         """Build the review prompt."""
-        criteria_descriptions = {
-            "accuracy": "Factual correctness and claims verification",
-            "clarity": "Readability and ease of understanding",
-            "tone": "Appropriate voice and style for target audience",
-            "seo": "SEO optimization (keywords, structure, meta elements)",
-            "engagement": "Hook, flow, and reader engagement",
-            "grammar": "Grammar, spelling, and punctuation",
-            "structure": "Logical organization and heading hierarchy",
-            "cta": "Call-to-action effectiveness",
-            "eeat": "E-E-A-T signals (expertise, authority, trust)"
-        }
-
-        criteria_list = "\n".join([
-            f"- {c}: {criteria_descriptions.get(c, c)}"
-            for c in criteria
-        ])
+        criteria_list = self._criteria_list(criteria)
 
         return f"""Review the following {content_type} content and provide a detailed assessment.
 
@@ -305,41 +357,140 @@ Respond in this exact JSON format:
 
 Be specific and actionable in your feedback."""
 
+    def _build_packed_review_prompt(
+        self,
+        documents: List[Dict[str, Any]],
+        criteria: List[str],
+        content_type: str
+    ) -> str:
+        """Build a review prompt covering several documents."""
+        criteria_list = self._criteria_list(criteria)
+        document_blocks = "\n\n".join(
+            f'=== DOCUMENT id="{doc["id"]}" ===\n{doc["content"]}\n=== END DOCUMENT ==='
+            for doc in documents
+        )
+
+        return f"""Review each of the following {len(documents)} {content_type} documents independently and provide a detailed assessment of each.
+
+DOCUMENTS TO REVIEW:
+{document_blocks}
+
+EVALUATION CRITERIA:
+{criteria_list}
+
+Respond with a JSON array containing exactly one object per document, in this exact format:
+[
+    {{
+        "id": "<document id>",
+        "overall_score": <0-100>,
+        "criteria_scores": {{
+            "<criterion>": {{
+                "score": <0-100>,
+                "feedback": "<specific feedback>"
+            }}
+        }},
+        "strengths": ["<strength1>"],
+        "improvements": ["<specific improvement1>"],
+        "critical_issues": ["<issue if any>"],
+        "recommendation": "approve" | "revise" | "reject"
+    }}
+]
+
+Be specific and actionable in your feedback."""
+
+    def _criteria_list(self, criteria: List[str]) -> str:
+        """Format criteria with their descriptions."""
+        return "\n".join([
+            f"- {c}: {CRITERIA_DESCRIPTIONS.get(c, c)}"
+            for c in criteria
+        ])
+
+    def _parse_packed_review_response(
+        self,
+        response_text: str,
+        documents: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Split a packed review response into per-document results."""
+        expected = {str(doc["id"]) for doc in documents}
+        results = {}
+
+        items, repaired = extract_json(
+            response_text, "[", accept=lambda value: isinstance(value, list)
+        )
+        self._record_parse(items is not None, repaired)
+        if items is None:
+            logger.warning("Packed review response contains no parseable JSON array")
+            return results
+
+        for item in items:
+            if not isinstance(item, dict) or str(item.get("id")) not in expected:
+                continue
+            if not isinstance(item.get("overall_score"), (int, float)):
+                continue
+            item["success"] = True
+            item["passed"] = (
+                item.get("overall_score", 0) >= 70 and
+                item.get("recommendation") != "reject"
+            )
+            results[str(item.pop("id"))] = item
+
+        return results
+
     def _parse_review_response(
         self,
         response_text: str,
         criteria: List[str]
     ) -> Dict[str, Any]:
-        """Parse the review response JSON."""
-        try:
-            json_start = response_text.find("{")
-            json_end = response_text.rfind("}") + 1
-
-            if json_start >= 0 and json_end > json_start:
-                json_str = response_text[json_start:json_end]
-                result = json.loads(json_str)
-                result["success"] = True
-                result["passed"] = (
-                    result.get("overall_score", 0) >= 70 and
-                    result.get("recommendation") != "reject"
-                )
-                return result
-
-        except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse review JSON: {e}")
+        """
+        Parse the review response JSON.
+
+        Unparseable responses are reported as failed reviews rather than
+        a default score, so they do not trigger a revision cycle.
+        """
+        result, repaired = extract_json(
+            response_text, "{",
+            accept=lambda value: isinstance(value, dict) and
+            isinstance(value.get("overall_score"), (int, float))
+        )
+        self._record_parse(result is not None, repaired)
+
+        if result is not None:
+            result["success"] = True
+            result["passed"] = (
+                result.get("overall_score", 0) >= 70 and
+                result.get("recommendation") != "reject"
+            )
+            return result
 
+        logger.warning("Failed to parse review JSON from response")
         return {
-            "success": True,
-            "overall_score": 70,
-            "criteria_scores": {c: {"score": 70, "feedback": ""} for c in criteria},
-            "strengths": [],
-            "improvements": [response_text[:500]],
-            "critical_issues": [],
-            "recommendation": "revise",
+            "success": False,
+            "error": "Unparseable review response",
+            "parse_failed": True,
+            "score": 0,
+            "feedback": [],
             "passed": False,
-            "raw_response": response_text
+            "raw_response": response_text[:2000]
         }
 
+    def _record_parse(self, parsed: bool, repaired: bool):
+        """Count review parse outcomes."""
+        with self._parse_lock:
+            if not parsed:
+                self.parse_stats["failed"] += 1
+            else:
+                self.parse_stats["parsed"] += 1
+                if repaired:
+                    self.parse_stats["repaired"] += 1
+
+    def get_parse_stats(self) -> Dict[str, Any]:
+        """Review parse outcomes and failure rate."""
+        with self._parse_lock:
+            stats = dict(self.parse_stats)
+        total = stats["parsed"] + stats["failed"]
+        stats["failure_rate"] = round(stats["failed"] / total, 3) if total else 0
+        return stats
+
     def _estimate_tokens(self, prompt: str, response: str) -> int:
         """Estimate token count."""
         total_chars = len(prompt) + len(response)
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Script: file_index.py
+Purpose: Shared, cached manifest of project files used as the file source by the audit scripts
+Usage: python file_index.py <project_path> [--hash] [--json]
+
+The project is walked once, pruning dependency and VCS folders. Each file
+is recorded with its relative path, size, mtime, extension and (once known)
+content hash. The manifest is saved under quality-gate/.cache/file-index/.
+Every process refreshes it once, incrementally: the tree is walked and
+stat'ed, and files whose mtime and size are unchanged keep their hash.
+Within a process the refreshed index is shared, so a script that runs
+several scanners walks the tree once.
+
+Audit scripts use it as:
+
+    from file_index import load_index
+    for path in load_index(project_path).files({'.tsx', '.jsx'}, SKIP_DIRS):
+        ...
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional
+
+# Fix Windows console encoding
+try:
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+except AttributeError:
+    pass
+
+
+INDEX_VERSION = 1
+
+# Pruned during the walk: no audit script inspects files below these
+PRUNE_DIRS = {'node_modules', '.git', '__pycache__', '.venv', 'venv', '.next'}
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "file-index"
+
+HASH_BLOCK_SIZE = 1 << 20
+
+
+@dataclass
+class FileEntry:
+    """One project file."""
+    path: str  # relative, '/'-separated
+    size: int
+    mtime_ns: int
+    ext: str  # lowercased suffix
+    hash: Optional[str] = None  # sha256 of the content, filled once the file is read
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class FileIndex:
+    """
+    Manifest of the files under a project directory.
+
+    Paths are keyed relative to the project root, so skip rules only
+    look at folders inside the project and never at where it lives.
+    """
+
+    def __init__(self, root: Path, cache_dir: Optional[Path] = None):
+        """
+        Args:
+            root: Project directory
+            cache_dir: Where manifests are saved (None = not persisted)
+        """
+        self.root = Path(root).resolve()
+        self.cache_path = (
+            Path(cache_dir) / f"{_digest(str(self.root).encode('utf-8'))[:16]}.json"
+            if cache_dir is not None else None
+        )
+        self.entries: Dict[str, FileEntry] = {}
+        self.refreshed_at = 0.0
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    # ------------------------------------------------------------------
+    #  Persistence
+    # ------------------------------------------------------------------
+
+    def load(self) -> bool:
+        """Load the saved manifest; False if there is none for this index version."""
+        if self.cache_path is None:
+            return False
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return False
+        if data.get("version") != INDEX_VERSION or data.get("root") != str(self.root):
+            return False
+        self.entries = {
+            path: FileEntry(path, size, mtime_ns, ext, digest)
+            for path, size, mtime_ns, ext, digest in data["files"]
+        }
+        self.refreshed_at = data.get("refreshed_at", 0.0)
+        return True
+
+    def save(self):
+        """Atomically write the manifest (no-op if nothing changed)."""
+        if self.cache_path is None or not self.dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "version": INDEX_VERSION,
+                "root": str(self.root),
+                "refreshed_at": self.refreshed_at,
+                "files": [
+                    [e.path, e.size, e.mtime_ns, e.ext, e.hash]
+                    for e in self.entries.values()
+                ]
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, self.cache_path)
+        self.dirty = False
+
+    # ------------------------------------------------------------------
+    #  Refresh
+    # ------------------------------------------------------------------
+
+    def _walk(self) -> Iterable[os.DirEntry]:
+        """Files under the root, pruning PRUNE_DIRS, in a stable order."""
+        stack = [str(self.root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    items = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+            dirs = []
+            for item in items:
+                try:
+                    if item.is_dir(follow_symlinks=False):
+                        if item.name not in PRUNE_DIRS:
+                            dirs.append(item.path)
+                    elif item.is_file():
+                        yield item
+                except OSError:
+                    continue
+            stack.extend(reversed(dirs))
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Re-walk the project and update the manifest.
+
+        Files whose mtime and size are unchanged keep their stored hash.
+
+        Returns:
+            Counts of added, changed, removed and unchanged files
+        """
+        stats = {"added": 0, "changed": 0, "removed": 0, "unchanged": 0}
+        root_len = len(str(self.root)) + 1
+        entries: Dict[str, FileEntry] = {}
+        for item in self._walk():
+            try:
+                stat = item.stat()
+            except OSError:
+                continue
+            path = item.path[root_len:].replace(os.sep, '/')
+            previous = self.entries.get(path)
+            if previous is not None and previous.mtime_ns == stat.st_mtime_ns and previous.size == stat.st_size:
+                entries[path] = previous
+                stats["unchanged"] += 1
+                continue
+            stats["changed" if previous is not None else "added"] += 1
+            entries[path] = FileEntry(
+                path=path,
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                ext=os.path.splitext(item.name)[1].lower()
+            )
+        stats["removed"] = sum(1 for path in self.entries if path not in entries)
+        self.entries = entries
+        self.refreshed_at = time.time()
+        self.dirty = True
+        return stats
+
+    # ------------------------------------------------------------------
+    #  Queries
+    # ------------------------------------------------------------------
+
+    def files(
+        self,
+        extensions: Optional[Iterable[str]] = None,
+        skip_dirs: Iterable[str] = (),
+        names: Optional[Iterable[str]] = None
+    ) -> List[Path]:
+        """
+        Project files, in walk order (stable between runs).
+
+        Args:
+            extensions: Suffixes to include, e.g. {'.tsx', '.html'} (None = all)
+            skip_dirs: Folder names to exclude at any depth below the root
+            names: Exact file names to include regardless of extension
+
+        Returns:
+            Absolute paths
+        """
+        extensions = {e.lower() for e in extensions} if extensions is not None else None
+        skip_dirs = set(skip_dirs)
+        names = set(names or ())
+        selected = []
+        for entry in self.entries.values():
+            if extensions is not None and entry.ext not in extensions:
+                if not names or entry.path.rsplit('/', 1)[-1] not in names:
+                    continue
+            if skip_dirs and not skip_dirs.isdisjoint(entry.path.split('/')[:-1]):
+                continue
+            selected.append(self.root / entry.path)
+        return selected
+
+    def entry(self, path: Path) -> Optional[FileEntry]:
+        """Manifest entry for an absolute or root-relative path."""
+        path = Path(path)
+        if path.is_absolute():
+            try:
+                path = path.relative_to(self.root)
+            except ValueError:
+                return None
+        return self.entries.get(path.as_posix())
+
+    def read_bytes(self, path: Path) -> bytes:
+        """Read a file, recording its content hash (and current size/mtime) in the manifest."""
+        path = Path(path)
+        with open(path, 'rb') as f:
+            data = f.read()
+            stat = os.fstat(f.fileno())
+        entry = self.entry(path)
+        if entry is not None:
+            digest = _digest(data)
+            if (entry.hash, entry.size, entry.mtime_ns) != (digest, stat.st_size, stat.st_mtime_ns):
+                entry.hash, entry.size, entry.mtime_ns = digest, stat.st_size, stat.st_mtime_ns
+                self.dirty = True
+        return data
+
+    def read_text(self, path: Path) -> str:
+        """read_bytes() decoded as UTF-8, ignoring undecodable bytes."""
+        return self.read_bytes(path).decode('utf-8', errors='ignore')
+
+    def content_hash(self, path: Path) -> Optional[str]:
+        """sha256 of a file, from the manifest when its mtime and size still match."""
+        entry = self.entry(path)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(self.root / entry.path)
+        except OSError:
+            return None
+        if entry.hash is None or entry.mtime_ns != stat.st_mtime_ns or entry.size != stat.st_size:
+            digest = hashlib.sha256()
+            try:
+                with open(self.root / entry.path, 'rb') as f:
+                    for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                        digest.update(block)
+            except OSError:
+                return None
+            entry.hash, entry.size, entry.mtime_ns = digest.hexdigest(), stat.st_size, stat.st_mtime_ns
+            self.dirty = True
+        return entry.hash
+
+    def stats(self) -> Dict[str, Any]:
+        """Manifest size and age."""
+        return {
+            "root": str(self.root),
+            "files": len(self.entries),
+            "bytes": sum(e.size for e in self.entries.values()),
+            "hashed": sum(1 for e in self.entries.values() if e.hash),
+            "age_s": round(time.time() - self.refreshed_at, 1) if self.refreshed_at else None
+        }
+
+
+_INDEXES: Dict[str, FileIndex] = {}
+
+
+def load_index(
+    project_path: Path,
+    max_age: Optional[float] = None,
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR
+) -> FileIndex:
+    """
+    Index for a project: shared within the process and saved between runs.
+
+    The first call in a process always refreshes the saved manifest, so
+    files added or changed since the last run are seen. Later calls reuse
+    the in-process index.
+
+    Args:
+        project_path: Project directory
+        max_age: Opt-in: also reuse a manifest refreshed this many seconds
+            ago without walking, even one saved by another process (files
+            added since then are missed). None = refresh once per process.
+        cache_dir: Manifest directory (None = don't persist)
+
+    Returns:
+        FileIndex
+    """
+    root = str(Path(project_path).resolve())
+    index = _INDEXES.get(root)
+    if index is None:
+        index = FileIndex(Path(root), cache_dir)
+        index.load()
+        if max_age is None or time.time() - index.refreshed_at >= max_age:
+            index.refresh()
+        _INDEXES[root] = index
+    elif max_age is not None and time.time() - index.refreshed_at >= max_age:
+        index.refresh()
+    try:
+        index.save()
+    except OSError:
+        pass  # read-only skill folder; the in-process index still works
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Project file index")
+    parser.add_argument("project_path", nargs="?", default=".", help="Project directory")
+    parser.add_argument("--hash", action="store_true", help="Hash every file that has no stored hash")
+    parser.add_argument("--json", action="store_true", help="Output JSON only")
+
+    args = parser.parse_args()
+
+    project_path = Path(args.project_path).resolve()
+    if not project_path.is_dir():
+        print(f"Error: Not a directory: {project_path}")
+        sys.exit(1)
+
+    index = FileIndex(project_path, DEFAULT_CACHE_DIR)
+    index.load()
+    changes = index.refresh()
+    if args.hash:
+        for entry in list(index.entries.values()):
+            index.content_hash(index.root / entry.path)
+    index.save()
+
+    extensions: Dict[str, int] = {}
+    for entry in index.entries.values():
+        extensions[entry.ext or "(none)"] = extensions.get(entry.ext or "(none)", 0) + 1
+    report = {
+        **index.stats(),
+        "changes": changes,
+        "extensions": dict(sorted(extensions.items(), key=lambda kv: -kv[1])[:15])
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"\n{'='*60}")
+        print(f"[FILE INDEX]")
+        print(f"{'='*60}")
+        print(f"Project: {report['root']}")
+        print(f"Files: {report['files']} ({report['bytes'] / 1e6:.1f} MB), {report['hashed']} hashed")
+        print(f"Changes: {changes['added']} added, {changes['changed']} changed, "
+              f"{changes['removed']} removed, {changes['unchanged']} unchanged")
+        print(f"\n{'-'*60}")
+        for ext, count in report["extensions"].items():
+            print(f"  {ext}: {count}")
+        print(f"{'='*60}\n")
+
+
+if __name__ == "__main__":
+    main()
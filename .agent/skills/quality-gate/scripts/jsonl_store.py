@@ -0,0 +1,96 @@
+"""
+JSONL Store
+
+Append-only JSON Lines file behind the persistent caches and indexes
+(review cache, analysis cache, near-duplicate index, audit results store).
+
+The first line is a header with the versions the entries were produced
+with; a file with a different header is discarded. Each further line is
+one entry, and later entries for the same key supersede earlier ones. A
+partially written last line (an interrupted append) is skipped, and the
+file is rewritten once superseded lines outnumber live entries by
+COMPACT_RATIO. Rewrites go through a per-process temporary file and
+os.replace, so concurrent processes never see a half-written file.
+
+Callers hold their own lock around load/append/rewrite.
+
+    store = JsonlStore(path, {"version": 1, "rubric": rubric})
+    entries = store.load(lambda entry: entry["key"])
+    store.append({"key": key, "review": review})
+"""
+
+import os
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+# Rewrite the file once superseded lines outnumber live entries by this factor
+COMPACT_RATIO = 2
+
+
+class JsonlStore:
+    """One append-only JSONL file with a header line."""
+
+    def __init__(self, path: Path, header: Dict[str, Any]):
+        """
+        Args:
+            path: JSONL file
+            header: First line; entries written under another header are discarded
+        """
+        self.path = Path(path)
+        self.header = header
+        # Why the last load() started a fresh file: "header", "corrupt" or None
+        self.discarded: Optional[str] = None
+
+    def load(self, key: Callable[[Dict[str, Any]], str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Read all live entries, resetting the file if it has another header.
+
+        Args:
+            key: Entry -> key; the last entry per key wins
+
+        Returns:
+            {key: entry} in first-written order
+        """
+        entries: Dict[str, Dict[str, Any]] = {}
+        lines = 0
+        self.discarded = None
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                if json.loads(f.readline() or "{}") != self.header:
+                    self.discarded = "header"
+                else:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                            entries[key(entry)] = entry
+                        except (json.JSONDecodeError, KeyError, TypeError):
+                            continue  # partially written last line
+                        lines += 1
+        except FileNotFoundError:
+            self.rewrite([])
+            return {}
+        except json.JSONDecodeError:
+            self.discarded = "corrupt"
+
+        if self.discarded:
+            self.rewrite([])
+            return {}
+        if lines > COMPACT_RATIO * max(1, len(entries)):
+            self.rewrite(entries.values())
+        return entries
+
+    def append(self, entry: Dict[str, Any]):
+        """Append one entry."""
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def rewrite(self, entries: Iterable[Dict[str, Any]]):
+        """Atomically replace the file with the header and the given entries."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f"{self.path.suffix}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(self.header) + "\n")
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,289 @@
+"""
+Results Store
+
+Per-file audit results kept between runs, so an audit only re-runs its
+checks on files whose content changed. Entries are keyed by the file's
+project-relative path and content hash. Each store belongs to one checker
+and is dropped as a whole when the checker version changes. Project-level
+summaries are then re-aggregated from the stored per-file results.
+
+Unchanged files are recognised by the file index: while a file's mtime and
+size match the manifest, its stored hash is trusted without reading it.
+With a git revision (`since`), files outside `git diff <rev>` reuse their
+stored result without hashing at all.
+
+    store = open_store(index, "ux_audit", CHECKER_VERSION)
+    results = run_incremental(index, paths, store, audit_one, since="origin/main")
+
+Auditors that accumulate issues/warnings on themselves (ux_audit,
+mobile_audit) use run_auditor_incremental instead.
+"""
+
+import hashlib
+import subprocess
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from file_index import FileIndex
+from jsonl_store import JsonlStore
+
+STORE_VERSION = 1
+
+DEFAULT_STORE_DIR = Path(__file__).parent.parent / ".cache" / "results"
+
+
+class ResultsStore:
+    """
+    One checker's per-file results, kept in a JSONL file (see jsonl_store).
+
+    The header records the store version, checker and checker version;
+    each entry is {"path", "hash", "result"}.
+    """
+
+    def __init__(self, path: Path, checker: str, checker_version: str):
+        """
+        Open (or create) a store.
+
+        Args:
+            path: JSONL store file
+            checker: Checker name
+            checker_version: Version of the checks that produced the results
+        """
+        self.path = Path(path)
+        self.checker = checker
+        self.checker_version = checker_version
+        self.reused = 0
+        self.rescanned = 0
+        self._lock = threading.Lock()
+        self._store = JsonlStore(
+            self.path, {"version": STORE_VERSION, "checker": checker, "checker_version": checker_version}
+        )
+        # Stores written by another checker version are discarded
+        self.entries: Dict[str, Dict[str, Any]] = self._store.load(lambda entry: entry["path"])
+
+    def get(self, path: str, content_hash: Optional[str]) -> Optional[Any]:
+        """
+        Stored result for a file.
+
+        Args:
+            path: Project-relative path
+            content_hash: Current content hash (None = accept any stored result)
+
+        Returns:
+            The result, or None if missing or stale
+        """
+        with self._lock:
+            entry = self.entries.get(path)
+            if entry is None or (content_hash is not None and entry["hash"] != content_hash):
+                return None
+            return entry["result"]
+
+    def put(self, path: str, content_hash: Optional[str], result: Any):
+        """Store a file's result and append it to the store file."""
+        entry = {"path": path, "hash": content_hash, "result": result}
+        with self._lock:
+            self.entries[path] = entry
+            self._store.append(entry)
+
+    def prune(self, live_paths: Iterable[str]):
+        """Drop entries for files that no longer exist."""
+        live = set(live_paths)
+        with self._lock:
+            stale = [path for path in self.entries if path not in live]
+            if stale:
+                for path in stale:
+                    del self.entries[path]
+                self._store.rewrite(self.entries.values())
+
+    def stats(self) -> Dict[str, Any]:
+        """Files reused and rescanned in this run."""
+        with self._lock:
+            return {
+                "checker": self.checker,
+                "entries": len(self.entries),
+                "reused": self.reused,
+                "rescanned": self.rescanned
+            }
+
+
+def open_store(
+    index: FileIndex,
+    checker: str,
+    checker_version: str,
+    store_dir: Path = DEFAULT_STORE_DIR
+) -> ResultsStore:
+    """
+    Store for one checker on one project.
+
+    Args:
+        index: The project's file index
+        checker: Checker name (one store file per checker and project)
+        checker_version: Bump when the checker's logic changes
+        store_dir: Directory for store files
+
+    Returns:
+        ResultsStore
+    """
+    project = hashlib.sha256(str(index.root).encode("utf-8")).hexdigest()[:16]
+    return ResultsStore(Path(store_dir) / f"{project}-{checker}.jsonl", checker, checker_version)
+
+
+def git_changed_files(root: Path, since: str) -> Set[str]:
+    """
+    Project-relative paths changed since a git revision, including
+    uncommitted and untracked files.
+
+    Args:
+        root: Project directory (inside a git work tree)
+        since: Revision or range start, e.g. "HEAD~5" or "origin/main"
+
+    Returns:
+        Changed paths, '/'-separated
+
+    Raises:
+        RuntimeError: If git fails (not a repository, unknown revision)
+    """
+    def git(*args: str) -> List[str]:
+        result = subprocess.run(
+            ["git", *args], cwd=root, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+        return [line for line in result.stdout.splitlines() if line]
+
+    # git prints paths relative to the work tree top; make them relative to root
+    prefix = git("rev-parse", "--show-prefix")
+    prefix = prefix[0] if prefix else ""
+    changed = git("diff", "--name-only", since, "--") + git("ls-files", "--others", "--exclude-standard", "--full-name")
+    return {path[len(prefix):] for path in changed if path.startswith(prefix)}
+
+
+def partition(
+    index: FileIndex,
+    paths: Iterable[Path],
+    store: ResultsStore,
+    since: Optional[str] = None
+) -> Tuple[Dict[Path, Any], List[Path]]:
+    """
+    Split files into those with a reusable stored result and those to check.
+
+    Args:
+        index: The project's file index
+        paths: Files to audit (absolute, under index.root)
+        store: Results store
+        since: Git revision; files it doesn't list as changed reuse their stored result
+
+    Returns:
+        ({path: stored result}, [paths to check])
+    """
+    changed = git_changed_files(index.root, since) if since else None
+    reused: Dict[Path, Any] = {}
+    pending: List[Path] = []
+    for path in paths:
+        rel_path = path.relative_to(index.root).as_posix()
+        trust_stored = changed is not None and rel_path not in changed
+        result = store.get(rel_path, None if trust_stored else index.content_hash(path))
+        if result is None:
+            pending.append(path)
+        else:
+            reused[path] = result
+    store.reused += len(reused)
+    return reused, pending
+
+
+def record(index: FileIndex, store: ResultsStore, path: Path, result: Any):
+    """Store a freshly computed result under the file's current hash."""
+    store.put(path.relative_to(index.root).as_posix(), index.content_hash(path), result)
+    store.rescanned += 1
+
+
+def finish(index: FileIndex, store: ResultsStore):
+    """Drop results for deleted files and save the index's new hashes."""
+    store.prune(path.relative_to(index.root).as_posix() for path in index.files())
+    try:
+        index.save()
+    except OSError:
+        pass
+
+
+def run_incremental(
+    index: FileIndex,
+    paths: Iterable[Path],
+    store: Optional[ResultsStore],
+    compute: Callable[[Path], Any],
+    since: Optional[str] = None
+) -> Dict[Path, Any]:
+    """
+    Per-file results, re-running `compute` only for changed files.
+
+    Args:
+        index: The project's file index
+        paths: Files to audit (absolute, under index.root)
+        store: Results store (None = compute everything)
+        compute: Audits one file and returns a JSON-serializable result
+        since: Git revision; files it doesn't list as changed reuse their stored result
+
+    Returns:
+        {path: result} in the order of `paths`
+    """
+    paths = list(paths)
+    if store is None:
+        return {path: compute(path) for path in paths}
+
+    reused, pending = partition(index, paths, store, since)
+    for path in pending:
+        result = compute(path)
+        record(index, store, path, result)
+        reused[path] = result
+    finish(index, store)
+    return {path: reused[path] for path in paths}
+
+
+def run_auditor_incremental(
+    auditor: Any,
+    index: FileIndex,
+    paths: Iterable[Path],
+    checker: str,
+    since: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Incremental run of an auditor that accumulates its findings on itself.
+
+    The auditor's audit_file(path) appends to `issues` and `warnings` and
+    bumps `files_checked` and `passed_count`. Each file's share of those is
+    stored, and the totals are rebuilt from the per-file results in file
+    order. The auditor's CHECKER_VERSION must be bumped whenever a check
+    changes, so stored results are dropped.
+
+    Args:
+        auditor: Auditor instance (UXAuditor, MobileAuditor)
+        index: The project's file index
+        paths: Files to audit (absolute, under index.root)
+        checker: Checker name for the results store
+        since: Git revision; files it doesn't list as changed reuse their stored result
+
+    Returns:
+        The store's stats (entries, reused, rescanned)
+    """
+    def audit_one(path: Path) -> Dict[str, Any]:
+        before = (auditor.files_checked, len(auditor.issues), len(auditor.warnings), auditor.passed_count)
+        auditor.audit_file(str(path))
+        return {
+            "checked": auditor.files_checked > before[0],
+            "issues": auditor.issues[before[1]:],
+            "warnings": auditor.warnings[before[2]:],
+            "passed": auditor.passed_count - before[3]
+        }
+
+    store = open_store(index, checker, auditor.CHECKER_VERSION)
+    results = run_incremental(index, paths, store, audit_one, since)
+
+    auditor.files_checked = auditor.passed_count = 0
+    auditor.issues, auditor.warnings = [], []
+    for result in results.values():
+        auditor.files_checked += result["checked"]
+        auditor.issues.extend(result["issues"])
+        auditor.warnings.extend(result["warnings"])
+        auditor.passed_count += result["passed"]
+    return store.stats()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Script: benchmark_audit.py
+Purpose: Time the technical SEO page checks as one walk per check vs one shared walk
+Usage: python benchmark_audit.py [project_path] [--pages 5000] [--workers 4] [--repeat 3] [--output bench.json]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Callable
+
+from technical_seo_audit import PAGE_CHECKS, scan_pages
+
+# Fix Windows console encoding
+try:
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+except AttributeError:
+    pass
+
+
+SECTIONS = ['hizmetler', 'blog', 'osgb', 'egitim', 'iletisim', 'sektorler']
+
+PAGE_TEMPLATE = '''import type {{ Metadata }} from "next";
+import Image from "next/image";
+import Link from "next/link";
+
+export const metadata: Metadata = {{
+  title: "{title}",
+  description: "{title} hakkında bilgi",
+  alternates: {{ canonical: "https://example.com/{section}/{slug}" }}
+}};
+
+export default function Page() {{
+  return (
+    <main>
+      <h1>{title}</h1>
+      <script type="application/ld+json">{{`{{"@type": "{schema}"}}`}}</script>
+{body}
+    </main>
+  );
+}}
+'''
+
+
+def generate_tree(root: Path, pages: int, seed: int = 42):
+    """
+    Synthetic Next.js app tree: app/<section>/<slug>/page.tsx, shared
+    components, MDX posts, and a node_modules folder the scan must skip.
+    """
+    rng = random.Random(seed)
+    for i in range(pages):
+        section = rng.choice(SECTIONS)
+        blocks = []
+        for j in range(rng.randint(5, 40)):
+            kind = rng.random()
+            if kind < 0.3:
+                blocks.append(f'      <Image src="/img/{i}-{j}.webp" alt="Görsel {j}" loading="lazy" />')
+            elif kind < 0.6:
+                href = rng.choice([f'/{section}/{j}', 'https://www.csgb.gov.tr', 'http://example.org'])
+                blocks.append(f'      <a href="{href}" rel="nofollow">Bağlantı {j}</a>')
+            else:
+                blocks.append(f'      <p>{"İş sağlığı ve güvenliği hizmetleri. " * rng.randint(3, 30)}</p>')
+        if i % 3 == 0:
+            path = root / "content" / "blog" / f"post-{i}.mdx"
+        else:
+            path = root / "src" / "app" / section / f"page-{i}" / "page.tsx"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(PAGE_TEMPLATE.format(
+            title=f"{section.title()} sayfası {i}",
+            section=section,
+            slug=f"page-{i}",
+            schema=rng.choice(['Organization', 'LocalBusiness', 'Article', 'FAQPage']),
+            body='\n'.join(blocks)
+        ), encoding='utf-8')
+
+    vendor = root / "node_modules" / "react" / "cjs"
+    vendor.mkdir(parents=True, exist_ok=True)
+    for i in range(pages // 2):
+        (vendor / f"module-{i}.jsx").write_text("export default function X() { return null; }\n")
+
+
+def time_best(func: Callable[[], Any], repeat: int) -> float:
+    """Best wall time over several runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(project_path: Path, workers: int, repeat: int) -> Dict[str, Any]:
+    """Per-check walks (the previous behaviour) vs one shared walk, serial and parallel."""
+    pages, _ = scan_pages(project_path)
+
+    per_check = time_best(
+        lambda: [scan_pages(project_path, [check]) for check in PAGE_CHECKS], repeat
+    )
+    shared = time_best(lambda: scan_pages(project_path), repeat)
+    report = {
+        "project": str(project_path),
+        "pages": pages,
+        "checks": len(PAGE_CHECKS),
+        "per_check_walks_s": round(per_check, 3),
+        "single_walk_s": round(shared, 3),
+        "speedup": round(per_check / shared, 2) if shared else 0
+    }
+    if workers > 1:
+        parallel = time_best(lambda: scan_pages(project_path, workers=workers), repeat)
+        report["workers"] = workers
+        report["single_walk_parallel_s"] = round(parallel, 3)
+        report["parallel_speedup"] = round(per_check / parallel, 2) if parallel else 0
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Technical SEO audit scan benchmark")
+    parser.add_argument("project_path", nargs="?", help="Project to scan (default: generated Next.js tree)")
+    parser.add_argument("--pages", type=int, default=5000, help="Pages in the generated tree")
+    parser.add_argument("--workers", "-w", type=int, default=0,
+                        help="Worker processes for the parallel run (0 = one per CPU)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    parser.add_argument("--output", "-o", help="Output JSON file")
+
+    args = parser.parse_args()
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+
+    tmp_dir = None
+    if args.project_path:
+        project_path = Path(args.project_path).resolve()
+        if not project_path.is_dir():
+            print(f"Error: Not a directory: {project_path}")
+            sys.exit(1)
+    else:
+        tmp_dir = tempfile.mkdtemp(prefix="seo-audit-bench-")
+        project_path = Path(tmp_dir)
+        generate_tree(project_path, args.pages)
+
+    try:
+        report = run_benchmark(project_path, workers, args.repeat)
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print(f"\n{'='*60}")
+    print(f"[TECHNICAL SEO SCAN BENCHMARK]")
+    print(f"{'='*60}")
+    print(f"Pages: {report['pages']} ({report['checks']} page checks)")
+    print(f"One walk per check: {report['per_check_walks_s']}s")
+    print(f"Single shared walk: {report['single_walk_s']}s ({report['speedup']}x)")
+    if "workers" in report:
+        print(f"Shared walk, {report['workers']} workers: "
+              f"{report['single_walk_parallel_s']}s ({report['parallel_speedup']}x)")
+    print(f"{'='*60}\n")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
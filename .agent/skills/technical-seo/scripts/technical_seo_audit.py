@@ -2,7 +2,7 @@
 """
 Script: technical_seo_audit.py
 Purpose: Comprehensive technical SEO audit
-Usage: python technical_seo_audit.py <project_path> [--output report.json]
+Usage: python technical_seo_audit.py <project_path> [--workers 4] [--incremental] [--since origin/main] [--output report.json]
 """
 
 import os
@@ -10,10 +10,17 @@ import sys
 import re
 import json
 import argparse
+from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Iterator, Optional, Tuple
 from datetime import datetime
 
+# Shared project file index from the quality-gate skill
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "quality-gate" / "scripts"))
+from file_index import load_index
+from results_store import ResultsStore, finish, open_store, partition, record
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -22,6 +29,9 @@ except AttributeError:
 
 
 SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.next', '.venv'}
+
+# Bump whenever page check logic changes, so stored page facts are dropped
+AUDIT_VERSION = "1"
 PAGE_EXTENSIONS = {'.html', '.tsx', '.jsx', '.astro', '.md', '.mdx'}
 
 
@@ -116,266 +126,373 @@ def check_sitemap(project_path: Path) -> Dict[str, Any]:
     return result
 
 
-def check_meta_tags(project_path: Path) -> Dict[str, Any]:
+# ============================================================================
+#  PAGE SCAN ENGINE
+# ============================================================================
+
+# Compiled once; every page goes through each pattern a single time
+H1_PATTERN = re.compile(r'<h1[^>]*>', re.IGNORECASE)
+IMG_PATTERN = re.compile(r'<img[^>]*>', re.IGNORECASE)
+LINK_PATTERN = re.compile(r'<a[^>]*href=["\']([^"\']+)["\'][^>]*>', re.IGNORECASE)
+NOFOLLOW_PATTERN = re.compile(r'rel=["\'][^"\']*nofollow', re.IGNORECASE)
+SCHEMA_TYPE_PATTERN = re.compile(r'"@type"\s*:\s*"([^"]+)"')
+HTTP_RESOURCE_PATTERN = re.compile(r'(?:src|href)=["\']http://[^"\']+["\']', re.IGNORECASE)
+
+# Upper bound on pages per process-pool task
+MAX_CHUNK_SIZE = 64
+
+
+class PageCheck(ABC):
+    """
+    A check that runs on every page during the shared scan.
+
+    visit() returns one page's facts. Facts from all pages are merged key
+    by key: counts are summed, flags OR-ed and lists unioned. finish()
+    then adds the issues to the merged project result. Subclasses must be
+    defined at module level so they can be sent to worker processes.
+    """
+
+    name = ""
+    defaults: Dict[str, Any] = {}
+
+    def new_result(self) -> Dict[str, Any]:
+        result = json.loads(json.dumps(self.defaults))
+        result["issues"] = []
+        return result
+
+    @abstractmethod
+    def visit(self, content: str) -> Dict[str, Any]:
+        """Facts for one page."""
+        pass
+
+    def finish(self, result: Dict[str, Any]):
+        pass
+
+
+def merge_facts(result: Dict[str, Any], facts: Dict[str, Any]):
+    """Fold one page's (or one chunk's) facts into a result."""
+    for key, value in facts.items():
+        if key not in result:
+            result[key] = list(value) if isinstance(value, list) else value
+        elif isinstance(value, bool):
+            result[key] = result[key] or value
+        elif isinstance(value, list):
+            result[key].extend(v for v in value if v not in result[key])
+        else:
+            result[key] += value
+
+
+class MetaTagsCheck(PageCheck):
     """Check meta tags across pages."""
-    result = {
+
+    name = "meta_tags"
+    defaults = {
         "pages_checked": 0,
         "pages_with_title": 0,
         "pages_with_description": 0,
         "pages_with_viewport": 0,
-        "pages_with_canonical": 0,
-        "issues": []
+        "pages_with_canonical": 0
     }
 
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+    def visit(self, content: str) -> Dict[str, Any]:
+        return {
+            "pages_checked": 1,
+            "pages_with_title": int('<title' in content or 'title:' in content or 'title=' in content),
+            "pages_with_description": int('meta' in content and 'description' in content),
+            "pages_with_viewport": int('viewport' in content),
+            "pages_with_canonical": int('canonical' in content)
+        }
 
-        for file in files:
-            if Path(file).suffix not in PAGE_EXTENSIONS:
-                continue
+    def finish(self, result: Dict[str, Any]):
+        if result["pages_checked"] > 0:
+            if result["pages_with_viewport"] < result["pages_checked"]:
+                result["issues"].append("Some pages missing viewport meta tag")
 
-            filepath = Path(root) / file
-            result["pages_checked"] += 1
 
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-
-                    if '<title' in content or 'title:' in content or 'title=' in content:
-                        result["pages_with_title"] += 1
-
-                    if 'meta' in content and 'description' in content:
-                        result["pages_with_description"] += 1
-
-                    if 'viewport' in content:
-                        result["pages_with_viewport"] += 1
-
-                    if 'canonical' in content:
-                        result["pages_with_canonical"] += 1
-
-            except Exception:
-                pass
-
-    if result["pages_checked"] > 0:
-        if result["pages_with_viewport"] < result["pages_checked"]:
-            result["issues"].append("Some pages missing viewport meta tag")
-
-    return result
-
-
-def check_headings(project_path: Path) -> Dict[str, Any]:
+class HeadingsCheck(PageCheck):
     """Check heading structure."""
-    result = {
+
+    name = "headings"
+    defaults = {
         "pages_with_h1": 0,
         "pages_with_multiple_h1": 0,
-        "pages_checked": 0,
-        "issues": []
+        "pages_checked": 0
     }
 
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-
-        for file in files:
-            if Path(file).suffix not in PAGE_EXTENSIONS:
-                continue
-
-            filepath = Path(root) / file
-            result["pages_checked"] += 1
-
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-
-                    h1_count = len(re.findall(r'<h1[^>]*>', content, re.IGNORECASE))
-                    if h1_count > 0:
-                        result["pages_with_h1"] += 1
-                    if h1_count > 1:
-                        result["pages_with_multiple_h1"] += 1
-
-            except Exception:
-                pass
+    def visit(self, content: str) -> Dict[str, Any]:
+        h1_count = len(H1_PATTERN.findall(content))
+        return {
+            "pages_with_h1": int(h1_count > 0),
+            "pages_with_multiple_h1": int(h1_count > 1),
+            "pages_checked": 1
+        }
 
-    if result["pages_with_multiple_h1"] > 0:
-        result["issues"].append(f"{result['pages_with_multiple_h1']} pages have multiple H1 tags")
-
-    return result
+    def finish(self, result: Dict[str, Any]):
+        if result["pages_with_multiple_h1"] > 0:
+            result["issues"].append(f"{result['pages_with_multiple_h1']} pages have multiple H1 tags")
 
 
-def check_images(project_path: Path) -> Dict[str, Any]:
+class ImagesCheck(PageCheck):
     """Check image optimization."""
-    result = {
+
+    name = "images"
+    defaults = {
         "total_images": 0,
         "images_with_alt": 0,
         "webp_images": 0,
-        "lazy_loading": 0,
-        "issues": []
+        "lazy_loading": 0
     }
 
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-
-        for file in files:
-            if Path(file).suffix not in PAGE_EXTENSIONS:
-                continue
-
-            filepath = Path(root) / file
-
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-
-                    # Find all img tags
-                    img_tags = re.findall(r'<img[^>]*>', content, re.IGNORECASE)
-                    result["total_images"] += len(img_tags)
-
-                    for img in img_tags:
-                        if 'alt=' in img.lower():
-                            result["images_with_alt"] += 1
-                        if 'loading="lazy"' in img.lower() or "loading='lazy'" in img.lower():
-                            result["lazy_loading"] += 1
-                        if '.webp' in img.lower():
-                            result["webp_images"] += 1
-
-            except Exception:
-                pass
-
-    if result["total_images"] > 0:
-        if result["images_with_alt"] < result["total_images"]:
-            missing = result["total_images"] - result["images_with_alt"]
-            result["issues"].append(f"{missing} images missing alt text")
-
-    return result
-
-
-def check_links(project_path: Path) -> Dict[str, Any]:
+    def visit(self, content: str) -> Dict[str, Any]:
+        facts = {"total_images": 0, "images_with_alt": 0, "webp_images": 0, "lazy_loading": 0}
+        for img in IMG_PATTERN.findall(content):
+            img = img.lower()
+            facts["total_images"] += 1
+            if 'alt=' in img:
+                facts["images_with_alt"] += 1
+            if 'loading="lazy"' in img or "loading='lazy'" in img:
+                facts["lazy_loading"] += 1
+            if '.webp' in img:
+                facts["webp_images"] += 1
+        return facts
+
+    def finish(self, result: Dict[str, Any]):
+        if result["total_images"] > 0:
+            if result["images_with_alt"] < result["total_images"]:
+                missing = result["total_images"] - result["images_with_alt"]
+                result["issues"].append(f"{missing} images missing alt text")
+
+
+class LinksCheck(PageCheck):
     """Check internal linking."""
-    result = {
+
+    name = "links"
+    defaults = {
         "total_links": 0,
         "internal_links": 0,
         "external_links": 0,
-        "links_with_nofollow": 0,
-        "issues": []
+        "links_with_nofollow": 0
     }
 
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-
-        for file in files:
-            if Path(file).suffix not in PAGE_EXTENSIONS:
-                continue
-
-            filepath = Path(root) / file
+    def visit(self, content: str) -> Dict[str, Any]:
+        links = LINK_PATTERN.findall(content)
+        external = sum(1 for link in links if link.startswith('http'))
+        return {
+            "total_links": len(links),
+            "internal_links": len(links) - external,
+            "external_links": external,
+            "links_with_nofollow": len(NOFOLLOW_PATTERN.findall(content))
+        }
 
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
 
-                    # Find all anchor tags
-                    links = re.findall(r'<a[^>]*href=["\']([^"\']+)["\'][^>]*>', content, re.IGNORECASE)
-                    result["total_links"] += len(links)
+class SchemaCheck(PageCheck):
+    """Check for structured data."""
 
-                    for link in links:
-                        if link.startswith('http'):
-                            result["external_links"] += 1
-                        else:
-                            result["internal_links"] += 1
+    name = "schema"
+    defaults = {
+        "has_json_ld": False,
+        "schema_types": []
+    }
 
-                    nofollow = len(re.findall(r'rel=["\'][^"\']*nofollow', content, re.IGNORECASE))
-                    result["links_with_nofollow"] += nofollow
+    def visit(self, content: str) -> Dict[str, Any]:
+        return {
+            "has_json_ld": 'application/ld+json' in content,
+            "schema_types": list(dict.fromkeys(SCHEMA_TYPE_PATTERN.findall(content)))
+        }
 
-            except Exception:
-                pass
+    def finish(self, result: Dict[str, Any]):
+        if not result["has_json_ld"]:
+            result["issues"].append("No JSON-LD structured data found")
 
-    return result
 
+class SecurityCheck(PageCheck):
+    """Check security-related SEO factors."""
 
-def check_schema_markup(project_path: Path) -> Dict[str, Any]:
-    """Check for structured data."""
-    result = {
-        "has_json_ld": False,
-        "schema_types": [],
-        "issues": []
+    name = "security"
+    defaults = {
+        "has_https_references": False,
+        "has_mixed_content_risk": False
     }
 
-    schema_types_found = set()
+    def visit(self, content: str) -> Dict[str, Any]:
+        return {
+            "has_https_references": 'https://' in content,
+            # http:// in resources (potential mixed content)
+            "has_mixed_content_risk": HTTP_RESOURCE_PATTERN.search(content) is not None
+        }
+
+    def finish(self, result: Dict[str, Any]):
+        if result["has_mixed_content_risk"]:
+            result["issues"].append("Potential mixed content (HTTP resources on HTTPS page)")
+
+
+# Checks run by the shared scan, in report order
+PAGE_CHECKS: List[PageCheck] = [
+    MetaTagsCheck(),
+    HeadingsCheck(),
+    ImagesCheck(),
+    LinksCheck(),
+    SchemaCheck(),
+    SecurityCheck()
+]
+
+
+def register_check(check: PageCheck):
+    """Add a page check to every subsequent audit (replacing one with the same name)."""
+    PAGE_CHECKS[:] = [c for c in PAGE_CHECKS if c.name != check.name] + [check]
+
+
+def iter_pages(project_path: Path) -> Iterator[Path]:
+    """Yield page files under the project, skipping build and dependency folders."""
+    yield from load_index(project_path).files(PAGE_EXTENSIONS, SKIP_DIRS)
+
+
+def _visit_pages(
+    paths: List[Path],
+    checks: List[PageCheck]
+) -> List[Tuple[Path, Optional[Dict[str, Dict[str, Any]]]]]:
+    """Read each page once and run every check on it; returns each page's facts per check (None if unreadable)."""
+    visited = []
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                content = f.read().decode('utf-8', errors='ignore')
+        except OSError:
+            visited.append((path, None))
+            continue
+        visited.append((path, {check.name: check.visit(content) for check in checks}))
+    return visited
+
+
+def _chunk_size(pages: int, workers: int) -> int:
+    """Several chunks per worker so large pages don't leave workers idle."""
+    return max(1, min(MAX_CHUNK_SIZE, pages // (workers * 4)))
+
+
+def checker_version(checks: List[PageCheck]) -> str:
+    """Stored page facts are only valid for the same audit version and check set."""
+    return f"{AUDIT_VERSION}:{','.join(sorted(check.name for check in checks))}"
+
+
+def scan_pages(
+    project_path: Path,
+    checks: Optional[List[PageCheck]] = None,
+    workers: int = 1,
+    store: Optional[ResultsStore] = None,
+    since: Optional[str] = None
+) -> Tuple[int, Dict[str, Dict[str, Any]]]:
+    """
+    Walk the project once and run all page checks on each page.
+
+    Args:
+        project_path: Project directory
+        checks: Page checks (default: PAGE_CHECKS)
+        workers: Worker processes (1 = scan in this process)
+        store: Per-page facts from earlier runs; only changed pages are re-checked
+        since: Git revision; with a store, pages it doesn't list as changed are not re-hashed
+
+    Returns:
+        (pages scanned, {check name: result})
+    """
+    checks = PAGE_CHECKS if checks is None else checks
+    results = {check.name: check.new_result() for check in checks}
+    index = load_index(project_path)
+    paths = index.files(PAGE_EXTENSIONS, SKIP_DIRS)
+
+    page_facts: Dict[Path, Optional[Dict[str, Dict[str, Any]]]] = {}
+    pending = paths
+    if store is not None:
+        page_facts, pending = partition(index, paths, store, since)
+
+    if workers <= 1 or len(pending) <= 1:
+        visited = _visit_pages(pending, checks)
+    else:
+        size = _chunk_size(len(pending), workers)
+        chunks = [pending[i:i + size] for i in range(0, len(pending), size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_visit_pages, chunk, checks) for chunk in chunks]
+            # Collect in submission order so merged list facts are deterministic
+            visited = [item for future in futures for item in future.result()]
+
+    for path, facts in visited:
+        page_facts[path] = facts
+        if store is not None and facts is not None:
+            record(index, store, path, facts)
+    if store is not None:
+        finish(index, store)
+
+    # Project results are always re-aggregated from the per-page facts
+    pages = 0
+    for path in paths:
+        facts = page_facts.get(path)
+        if facts is None:
+            continue
+        pages += 1
+        for check in checks:
+            merge_facts(results[check.name], facts[check.name])
+
+    for check in checks:
+        check.finish(results[check.name])
+    return pages, results
 
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
 
-        for file in files:
-            if Path(file).suffix not in PAGE_EXTENSIONS:
-                continue
+def check_meta_tags(project_path: Path) -> Dict[str, Any]:
+    """Check meta tags across pages."""
+    return scan_pages(project_path, [MetaTagsCheck()])[1]["meta_tags"]
 
-            filepath = Path(root) / file
 
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
+def check_headings(project_path: Path) -> Dict[str, Any]:
+    """Check heading structure."""
+    return scan_pages(project_path, [HeadingsCheck()])[1]["headings"]
 
-                    if 'application/ld+json' in content:
-                        result["has_json_ld"] = True
 
-                    types = re.findall(r'"@type"\s*:\s*"([^"]+)"', content)
-                    schema_types_found.update(types)
+def check_images(project_path: Path) -> Dict[str, Any]:
+    """Check image optimization."""
+    return scan_pages(project_path, [ImagesCheck()])[1]["images"]
 
-            except Exception:
-                pass
 
-    result["schema_types"] = list(schema_types_found)
+def check_links(project_path: Path) -> Dict[str, Any]:
+    """Check internal linking."""
+    return scan_pages(project_path, [LinksCheck()])[1]["links"]
 
-    if not result["has_json_ld"]:
-        result["issues"].append("No JSON-LD structured data found")
 
-    return result
+def check_schema_markup(project_path: Path) -> Dict[str, Any]:
+    """Check for structured data."""
+    return scan_pages(project_path, [SchemaCheck()])[1]["schema"]
 
 
 def check_security(project_path: Path) -> Dict[str, Any]:
     """Check security-related SEO factors."""
-    result = {
-        "has_https_references": False,
-        "has_mixed_content_risk": False,
-        "issues": []
-    }
-
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-
-        for file in files:
-            if Path(file).suffix not in PAGE_EXTENSIONS:
-                continue
-
-            filepath = Path(root) / file
-
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-
-                    if 'https://' in content:
-                        result["has_https_references"] = True
-
-                    # Check for http:// in resources (potential mixed content)
-                    http_resources = re.findall(r'(src|href)=["\']http://[^"\']+["\']', content, re.IGNORECASE)
-                    if http_resources:
-                        result["has_mixed_content_risk"] = True
-
-            except Exception:
-                pass
-
-    if result["has_mixed_content_risk"]:
-        result["issues"].append("Potential mixed content (HTTP resources on HTTPS page)")
-
-    return result
+    return scan_pages(project_path, [SecurityCheck()])[1]["security"]
 
 
 # ============================================================================
 #  MAIN
 # ============================================================================
 
-def run_audit(project_path: Path) -> Dict[str, Any]:
-    """Run full technical SEO audit."""
+def run_audit(
+    project_path: Path,
+    workers: int = 1,
+    incremental: bool = False,
+    since: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run full technical SEO audit.
+
+    Args:
+        project_path: Project directory
+        workers: Worker processes for the page scan
+        incremental: Re-check only pages changed since the last incremental run
+        since: Git revision; pages outside `git diff <since>` reuse stored facts
+            (implies incremental)
+
+    Returns:
+        Audit report
+    """
     report = {
         "project": str(project_path),
         "timestamp": datetime.now().isoformat(),
+        "pages_scanned": 0,
         "checks": {},
         "summary": {
             "total_issues": 0,
@@ -386,20 +503,21 @@ def run_audit(project_path: Path) -> Dict[str, Any]:
         "score": 100
     }
 
-    # Run all checks
-    checks = [
-        ("robots_txt", check_robots_txt),
-        ("sitemap", check_sitemap),
-        ("meta_tags", check_meta_tags),
-        ("headings", check_headings),
-        ("images", check_images),
-        ("links", check_links),
-        ("schema", check_schema_markup),
-        ("security", check_security)
-    ]
+    # Site-level files, then every page check in one walk over the project
+    store = None
+    if incremental or since:
+        store = open_store(load_index(project_path), "technical_seo_audit", checker_version(PAGE_CHECKS))
+    pages, page_results = scan_pages(project_path, workers=workers, store=store, since=since)
+    report["pages_scanned"] = pages
+    if store is not None:
+        report["incremental"] = store.stats()
+    results = {
+        "robots_txt": check_robots_txt(project_path),
+        "sitemap": check_sitemap(project_path),
+        **page_results
+    }
 
-    for name, check_func in checks:
-        result = check_func(project_path)
+    for name, result in results.items():
         report["checks"][name] = result
 
         issues = result.get("issues", [])
@@ -422,6 +540,11 @@ def main():
     parser.add_argument("project_path", nargs="?", default=".", help="Project directory")
     parser.add_argument("--output", "-o", help="Output JSON file")
     parser.add_argument("--json", action="store_true", help="Output JSON only")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                        help="Worker processes for the page scan (0 = one per CPU)")
+    parser.add_argument("--incremental", "-i", action="store_true",
+                        help="Re-check only pages whose content changed since the last incremental run")
+    parser.add_argument("--since", help="Git revision; only pages in `git diff <rev>` are re-checked")
 
     args = parser.parse_args()
 
@@ -431,7 +554,12 @@ def main():
         print(f"Error: Not a directory: {project_path}")
         sys.exit(1)
 
-    report = run_audit(project_path)
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    try:
+        report = run_audit(project_path, workers=workers, incremental=args.incremental, since=args.since)
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
     if args.json:
         print(json.dumps(report, indent=2, ensure_ascii=False))
@@ -440,6 +568,10 @@ def main():
         print(f"[TECHNICAL SEO AUDIT]")
         print(f"{'='*60}")
         print(f"Project: {project_path}")
+        print(f"Pages Scanned: {report['pages_scanned']}")
+        if "incremental" in report:
+            print(f"Incremental: {report['incremental']['rescanned']} re-checked, "
+                  f"{report['incremental']['reused']} unchanged")
         print(f"Score: {report['score']}/100")
         print(f"\n{'-'*60}")
 
@@ -3,7 +3,7 @@
 Skill: vulnerability-scanner
 Script: security_scan.py
 Purpose: Validate that security principles from SKILL.md are applied correctly
-Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config]
+Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config] [--incremental] [--since REV]
 Output: JSON with validation findings
 
 This script verifies:
@@ -19,9 +19,14 @@ import sys
 import re
 import argparse
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+# Shared project file index from the quality-gate skill
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "quality-gate" / "scripts"))
+from file_index import load_index
+from results_store import ResultsStore, open_store, run_incremental
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -86,9 +91,15 @@ DANGEROUS_PATTERNS = [
 ]
 
 SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv', '.next'}
+
+# Bump whenever a file scanner's patterns change, so stored per-file findings are dropped
+SCANNER_VERSION = "1"
 CODE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.go', '.java', '.rb', '.php'}
 CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.env.development'}
 
+# Scanners that work file by file and can reuse stored results
+FILE_SCANNERS = {"secrets", "patterns", "config"}
+
 
 # ============================================================================
 #  SCANNING FUNCTIONS
@@ -178,7 +189,36 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_secrets(project_path: str) -> Dict[str, Any]:
+def _open_store(index, scanner: str, incremental: bool, since: Optional[str]) -> Optional[ResultsStore]:
+    """Per-file results store for one scanner (None unless running incrementally)."""
+    if not (incremental or since):
+        return None
+    return open_store(index, f"security_scan-{scanner}", SCANNER_VERSION)
+
+
+def _secret_findings(filepath: Path, root: Path) -> List[Dict[str, Any]]:
+    """Secret pattern matches in one file."""
+    findings = []
+    try:
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+            
+            for pattern, secret_type, severity in SECRET_PATTERNS:
+                matches = re.findall(pattern, content, re.IGNORECASE)
+                if matches:
+                    findings.append({
+                        "file": str(filepath.relative_to(root)),
+                        "type": secret_type,
+                        "severity": severity,
+                        "count": len(matches)
+                    })
+                    
+    except Exception:
+        pass
+    return findings
+
+
+def scan_secrets(project_path: str, incremental: bool = False, since: Optional[str] = None) -> Dict[str, Any]:
     """
     Validate no hardcoded secrets (OWASP A04).
     Checks: API keys, tokens, passwords, cloud credentials.
@@ -191,35 +231,17 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
         "by_severity": {"critical": 0, "high": 0, "medium": 0}
     }
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS and ext not in CONFIG_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, secret_type, severity in SECRET_PATTERNS:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "type": secret_type,
-                                "severity": severity,
-                                "count": len(matches)
-                            })
-                            results["by_severity"][severity] += len(matches)
-                            
-            except Exception:
-                pass
+    index = load_index(project_path)
+    files = index.files(CODE_EXTENSIONS | CONFIG_EXTENSIONS, SKIP_DIRS)
+    store = _open_store(index, "secrets", incremental, since)
+    per_file = run_incremental(index, files, store, lambda path: _secret_findings(path, index.root), since)
     
+    for findings in per_file.values():
+        results["scanned_files"] += 1
+        for finding in findings:
+            results["findings"].append(finding)
+            results["by_severity"][finding["severity"]] += finding["count"]
+
     if results["by_severity"]["critical"] > 0:
         results["status"] = "[!!] CRITICAL: Secrets exposed!"
     elif results["by_severity"]["high"] > 0:
@@ -229,11 +251,37 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
     
     # Limit findings for output
     results["findings"] = results["findings"][:15]
+    if store is not None:
+        results["incremental"] = store.stats()
     
     return results
 
 
-def scan_code_patterns(project_path: str) -> Dict[str, Any]:
+def _pattern_findings(filepath: Path, root: Path) -> List[Dict[str, Any]]:
+    """Dangerous code pattern matches in one file, line by line."""
+    findings = []
+    try:
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            lines = f.readlines()
+            
+            for line_num, line in enumerate(lines, 1):
+                for pattern, name, severity, category in DANGEROUS_PATTERNS:
+                    if re.search(pattern, line, re.IGNORECASE):
+                        findings.append({
+                            "file": str(filepath.relative_to(root)),
+                            "line": line_num,
+                            "pattern": name,
+                            "severity": severity,
+                            "category": category,
+                            "snippet": line.strip()[:80]
+                        })
+                        
+    except Exception:
+        pass
+    return findings
+
+
+def scan_code_patterns(project_path: str, incremental: bool = False, since: Optional[str] = None) -> Dict[str, Any]:
     """
     Validate dangerous code patterns (OWASP A05).
     Checks: Injection risks, XSS, unsafe deserialization.
@@ -246,37 +294,18 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
         "by_category": {}
     }
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        for pattern, name, severity, category in DANGEROUS_PATTERNS:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                results["findings"].append({
-                                    "file": str(filepath.relative_to(project_path)),
-                                    "line": line_num,
-                                    "pattern": name,
-                                    "severity": severity,
-                                    "category": category,
-                                    "snippet": line.strip()[:80]
-                                })
-                                results["by_category"][category] = results["by_category"].get(category, 0) + 1
-                                
-            except Exception:
-                pass
-    
+    index = load_index(project_path)
+    files = index.files(CODE_EXTENSIONS, SKIP_DIRS)
+    store = _open_store(index, "patterns", incremental, since)
+    per_file = run_incremental(index, files, store, lambda path: _pattern_findings(path, index.root), since)
+    
+    for findings in per_file.values():
+        results["scanned_files"] += 1
+        for finding in findings:
+            results["findings"].append(finding)
+            category = finding["category"]
+            results["by_category"][category] = results["by_category"].get(category, 0) + 1
+
     critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
     high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
     
@@ -289,11 +318,44 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
     
     # Limit findings
     results["findings"] = results["findings"][:20]
+    if store is not None:
+        results["incremental"] = store.stats()
     
     return results
 
 
-def scan_configuration(project_path: str) -> Dict[str, Any]:
+# Common config file issues
+CONFIG_ISSUES = [
+    (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
+    (r'debug\s*=\s*True', "Debug mode enabled", "high"),
+    (r'NODE_ENV.*development', "Development mode in config", "medium"),
+    (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
+    (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
+    (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
+]
+
+
+def _config_findings(filepath: Path, root: Path) -> List[Dict[str, Any]]:
+    """Insecure settings in one config file."""
+    findings = []
+    try:
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+            
+            for pattern, issue, severity in CONFIG_ISSUES:
+                if re.search(pattern, content, re.IGNORECASE):
+                    findings.append({
+                        "file": str(filepath.relative_to(root)),
+                        "issue": issue,
+                        "severity": severity
+                    })
+                    
+    except Exception:
+        pass
+    return findings
+
+
+def scan_configuration(project_path: str, incremental: bool = False, since: Optional[str] = None) -> Dict[str, Any]:
     """
     Validate security configuration (OWASP A02).
     Checks: Security headers, CORS, debug modes.
@@ -305,41 +367,17 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
         "checks": {}
     }
     
-    # Check common config files for issues
-    config_issues = [
-        (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
-        (r'debug\s*=\s*True', "Debug mode enabled", "high"),
-        (r'NODE_ENV.*development', "Development mode in config", "medium"),
-        (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
-        (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
-        (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
-    ]
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CONFIG_EXTENSIONS and file not in ['next.config.js', 'webpack.config.js', '.eslintrc.js']:
-                continue
-                
-            filepath = Path(root) / file
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, issue, severity in config_issues:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "issue": issue,
-                                "severity": severity
-                            })
-                            
-            except Exception:
-                pass
-    
+    index = load_index(project_path)
+    config_files = index.files(
+        CONFIG_EXTENSIONS, SKIP_DIRS, names=['next.config.js', 'webpack.config.js', '.eslintrc.js']
+    )
+    store = _open_store(index, "config", incremental, since)
+    per_file = run_incremental(index, config_files, store, lambda path: _config_findings(path, index.root), since)
+    for findings in per_file.values():
+        results["findings"].extend(findings)
+    if store is not None:
+        results["incremental"] = store.stats()
+
     # Check for security header configurations
     header_files = ["next.config.js", "next.config.mjs", "middleware.ts", "nginx.conf"]
     for hf in header_files:
@@ -369,8 +407,19 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
 #  MAIN
 # ============================================================================
 
-def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
-    """Execute security validation scans."""
+def run_full_scan(
+    project_path: str,
+    scan_type: str = "all",
+    incremental: bool = False,
+    since: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Execute security validation scans.
+
+    With `incremental` (or a git revision in `since`), the per-file scanners
+    only re-scan files whose content changed and reuse stored findings for
+    the rest.
+    """
     
     report = {
         "project": project_path,
@@ -394,7 +443,10 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     
     for key, (name, scanner) in scanners.items():
         if scan_type == "all" or scan_type == key:
-            result = scanner(project_path)
+            if key in FILE_SCANNERS:
+                result = scanner(project_path, incremental=incremental, since=since)
+            else:
+                result = scanner(project_path)
             report["scans"][name] = result
             
             findings_count = len(result.get("findings", []))
@@ -427,6 +479,9 @@ def main():
                         default="all", help="Type of scan to run")
     parser.add_argument("--output", choices=["json", "summary"], default="json",
                         help="Output format")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Re-scan only files whose content changed since the last incremental run")
+    parser.add_argument("--since", help="Git revision; only files in `git diff <rev>` are re-scanned")
     
     args = parser.parse_args()
     
@@ -434,7 +489,11 @@ def main():
         print(json.dumps({"error": f"Directory not found: {args.project_path}"}))
         sys.exit(1)
     
-    result = run_full_scan(args.project_path, args.scan_type)
+    try:
+        result = run_full_scan(args.project_path, args.scan_type, args.incremental, args.since)
+    except RuntimeError as e:
+        print(json.dumps({"error": str(e)}))
+        sys.exit(1)
     
     if args.output == "summary":
         print(f"\n{'='*60}")
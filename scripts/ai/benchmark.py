@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark
+
+Drives the full generate -> review -> revise loop at scale against the
+local connector, so pipeline throughput can be measured offline and in CI
+without API keys or network access.
+
+Usage:
+    python benchmark.py --requests 200 --workers 8
+    python benchmark.py --requests 50 --latency-ms 200 --failure-rate 0.05 --output bench.json
+"""
+
+import os
+import json
+import time
+import logging
+import tempfile
+import argparse
+from typing import Dict, Any, List
+
+from content_pipeline import ContentPipeline, ContentRequest
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPES = ["blog", "landing", "faq", "product", "service"]
+
+
+def build_config(
+    workers: int,
+    latency_ms: float = 0.0,
+    latency_jitter_ms: float = 0.0,
+    failure_rate: float = 0.0,
+    malformed_rate: float = 0.0,
+    seed: int = 0,
+    review_cache: bool = False
+) -> Dict[str, Any]:
+    """
+    Model config routing generation and review to the local connector.
+
+    Args:
+        workers: Parallel pipeline workers (also the connector's slot count)
+        latency_ms: Simulated latency per model call
+        latency_jitter_ms: Maximum extra random latency per call
+        failure_rate: Share of model calls that fail
+        malformed_rate: Share of reviews answered with non-JSON text
+        seed: Seed for injected latency and failures
+        review_cache: Keep the persistent review cache (off so runs are comparable)
+
+    Returns:
+        model-config.json compatible dict
+    """
+    # Synthetic drafts are near-identical by design; keep them out of the stored index
+    review_config = {"duplicate_check": {"enabled": False}}
+    if not review_cache:
+        review_config["review_cache"] = {"enabled": False}
+
+    return {
+        "use_cli": False,
+        "reviewer": "local",
+        "models": {
+            "local": {
+                "max_concurrency": max(1, workers),
+                "options": {
+                    "latency_ms": latency_ms,
+                    "latency_jitter_ms": latency_jitter_ms,
+                    "failure_rate": failure_rate,
+                    "malformed_rate": malformed_rate,
+                    "seed": seed
+                }
+            }
+        },
+        "fallback_chain": ["local"],
+        "content_routes": {},
+        "cache": {"enabled": False},
+        "review_config": review_config
+    }
+
+
+def build_requests(count: int) -> List[ContentRequest]:
+    """Synthetic requests cycling through the common content types."""
+    return [
+        ContentRequest(
+            id=f"bench-{i:05d}",
+            content_type=CONTENT_TYPES[i % len(CONTENT_TYPES)],
+            topic=f"Workplace Safety Topic {i}",
+            context={"industry": "occupational safety", "keywords": ["safety", "training"]}
+        )
+        for i in range(count)
+    ]
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_benchmark(
+    requests: int = 100,
+    workers: int = 4,
+    with_review: bool = True,
+    auto_revise: bool = True,
+    review_cache: bool = False,
+    **connector_options
+) -> Dict[str, Any]:
+    """
+    Run the pipeline against the local connector and report throughput.
+
+    Args:
+        requests: Number of synthetic requests
+        workers: Parallel pipeline workers
+        with_review: Review each generated piece
+        auto_revise: Revise content that fails review
+        review_cache: Keep the persistent review cache (off so runs are comparable)
+        **connector_options: build_config() options (latency_ms, failure_rate, ...)
+
+    Returns:
+        Benchmark report
+    """
+    config = build_config(workers, review_cache=review_cache, **connector_options)
+
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".json", delete=False, encoding="utf-8"
+    ) as f:
+        json.dump(config, f)
+        config_path = f.name
+
+    try:
+        pipeline = ContentPipeline(config_path)
+        batch = build_requests(requests)
+
+        start_time = time.time()
+        results = pipeline.bulk_generate(
+            batch,
+            parallel=workers,
+            with_review=with_review,
+            auto_revise=auto_revise
+        )
+        wall_time = time.time() - start_time
+    finally:
+        os.unlink(config_path)
+
+    latencies = [r.latency_ms for r in results]
+    statuses: Dict[str, int] = {}
+    for r in results:
+        statuses[r.status] = statuses.get(r.status, 0) + 1
+    reviewed = [r for r in results if r.review_score > 0]
+
+    return {
+        "requests": requests,
+        "workers": workers,
+        "connector": connector_options,
+        "wall_time_s": round(wall_time, 2),
+        "throughput_per_s": round(requests / wall_time, 2) if wall_time > 0 else 0,
+        "latency_ms": {
+            "p50": round(_percentile(latencies, 50), 1),
+            "p95": round(_percentile(latencies, 95), 1),
+            "max": round(max(latencies), 1) if latencies else 0
+        },
+        "statuses": statuses,
+        "avg_review_score": round(
+            sum(r.review_score for r in reviewed) / len(reviewed), 1
+        ) if reviewed else 0,
+        "avg_revisions": round(
+            sum(r.revision_count for r in results) / len(results), 2
+        ) if results else 0,
+        "total_tokens": sum(r.tokens_used for r in results),
+        "pipeline": pipeline.get_metrics(),
+        "connectors": pipeline._get_connector_manager().get_metrics()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline pipeline benchmark")
+    parser.add_argument("--requests", type=int, default=100, help="Number of requests")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel workers")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated latency per model call")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Maximum extra random latency per call")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of model calls that fail")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="Share of reviews returning non-JSON")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for injected latency and failures")
+    parser.add_argument("--no-review", action="store_true", help="Skip review")
+    parser.add_argument("--no-revise", action="store_true", help="Skip auto-revision")
+    parser.add_argument("--review-cache", action="store_true", help="Use the persistent review cache")
+    parser.add_argument("--output", help="Write the report to a JSON file")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    report = run_benchmark(
+        requests=args.requests,
+        workers=args.workers,
+        with_review=not args.no_review,
+        auto_revise=not args.no_revise,
+        review_cache=args.review_cache,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.jitter_ms,
+        failure_rate=args.failure_rate,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed
+    )
+
+    print(f"\n{'='*50}")
+    print(f"Requests: {report['requests']} ({report['workers']} workers)")
+    print(f"Wall time: {report['wall_time_s']}s ({report['throughput_per_s']} req/s)")
+    print(f"Latency p50/p95/max: {report['latency_ms']['p50']}/"
+          f"{report['latency_ms']['p95']}/{report['latency_ms']['max']} ms")
+    print(f"Statuses: {report['statuses']}")
+    print(f"Avg review score: {report['avg_review_score']}")
+    print(f"Avg revisions: {report['avg_revisions']}")
+    print(f"{'='*50}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, default=str)
+        print(f"Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
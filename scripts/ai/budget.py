@@ -0,0 +1,256 @@
+"""
+Budget Controller
+
+Token and cost guardrails for pipeline runs.
+Tracks real spend per run and per request, priced from each
+connector's ModelInfo, and decides how a stage may proceed.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+# Budget decisions, from least to most restrictive
+PROCEED = "proceed"    # run the stage as planned
+DEGRADE = "degrade"    # run the stage on the cheaper route
+SKIP = "skip"          # skip this optional stage (review/revision)
+STOP = "stop"          # do not start any more work
+
+# Rough share of prompt vs. completion when a provider reports only totals
+DEFAULT_INPUT_SHARE = 0.5
+
+
+@dataclass
+class BudgetLimits:
+    """Token and cost ceilings. None disables a ceiling."""
+    max_run_tokens: Optional[int] = None
+    max_run_cost: Optional[float] = None
+    max_request_tokens: Optional[int] = None
+    max_request_cost: Optional[float] = None
+    soft_limit_ratio: float = 0.8
+    degrade_model: str = "glm"
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], **overrides) -> "BudgetLimits":
+        """Build limits from the `budget` section of model-config.json."""
+        values = {
+            key: config[key]
+            for key in cls.__dataclass_fields__
+            if key in config
+        }
+        values.update({k: v for k, v in overrides.items() if v is not None})
+        return cls(**values)
+
+    def is_enabled(self) -> bool:
+        """Whether any ceiling is configured."""
+        return any(
+            limit is not None for limit in (
+                self.max_run_tokens, self.max_run_cost,
+                self.max_request_tokens, self.max_request_cost
+            )
+        )
+
+
+@dataclass
+class Spend:
+    """Accumulated usage."""
+    tokens: int = 0
+    cost: float = 0.0
+    calls: int = 0
+    by_model: Dict[str, float] = field(default_factory=dict)
+
+    def add(self, model: str, tokens: int, cost: float):
+        self.tokens += tokens
+        self.cost += cost
+        self.calls += 1
+        self.by_model[model] = self.by_model.get(model, 0.0) + cost
+
+
+class BudgetController:
+    """
+    Enforces token/cost budgets across a bulk run.
+
+    Degradation ladder, applied as spend approaches a ceiling:
+    - soft limit (soft_limit_ratio of a ceiling): skip revisions and
+      route new generations to the cheaper `degrade_model`
+    - hard limit: skip reviews and stop starting new requests
+    """
+
+    def __init__(
+        self,
+        limits: BudgetLimits,
+        pricing: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            limits: Budget ceilings
+            pricing: Model name -> ModelInfo (cost_per_1k_input/output)
+        """
+        self.limits = limits
+        self.pricing = pricing or {}
+        self.run = Spend()
+        self.requests: Dict[str, Spend] = {}
+        self.decisions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def price(self, model: str, input_tokens: int, output_tokens: int) -> float:
+        """Price a call from the model's per-1k token rates."""
+        info = self.pricing.get(model)
+        if info is None:
+            return 0.0
+        return (
+            input_tokens / 1000 * info.cost_per_1k_input +
+            output_tokens / 1000 * info.cost_per_1k_output
+        )
+
+    def estimate_cost(self, model: str, tokens: int) -> float:
+        """Price an estimated token count when the split is unknown."""
+        input_tokens = int(tokens * DEFAULT_INPUT_SHARE)
+        return self.price(model, input_tokens, tokens - input_tokens)
+
+    def charge(
+        self,
+        request_id: str,
+        model: str,
+        tokens_used: int,
+        input_tokens: Optional[int] = None,
+        output_tokens: Optional[int] = None
+    ) -> float:
+        """
+        Record real usage for a request.
+
+        Uses the provider's input/output split when reported, otherwise
+        assumes DEFAULT_INPUT_SHARE of the total was prompt.
+
+        Returns:
+            Cost of the call
+        """
+        if input_tokens is None or output_tokens is None:
+            input_tokens = int(tokens_used * DEFAULT_INPUT_SHARE)
+            output_tokens = tokens_used - input_tokens
+        cost = self.price(model, input_tokens, output_tokens)
+
+        with self._lock:
+            self.run.add(model, tokens_used, cost)
+            self.requests.setdefault(request_id, Spend()).add(model, tokens_used, cost)
+
+        return cost
+
+    def charge_response(self, request_id: str, response) -> float:
+        """Record usage from a ConnectorResponse."""
+        if not response.success:
+            return 0.0
+        return self.charge(
+            request_id,
+            response.model,
+            response.tokens_used,
+            response.metadata.get("input_tokens"),
+            response.metadata.get("output_tokens")
+        )
+
+    def check(
+        self,
+        stage: str,
+        request_id: str,
+        estimated_tokens: int = 0,
+        model: Optional[str] = None
+    ) -> str:
+        """
+        Decide how a stage may proceed.
+
+        Args:
+            stage: queue, generate, review or revise
+            request_id: Request the stage belongs to
+            estimated_tokens: Expected usage of the stage
+            model: Model expected to run the stage (for cost projection)
+
+        Returns:
+            One of PROCEED, DEGRADE, SKIP, STOP
+        """
+        if not self.limits.is_enabled():
+            return PROCEED
+
+        estimated_cost = self.estimate_cost(model, estimated_tokens) if model else 0.0
+
+        with self._lock:
+            request = self.requests.get(request_id, Spend())
+            run_ratio = self._ratio(
+                self.run, estimated_tokens, estimated_cost,
+                self.limits.max_run_tokens, self.limits.max_run_cost
+            )
+            request_ratio = self._ratio(
+                request, estimated_tokens, estimated_cost,
+                self.limits.max_request_tokens, self.limits.max_request_cost
+            )
+            decision = self._decide(stage, run_ratio, request_ratio)
+            self.decisions[decision] = self.decisions.get(decision, 0) + 1
+
+        if decision != PROCEED:
+            logger.info(
+                f"Budget: {decision} {stage} for {request_id} "
+                f"(run {run_ratio:.0%}, request {request_ratio:.0%})"
+            )
+        return decision
+
+    def _ratio(
+        self,
+        spend: Spend,
+        estimated_tokens: int,
+        estimated_cost: float,
+        max_tokens: Optional[int],
+        max_cost: Optional[float]
+    ) -> float:
+        """Highest projected fraction of any configured ceiling."""
+        ratios = [0.0]
+        if max_tokens:
+            ratios.append((spend.tokens + estimated_tokens) / max_tokens)
+        if max_cost:
+            ratios.append((spend.cost + estimated_cost) / max_cost)
+        return max(ratios)
+
+    def _decide(self, stage: str, run_ratio: float, request_ratio: float) -> str:
+        """Map projected usage onto the degradation ladder."""
+        soft = self.limits.soft_limit_ratio
+
+        if stage in ("queue", "generate"):
+            if run_ratio >= 1.0:
+                return STOP
+            if run_ratio >= soft:
+                return DEGRADE
+            return PROCEED
+
+        if stage == "review":
+            if run_ratio >= 1.0 or request_ratio >= 1.0:
+                return SKIP
+            return PROCEED
+
+        # revise
+        if run_ratio >= soft or request_ratio >= soft:
+            return SKIP
+        return PROCEED
+
+    def summary(self) -> Dict[str, Any]:
+        """Spend vs. budget snapshot for metrics."""
+        with self._lock:
+            return {
+                "spent_tokens": self.run.tokens,
+                "spent_cost": round(self.run.cost, 4),
+                "max_run_tokens": self.limits.max_run_tokens,
+                "max_run_cost": self.limits.max_run_cost,
+                "run_usage_pct": round(self._ratio(
+                    self.run, 0, 0.0,
+                    self.limits.max_run_tokens, self.limits.max_run_cost
+                ) * 100, 1),
+                "max_request_tokens": self.limits.max_request_tokens,
+                "max_request_cost": self.limits.max_request_cost,
+                "cost_by_model": {
+                    model: round(cost, 4)
+                    for model, cost in self.run.by_model.items()
+                },
+                "decisions": dict(self.decisions)
+            }
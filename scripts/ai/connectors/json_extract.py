@@ -0,0 +1,235 @@
+"""
+JSON Extraction
+
+Tolerant extraction of JSON values from model output. Handles prose
+around the JSON, markdown code fences, streamed chunks, truncated
+responses and common formatting slips (trailing commas, smart quotes,
+Python literals, comments).
+"""
+
+import re
+import json
+from typing import Optional, Any, List, Tuple, Callable
+
+SMART_QUOTES = str.maketrans({"“": '"', "”": '"', "‘": "'", "’": "'"})
+TRAILING_COMMA_PATTERN = re.compile(r',(\s*[}\]])')
+LINE_COMMENT_PATTERN = re.compile(r'^\s*//.*$', re.MULTILINE)
+PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+PYTHON_LITERAL_PATTERN = re.compile(r'\b(True|False|None)\b')
+MAX_TRUNCATION_CUTS = 20
+
+
+class IncrementalJSONExtractor:
+    """
+    Pull top-level JSON values out of a stream of text chunks.
+
+    Tracks bracket depth and string state across chunks, so a value is
+    decoded as soon as its closing bracket arrives. Text outside of
+    brackets (prose, code fences) is ignored.
+    """
+
+    def __init__(self, opener: str = "{"):
+        """
+        Initialize the extractor.
+
+        Args:
+            opener: "{" to extract objects, "[" to extract arrays
+        """
+        self.opener = opener
+        self.closer = "}" if opener == "{" else "]"
+        self.values: List[Any] = []
+        self.repaired = False
+        self._buffer: List[str] = []
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> List[Any]:
+        """
+        Consume a chunk of text.
+
+        Returns:
+            Values completed by this chunk
+        """
+        completed = []
+        for char in chunk:
+            if not self._stack:
+                if char == self.opener:
+                    self._buffer = [char]
+                    self._stack = [self.closer]
+                continue
+
+            self._buffer.append(char)
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._stack.append("}" if char == "{" else "]")
+            elif char in "}]":
+                if self._stack and char == self._stack[-1]:
+                    self._stack.pop()
+                if not self._stack:
+                    value = self._decode("".join(self._buffer))
+                    if value is not None:
+                        self.values.append(value)
+                        completed.append(value)
+                    self._buffer = []
+        return completed
+
+    def finish(self) -> List[Any]:
+        """
+        Close out a truncated trailing value, if any.
+
+        Returns:
+            The repaired value as a one-item list, or an empty list
+        """
+        if not self._stack:
+            return []
+
+        text = "".join(self._buffer)
+        self._buffer, self._stack = [], []
+        self._in_string = self._escaped = False
+
+        # Drop incomplete trailing members until the value closes cleanly
+        for _ in range(MAX_TRUNCATION_CUTS):
+            value = self._decode(_close_brackets(text))
+            if value is not None:
+                self.repaired = True
+                self.values.append(value)
+                return [value]
+            cut = text.rfind(",")
+            if cut <= 0:
+                break
+            text = text[:cut]
+        return []
+
+    def _decode(self, text: str) -> Optional[Any]:
+        """Decode a candidate, applying formatting repairs if needed."""
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
+
+        fixed = repair_json(text)
+        if fixed == text:
+            return None
+        try:
+            value = json.loads(fixed)
+        except json.JSONDecodeError:
+            return None
+        self.repaired = True
+        return value
+
+
+def _split_strings(text: str) -> List[Tuple[str, bool]]:
+    """
+    Split text into runs inside and outside JSON string literals.
+
+    Returns:
+        [(run, inside_string)]; an unterminated final string is one run
+    """
+    runs = []
+    start = 0
+    in_string = escaped = False
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+                runs.append((text[start:i + 1], True))
+                start = i + 1
+        elif char == '"':
+            if i > start:
+                runs.append((text[start:i], False))
+            start = i
+            in_string = True
+    if start < len(text):
+        runs.append((text[start:], in_string))
+    return runs
+
+
+def _close_brackets(text: str) -> str:
+    """Terminate an open string and close every open bracket."""
+    stack = []
+    in_string = False
+    for run, in_string in _split_strings(text):
+        if in_string:
+            continue
+        for char in run:
+            if char in "{[":
+                stack.append("}" if char == "{" else "]")
+            elif char in "}]" and stack:
+                stack.pop()
+
+    if in_string:
+        text += '"'
+    text = re.sub(r'[,:]\s*$', '', text.rstrip())
+    return text + "".join(reversed(stack))
+
+
+def repair_json(text: str) -> str:
+    """
+    Fix common model formatting errors in a JSON candidate.
+
+    Trailing commas and Python literals are only fixed outside string
+    literals, so review feedback such as "True story: None of ..." is
+    left as written.
+
+    Args:
+        text: Candidate JSON text
+
+    Returns:
+        Repaired text (unchanged if nothing applied)
+    """
+    fixed = text.translate(SMART_QUOTES)
+    if '"' not in fixed and "'" in fixed:
+        fixed = fixed.replace("'", '"')
+    fixed = LINE_COMMENT_PATTERN.sub("", fixed)
+    return "".join(
+        run if inside else PYTHON_LITERAL_PATTERN.sub(
+            lambda m: PYTHON_LITERALS[m.group(1)], TRAILING_COMMA_PATTERN.sub(r'\1', run)
+        )
+        for run, inside in _split_strings(fixed)
+    )
+
+
+def extract_json(
+    text: str,
+    opener: str = "{",
+    accept: Optional[Callable[[Any], bool]] = None
+) -> Tuple[Optional[Any], bool]:
+    """
+    Extract the first acceptable JSON value from model output.
+
+    Args:
+        text: Full (possibly partial) model output
+        opener: "{" for an object, "[" for an array
+        accept: Predicate a value must satisfy (e.g. has "overall_score")
+
+    Returns:
+        (value or None, whether repairs were needed)
+    """
+    accept = accept or (lambda value: True)
+    extractor = IncrementalJSONExtractor(opener)
+
+    for value in extractor.feed(text):
+        if accept(value):
+            return value, extractor.repaired
+
+    for value in extractor.finish():
+        if accept(value):
+            return value, True
+
+    return None, extractor.repaired
@@ -0,0 +1,323 @@
+"""
+Local Review Connector
+
+Deterministic offline stand-in for the GPT-4 reviewer and the generation
+providers. Reviews are scored with the content-optimization analyzers
+and answered in the same JSON format as GPT-4, so the real response
+parsers run unchanged. Latency and failures can be injected for load
+tests and CI benchmarks; no network access or API key is needed.
+"""
+
+import re
+import sys
+import json
+import time
+import random
+import hashlib
+import logging
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+from .base_connector import ConnectorResponse, ModelInfo, RateLimiter
+from .openai_connector import OpenAIConnector
+
+logger = logging.getLogger(__name__)
+
+REVIEW_CONTENT_PATTERN = re.compile(
+    r'CONTENT TO REVIEW:\n---\n(.*)\n---\n\nEVALUATION CRITERIA:', re.DOTALL
+)
+PACKED_DOCUMENT_PATTERN = re.compile(
+    r'=== DOCUMENT id="([^"]*)" ===\n(.*?)\n=== END DOCUMENT ===', re.DOTALL
+)
+REVISION_CONTENT_PATTERN = re.compile(
+    r'ORIGINAL CONTENT:\n---\n(.*)\n---\n\nFEEDBACK TO ADDRESS:\n(.*?)\n\n', re.DOTALL
+)
+CRITERION_PATTERN = re.compile(r'^- (\w+): ', re.MULTILINE)
+TOPIC_PATTERN = re.compile(r'^Topic:\s*(.+)$', re.MULTILINE)
+DEFAULT_TOPIC = "Workplace Safety"
+
+
+def _load_analyzers():
+    """Import content_analyzer / content_optimizer from the content-optimization skill."""
+    try:
+        import content_analyzer
+        import content_optimizer
+        return content_analyzer, content_optimizer
+    except ImportError:
+        pass
+
+    here = Path(__file__).resolve()
+    for parent in here.parents:
+        for candidate in (
+            parent / "content-optimization" / "scripts",
+            parent / ".agent" / "skills" / "content-optimization" / "scripts"
+        ):
+            if (candidate / "content_analyzer.py").is_file():
+                sys.path.insert(0, str(candidate))
+                import content_analyzer
+                import content_optimizer
+                return content_analyzer, content_optimizer
+
+    raise ImportError(
+        "content_analyzer not found. "
+        "Ensure the content-optimization skill is installed."
+    )
+
+
+class LocalReviewConnector(OpenAIConnector):
+    """
+    Offline reviewer/generator for throughput testing.
+
+    Reuses OpenAIConnector's prompt building and response parsing; only
+    the model call is replaced by local scoring. Latency, failures and
+    malformed answers are drawn per call from the seed and the prompt, so
+    the same inputs give the same results whatever the number of workers.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model_id: str = "local-analyzer",
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        use_cli: bool = False,
+        latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+        failure_rate: float = 0.0,
+        malformed_rate: float = 0.0,
+        seed: int = 0,
+        rpm: int = 100000,
+        tpm: int = 100000000
+    ):
+        """
+        Initialize the local connector.
+
+        Args:
+            api_key: Unused (accepted for a uniform connector signature)
+            model_id: Name reported in response metadata
+            max_tokens: Unused
+            temperature: Unused
+            use_cli: Unused
+            latency_ms: Simulated latency per call
+            latency_jitter_ms: Maximum extra random latency per call
+            failure_rate: Share of calls that fail (0-1)
+            malformed_rate: Share of review calls answered with non-JSON text (0-1)
+            seed: Seed for latency jitter and failure injection
+            rpm: Requests-per-minute limit exposed to callers
+            tpm: Tokens-per-minute limit exposed to callers
+        """
+        super().__init__(
+            api_key="local",
+            model_id=model_id,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            use_cli=False
+        )
+        self.name = "local"
+        self.rate_limiter = RateLimiter(rpm, tpm)
+        self._cli_available = False
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.failure_rate = failure_rate
+        self.malformed_rate = malformed_rate
+        self.seed = seed
+        self._analyzer, self._optimizer = _load_analyzers()
+
+    def generate(
+        self,
+        prompt: str,
+        context: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> ConnectorResponse:
+        """Answer a review, revision or generation prompt locally."""
+        context = context or {}
+        start_time = time.time()
+
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        rng = random.Random(f"{self.seed}:{digest}")
+        delay_ms = self.latency_ms + rng.uniform(0, self.latency_jitter_ms)
+        failed = rng.random() < self.failure_rate
+        malformed = rng.random() < self.malformed_rate
+
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+        if failed:
+            return ConnectorResponse(
+                content="", model=self.name, tokens_used=0,
+                latency_ms=(time.time() - start_time) * 1000,
+                success=False, error=f"{self.name}: injected failure"
+            )
+
+        task = context.get("task")
+        if task == "review":
+            content = "Unable to review this content." if malformed else self._review_response(prompt)
+        elif task == "revision":
+            content = self._revise(prompt)
+        else:
+            content = self._draft(prompt)
+
+        tokens_used = self._estimate_tokens(prompt, content)
+        self.rate_limiter.record_request(tokens_used)
+
+        return ConnectorResponse(
+            content=content,
+            model=self.name,
+            tokens_used=tokens_used,
+            latency_ms=(time.time() - start_time) * 1000,
+            success=True,
+            metadata={
+                "model_id": self.model_id,
+                "method": "local",
+                "input_tokens": len(prompt) // 4,
+                "output_tokens": len(content) // 4
+            }
+        )
+
+    def score(self, content: str, criteria: List[str]) -> Dict[str, Any]:
+        """
+        Score content with the local analyzers.
+
+        Args:
+            content: Content to score
+            criteria: Review criteria to report
+
+        Returns:
+            Review dict in the GPT-4 review JSON format
+        """
+        analyzer = self._analyzer
+        doc = analyzer.as_document(content)
+        checks = analyzer.run_checks(doc)
+        percent = {
+            name: round(check["score"] / check["max_score"] * 100) if check["max_score"] else 0
+            for name, check in checks.items()
+        }
+        readability = self._optimizer.analyze_readability(doc)
+        clarity = round(readability["flesch_score"]) if readability["total_words"] else 0
+
+        # Closest local signal for each review criterion
+        criterion_signals = {
+            "accuracy": percent["depth"],
+            "clarity": clarity,
+            "tone": round((clarity + percent["engagement"]) / 2),
+            "seo": percent["seo"],
+            "engagement": percent["engagement"],
+            "grammar": clarity,
+            "structure": percent["structure"],
+            "cta": percent["engagement"],
+            "eeat": percent["depth"]
+        }
+        findings = {
+            "accuracy": checks["depth"]["findings"],
+            "clarity": readability.get("issues", []),
+            "tone": checks["engagement"]["findings"],
+            "seo": checks["seo"]["findings"] + checks["title"]["findings"],
+            "engagement": checks["engagement"]["findings"],
+            "grammar": readability.get("issues", []),
+            "structure": checks["structure"]["findings"],
+            "cta": checks["engagement"]["findings"],
+            "eeat": checks["depth"]["findings"]
+        }
+
+        criteria_scores = {
+            c: {
+                "score": criterion_signals.get(c, round(sum(percent.values()) / len(percent))),
+                "feedback": "; ".join(findings.get(c, [])) or "No issues found"
+            }
+            for c in criteria
+        }
+        overall = round(
+            sum(s["score"] for s in criteria_scores.values()) / len(criteria_scores)
+        ) if criteria_scores else 0
+
+        improvements = [
+            f"[{name.upper()}] {finding}"
+            for name, check in checks.items()
+            for finding in check["findings"]
+        ]
+
+        return {
+            "overall_score": overall,
+            "criteria_scores": criteria_scores,
+            "strengths": [
+                f"Strong {name}" for name, value in percent.items() if value >= 80
+            ],
+            "improvements": improvements,
+            "critical_issues": [],
+            "recommendation": "approve" if overall >= 70 else ("revise" if overall >= 40 else "reject")
+        }
+
+    def _review_response(self, prompt: str) -> str:
+        """Build the JSON answer to a single or packed review prompt."""
+        criteria_section = prompt.split("EVALUATION CRITERIA:", 1)[-1]
+        criteria = CRITERION_PATTERN.findall(criteria_section) or [
+            "accuracy", "clarity", "tone", "seo", "engagement"
+        ]
+
+        documents = PACKED_DOCUMENT_PATTERN.findall(prompt)
+        if documents:
+            return json.dumps([
+                {"id": doc_id, **self.score(doc_content, criteria)}
+                for doc_id, doc_content in documents
+            ], ensure_ascii=False)
+
+        match = REVIEW_CONTENT_PATTERN.search(prompt)
+        content = match.group(1) if match else prompt
+        return json.dumps(self.score(content, criteria), ensure_ascii=False)
+
+    def _revise(self, prompt: str) -> str:
+        """Return the original content with a section answering the feedback."""
+        match = REVISION_CONTENT_PATTERN.search(prompt + "\n\n")
+        if not match:
+            return self._draft(prompt)
+
+        content, feedback = match.group(1), match.group(2)
+        items = [line[2:].strip() for line in feedback.splitlines() if line.startswith("- ")]
+        additions = "\n".join(f"- Addressed: {item}" for item in items[:5])
+        return (
+            f"{content.rstrip()}\n\n## Frequently Asked Questions\n\n"
+            f"What changed in this revision? The following points were addressed.\n\n"
+            f"{additions}\n\n"
+            f"Ready to learn more? Contact us today to get started."
+        )
+
+    def _draft(self, prompt: str) -> str:
+        """Generate a deterministic markdown document for a prompt."""
+        match = TOPIC_PATTERN.search(prompt)
+        lines = prompt.strip().splitlines()
+        topic = match.group(1).strip() if match else (lines[0][:60] if lines else DEFAULT_TOPIC)
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        section_count = 3 + int(digest[:2], 16) % 3
+
+        sections = []
+        for i in range(section_count):
+            sections.append(
+                f"## Step {i + 1}: {topic}\n\n"
+                f"This section explains how {topic.lower()} works in practice. "
+                f"You will learn why it matters and what to check first. "
+                f"Teams that plan ahead save time and avoid costly mistakes.\n\n"
+                f"- Review the current setup\n- Document each decision\n- Measure the result"
+            )
+
+        return (
+            f"# {section_count} Best Ways to Handle {topic}\n\n"
+            f"Why does {topic.lower()} matter? This guide covers the essentials.\n\n"
+            + "\n\n".join(sections)
+            + "\n\n## Conclusion\n\nReady to improve? Contact us today to get started."
+        )
+
+    def is_available(self) -> bool:
+        """Local connector is always available."""
+        return True
+
+    def get_model_info(self) -> ModelInfo:
+        """Get local connector information (no cost)."""
+        return ModelInfo(
+            name="local",
+            provider="local",
+            model_id=self.model_id,
+            max_tokens=self.max_tokens,
+            content_types=[],
+            cost_per_1k_input=0.0,
+            cost_per_1k_output=0.0
+        )
@@ -18,6 +18,8 @@ import json
 import time
 import logging
 import argparse
+import threading
+import uuid
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any, List
@@ -27,9 +29,30 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 # Add skill script paths
 SCRIPT_DIR = Path(__file__).parent
 SKILL_DIR = SCRIPT_DIR.parent / "skills"
+if not SKILL_DIR.exists():
+    # Repository layout: skills live under .agent/skills at the repo root
+    SKILL_DIR = SCRIPT_DIR.parent.parent / ".agent" / "skills"
 sys.path.insert(0, str(SKILL_DIR / "multi-model-connector" / "scripts"))
 sys.path.insert(0, str(SKILL_DIR / "content-review" / "scripts"))
 
+from budget import BudgetController, BudgetLimits, PROCEED, DEGRADE, SKIP, STOP
+from manifest import RegenerationManifest, fingerprint
+from revision_controller import STOP as STOP_REVISION
+
+# Bump when the prompt builder's instructions change so fingerprints are invalidated
+PROMPT_VERSION = "1"
+
+# Typical completion size per content type, used for cost estimates
+EXPECTED_OUTPUT_TOKENS = {
+    "blog": 2500,
+    "article": 2500,
+    "service": 1800,
+    "landing": 1500,
+    "faq": 1500,
+    "product": 600,
+    "description": 400
+}
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
@@ -53,7 +76,7 @@ class ContentResult:
     """Content generation result."""
     id: str
     content_type: str
-    status: str  # success, failed, review_failed
+    status: str  # success, failed, review_failed, budget_exceeded, near_duplicate
     content: str
     model_used: str
     review_score: int
@@ -79,14 +102,29 @@ class ContentPipeline:
     - Publishing format conversion
     """
 
-    def __init__(self, config_path: Optional[str] = None):
-        """Initialize the pipeline."""
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        budget: Optional[BudgetController] = None
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            config_path: Path to model-config.json
+            budget: Budget controller enforcing token/cost ceilings (optional)
+        """
+        self.config_path = config_path
+        self.budget = budget
         self._connector_manager = None
         self._content_reviewer = None
+        # Parallel workers must share one manager/reviewer
+        self._init_lock = threading.RLock()
         self.metrics = {
             "total_requests": 0,
             "successful": 0,
             "failed": 0,
+            "near_duplicate": 0,
             "total_tokens": 0,
             "total_latency_ms": 0,
             "model_usage": {},
@@ -96,24 +134,31 @@ class ContentPipeline:
 
     def _get_connector_manager(self):
         """Lazy load connector manager."""
-        if self._connector_manager is None:
-            try:
-                from connector_manager import ConnectorManager
-                self._connector_manager = ConnectorManager()
-            except ImportError as e:
-                logger.error(f"Failed to import ConnectorManager: {e}")
-                raise
+        with self._init_lock:
+            if self._connector_manager is None:
+                try:
+                    from connector_manager import ConnectorManager
+                    self._connector_manager = ConnectorManager(self.config_path)
+                except ImportError as e:
+                    logger.error(f"Failed to import ConnectorManager: {e}")
+                    raise
         return self._connector_manager
 
     def _get_content_reviewer(self):
         """Lazy load content reviewer."""
-        if self._content_reviewer is None:
-            try:
-                from content_reviewer import ContentReviewer
-                self._content_reviewer = ContentReviewer()
-            except ImportError as e:
-                logger.error(f"Failed to import ContentReviewer: {e}")
-                raise
+        with self._init_lock:
+            if self._content_reviewer is None:
+                try:
+                    from content_reviewer import ContentReviewer
+                    manager = self._get_connector_manager()
+                    # "review_config" in model-config.json overrides content-thresholds.json
+                    self._content_reviewer = ContentReviewer(
+                        connector_manager=manager,
+                        overrides=manager.config.get("review_config")
+                    )
+                except ImportError as e:
+                    logger.error(f"Failed to import ContentReviewer: {e}")
+                    raise
         return self._content_reviewer
 
     def generate(
@@ -124,7 +169,10 @@ class ContentPipeline:
         template: Optional[str] = None,
         with_review: bool = True,
         auto_revise: bool = True,
-        max_revisions: int = 2
+        max_revisions: int = 2,
+        request_id: Optional[str] = None,
+        prompt: Optional[str] = None,
+        prompt_version: Optional[str] = None
     ) -> ContentResult:
         """
         Generate content with full pipeline.
@@ -137,13 +185,19 @@ class ContentPipeline:
             with_review: Run GPT-4 review
             auto_revise: Automatically revise if review fails
             max_revisions: Maximum revision iterations
+            request_id: Identifier for the request (generated if omitted). Also keys
+                the page in the near-duplicate index, so pass a stable ID
+                (e.g. "<site>/<page>") for pages that are regenerated
+            prompt: Pre-rendered prompt sent as-is (skips the built-in prompt builder)
+            prompt_version: Version hash of the template that rendered `prompt`
 
         Returns:
             ContentResult with generated content and metadata
         """
-        request_id = f"{content_type}_{int(time.time() * 1000)}"
+        request_id = request_id or f"{content_type}_{int(time.time() * 1000)}_{uuid.uuid4().hex[:6]}"
         context = context or {}
         start_time = time.time()
+        budget_actions = []
 
         self.metrics["total_requests"] += 1
 
@@ -151,16 +205,34 @@ class ContentPipeline:
             manager = self._get_connector_manager()
             reviewer = self._get_content_reviewer()
 
-            # Build prompt
-            prompt = self._build_prompt(content_type, topic, context, template)
+            # Build prompt unless a rendered template was supplied
+            if prompt is None:
+                prompt = self._build_prompt(content_type, topic, context, template)
+
+            # Budget gate: stop starting new work or degrade to the cheap route
+            model = None
+            decision = self._check_budget(
+                "generate", request_id,
+                len(prompt) // 4 + EXPECTED_OUTPUT_TOKENS.get(content_type, 1500)
+            )
+            if decision == STOP:
+                return self._create_failure_result(
+                    request_id, content_type, "Run budget exhausted", start_time,
+                    status="budget_exceeded"
+                )
+            if decision == DEGRADE:
+                model = self.budget.limits.degrade_model
+                budget_actions.append(f"generate:{model}")
 
             # Generate content
             logger.info(f"Generating {content_type} content: {topic[:50]}...")
             response = manager.generate(
                 content_type=content_type,
                 prompt=prompt,
-                context=context
+                context=context,
+                model=model
             )
+            self._charge(request_id, response)
 
             if not response.success:
                 return self._create_failure_result(
@@ -171,18 +243,41 @@ class ContentPipeline:
             model_used = response.model
             total_tokens = response.tokens_used
             revision_count = 0
+            revision_control = None
             review_score = 0
 
-            # Review if requested
+            # Review if requested (skipped once the budget is exhausted)
+            if with_review and self._check_budget(
+                "review", request_id, len(content) // 4, manager.reviewer
+            ) == SKIP:
+                budget_actions.append("review:skipped")
+                with_review = False
+
             if with_review:
                 review_result = reviewer.review(content, content_type)
                 review_score = review_result.overall_score
+                self._charge_review(request_id, review_result)
 
                 logger.info(f"Review score: {review_score}, Passed: {review_result.passed}")
 
-                # Revise if needed
-                if auto_revise and not review_result.passed:
-                    while revision_count < max_revisions and not review_result.passed:
+                # Revise if needed (a failed review has no feedback to act on)
+                if auto_revise and review_result.success and not review_result.passed:
+                    controller = reviewer.revision_controller(max_revisions, content_type, model)
+                    controller.record(review_result)
+
+                    while review_result.success and not review_result.passed:
+                        # Stop once the score trajectory flattens out
+                        decision = controller.next_step()
+                        if decision.action == STOP_REVISION:
+                            break
+
+                        # Revision plus re-review roughly costs three passes over the content
+                        if self._check_budget(
+                            "revise", request_id, len(content) // 4 * 3, model_used
+                        ) != PROCEED:
+                            budget_actions.append("revise:skipped")
+                            break
+
                         revision_count += 1
                         logger.info(f"Revising content (iteration {revision_count})...")
 
@@ -194,28 +289,54 @@ class ContentPipeline:
                         revision = manager.revise(
                             content=content,
                             feedback=feedback,
-                            content_type=content_type
+                            content_type=content_type,
+                            model=decision.model
                         )
+                        self._charge(request_id, revision)
 
                         if revision.success:
+                            previous_content = content
                             content = revision.content
                             total_tokens += revision.tokens_used
 
-                            # Re-review
-                            review_result = reviewer.review(content, content_type)
+                            # Re-review only the sections the revision changed
+                            review_result = reviewer.rereview(
+                                previous_content, review_result, content, content_type
+                            )
                             review_score = review_result.overall_score
+                            self._charge_review(request_id, review_result)
+                            controller.record(review_result)
                             logger.info(f"Revision {revision_count} score: {review_score}")
                         else:
                             logger.warning(f"Revision failed: {revision.error}")
                             break
 
+                    reviewer.record_revision_outcome(controller)
+                    revision_control = controller.summary()
+
+            # Pre-publish near-duplicate check against generated and stored pages
+            near_duplicates = reviewer.check_duplicates(request_id, content)
+            status = "success"
+            if near_duplicates:
+                logger.warning(
+                    f"{request_id} is a near-duplicate of {near_duplicates[0]['id']} "
+                    f"(similarity {near_duplicates[0]['similarity']})"
+                )
+                if reviewer.config.get("duplicate_check", {}).get("action") == "block":
+                    status = "near_duplicate"
+            if status == "success":
+                reviewer.index_content(request_id, content)
+
             # Calculate latency
             latency_ms = (time.time() - start_time) * 1000
 
-            # Update metrics
-            self.metrics["successful"] += 1
+            # Update metrics (blocked pages spent tokens but are not successes)
+            if status == "success":
+                self.metrics["successful"] += 1
+                self.metrics["total_latency_ms"] += latency_ms
+            else:
+                self.metrics["near_duplicate"] += 1
             self.metrics["total_tokens"] += total_tokens
-            self.metrics["total_latency_ms"] += latency_ms
             self.metrics["model_usage"][model_used] = \
                 self.metrics["model_usage"].get(model_used, 0) + 1
             if review_score > 0:
@@ -224,7 +345,7 @@ class ContentPipeline:
             return ContentResult(
                 id=request_id,
                 content_type=content_type,
-                status="success",
+                status=status,
                 content=content,
                 model_used=model_used,
                 review_score=review_score,
@@ -235,7 +356,11 @@ class ContentPipeline:
                     "topic": topic,
                     "with_review": with_review,
                     "auto_revise": auto_revise,
-                    "used_fallback": response.metadata.get("used_fallback", False)
+                    "prompt_version": prompt_version or PROMPT_VERSION,
+                    "used_fallback": response.metadata.get("used_fallback", False),
+                    "budget_actions": budget_actions,
+                    "revision_control": revision_control,
+                    "near_duplicates": near_duplicates
                 }
             )
 
@@ -250,7 +375,8 @@ class ContentPipeline:
         requests: List[ContentRequest],
         parallel: int = 1,
         with_review: bool = True,
-        auto_revise: bool = True
+        auto_revise: bool = True,
+        budget: Optional[BudgetController] = None
     ) -> List[ContentResult]:
         """
         Generate multiple pieces of content.
@@ -260,11 +386,14 @@ class ContentPipeline:
             parallel: Number of parallel workers (1 = sequential)
             with_review: Run GPT-4 review on each
             auto_revise: Automatically revise if needed
+            budget: Budget controller for this run (optional)
 
         Returns:
             List of ContentResult objects
         """
         results = []
+        if budget is not None:
+            self.budget = budget
 
         if parallel <= 1:
             # Sequential processing
@@ -276,10 +405,12 @@ class ContentPipeline:
                     context=request.context,
                     template=request.template,
                     with_review=with_review,
-                    auto_revise=auto_revise
+                    auto_revise=auto_revise,
+                    request_id=request.id
                 )
                 result.id = request.id
                 results.append(result)
+                self._log_budget()
         else:
             # Parallel processing
             with ThreadPoolExecutor(max_workers=parallel) as executor:
@@ -291,7 +422,8 @@ class ContentPipeline:
                         request.context,
                         request.template,
                         with_review,
-                        auto_revise
+                        auto_revise,
+                        request_id=request.id
                     ): request
                     for request in requests
                 }
@@ -303,6 +435,7 @@ class ContentPipeline:
                         result.id = request.id
                         results.append(result)
                         logger.info(f"Completed: {request.id} - {result.status}")
+                        self._log_budget()
                     except Exception as e:
                         logger.error(f"Failed: {request.id} - {e}")
                         results.append(ContentResult(
@@ -362,6 +495,7 @@ class ContentPipeline:
             "total_requests": self.metrics["total_requests"],
             "successful": self.metrics["successful"],
             "failed": self.metrics["failed"],
+            "near_duplicate": self.metrics["near_duplicate"],
             "success_rate": (
                 self.metrics["successful"] / self.metrics["total_requests"] * 100
                 if self.metrics["total_requests"] > 0 else 0
@@ -372,9 +506,144 @@ class ContentPipeline:
                 if self.metrics["successful"] > 0 else 0
             ),
             "avg_review_score": round(avg_score, 1),
-            "model_usage": self.metrics["model_usage"]
+            "model_usage": self.metrics["model_usage"],
+            "budget": self.budget.summary() if self.budget else None,
+            "review_gate": (
+                self._content_reviewer.get_gate_stats()
+                if self._content_reviewer else None
+            ),
+            "rereview": (
+                self._content_reviewer.get_rereview_stats()
+                if self._content_reviewer else None
+            ),
+            "review_cache": (
+                self._content_reviewer.get_cache_stats()
+                if self._content_reviewer else None
+            ),
+            "revision_control": (
+                self._content_reviewer.get_revision_stats()
+                if self._content_reviewer else None
+            ),
+            "duplicates": (
+                self._content_reviewer.get_duplicate_stats()
+                if self._content_reviewer else None
+            ),
+            "review_parse": (
+                self._connector_manager.get_review_parse_stats()
+                if self._connector_manager else None
+            )
+        }
+
+    def fingerprint_request(self, request: ContentRequest) -> str:
+        """Fingerprint a request's inputs, prompt version and model config."""
+        manager = self._get_connector_manager()
+        chain = manager._get_model_chain(request.content_type)
+        model_config = {
+            "route": chain,
+            "models": {
+                name: {
+                    "model_id": getattr(manager.connectors[name], "model_id", None),
+                    "temperature": getattr(manager.connectors[name], "temperature", None),
+                    "max_tokens": getattr(manager.connectors[name], "max_tokens", None)
+                }
+                for name in chain
+                if name in manager.connectors
+            }
+        }
+        return fingerprint(
+            request.content_type,
+            request.topic,
+            request.context,
+            request.template,
+            PROMPT_VERSION,
+            model_config
+        )
+
+    def estimate_request(
+        self,
+        request: ContentRequest,
+        with_review: bool = True,
+        history: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Estimate tokens and cost for generating a request.
+
+        Args:
+            request: Request to estimate
+            with_review: Include one review pass
+            history: Previous manifest entry, whose real usage is preferred
+
+        Returns:
+            {"model": str, "tokens": int, "cost": float}
+        """
+        manager = self._get_connector_manager()
+        chain = manager._get_model_chain(request.content_type)
+        model = next((name for name in chain if name in manager.connectors), "none")
+        pricing = self.get_pricing()
+
+        if history and history.get("tokens_used"):
+            tokens = history["tokens_used"]
+        else:
+            prompt = self._build_prompt(
+                request.content_type, request.topic, request.context, request.template
+            )
+            output_tokens = EXPECTED_OUTPUT_TOKENS.get(request.content_type, 1500)
+            tokens = len(prompt) // 4 + output_tokens
+
+        estimator = BudgetController(BudgetLimits(), pricing)
+        cost = estimator.estimate_cost(model, tokens)
+        if with_review:
+            # Review reads the output back and answers with a short JSON report
+            review_tokens = EXPECTED_OUTPUT_TOKENS.get(request.content_type, 1500) + 1000
+            cost += estimator.estimate_cost(manager.reviewer, review_tokens)
+            tokens += review_tokens
+
+        return {"model": model, "tokens": tokens, "cost": round(cost, 4)}
+
+    def get_pricing(self) -> Dict[str, Any]:
+        """Model name -> ModelInfo for every initialized connector."""
+        manager = self._get_connector_manager()
+        return {
+            name: connector.get_model_info()
+            for name, connector in manager.connectors.items()
         }
 
+    def _check_budget(
+        self,
+        stage: str,
+        request_id: str,
+        estimated_tokens: int = 0,
+        model: Optional[str] = None
+    ) -> str:
+        """Ask the budget controller whether a stage may run."""
+        if self.budget is None:
+            return PROCEED
+        return self.budget.check(stage, request_id, estimated_tokens, model)
+
+    def _charge(self, request_id: str, response) -> None:
+        """Record a connector response against the budget."""
+        if self.budget is not None:
+            self.budget.charge_response(request_id, response)
+
+    def _charge_review(self, request_id: str, review_result) -> None:
+        """Record review usage against the budget."""
+        if self.budget is not None:
+            self.budget.charge(
+                request_id,
+                self._get_connector_manager().reviewer,
+                review_result.metadata.get("tokens_used", 0)
+            )
+
+    def _log_budget(self) -> None:
+        """Log live spend vs. budget during bulk runs."""
+        if self.budget is None or not self.budget.limits.is_enabled():
+            return
+        summary = self.budget.summary()
+        logger.info(
+            f"Budget: {summary['spent_tokens']} tokens, "
+            f"${summary['spent_cost']:.4f} spent ({summary['run_usage_pct']}% of run budget)"
+        )
+
     def _build_prompt(
         self,
         content_type: str,
@@ -422,14 +691,15 @@ class ContentPipeline:
         request_id: str,
         content_type: str,
         error: str,
-        start_time: float
+        start_time: float,
+        status: str = "failed"
     ) -> ContentResult:
         """Create a failure result."""
         self.metrics["failed"] += 1
         return ContentResult(
             id=request_id,
             content_type=content_type,
-            status="failed",
+            status=status,
             content="",
             model_used="none",
             review_score=0,
@@ -463,6 +733,12 @@ def main():
     bulk_parser.add_argument("--output", "-o", required=True, help="Output directory")
     bulk_parser.add_argument("--parallel", "-p", type=int, default=1, help="Parallel workers")
     bulk_parser.add_argument("--no-review", action="store_true", help="Skip review")
+    bulk_parser.add_argument("--max-tokens", type=int, help="Token budget for the whole run")
+    bulk_parser.add_argument("--max-cost", type=float, help="Cost budget (USD) for the whole run")
+    bulk_parser.add_argument("--max-request-tokens", type=int, help="Token budget per request")
+    bulk_parser.add_argument("--max-request-cost", type=float, help="Cost budget (USD) per request")
+    bulk_parser.add_argument("--force", action="store_true", help="Regenerate even unchanged requests")
+    bulk_parser.add_argument("--dry-run", action="store_true", help="List what would be rebuilt and its estimated cost")
 
     # Review command
     review_parser = subparsers.add_parser("review", help="Review existing content")
@@ -535,16 +811,58 @@ def main():
             for i, r in enumerate(raw_requests)
         ]
 
-        print(f"Processing {len(requests)} requests...")
+        output_dir = Path(args.output)
+
+        # Incremental rebuild: skip requests whose fingerprint is unchanged
+        manifest = RegenerationManifest.for_output_dir(output_dir)
+        fingerprints = {r.id: pipeline.fingerprint_request(r) for r in requests}
+        if args.force:
+            rebuild, unchanged = {r.id: "forced" for r in requests}, []
+        else:
+            rebuild, unchanged = manifest.plan(fingerprints, output_dir)
+
+        if args.dry_run:
+            total_tokens = 0
+            total_cost = 0.0
+            print(f"\n{len(rebuild)} to rebuild, {len(unchanged)} unchanged\n")
+            for request in requests:
+                if request.id not in rebuild:
+                    continue
+                estimate = pipeline.estimate_request(
+                    request,
+                    with_review=not args.no_review,
+                    history=manifest.get(request.id)
+                )
+                total_tokens += estimate["tokens"]
+                total_cost += estimate["cost"]
+                print(
+                    f"  {request.id:<30} {rebuild[request.id]:<15} "
+                    f"{estimate['model']:<8} ~{estimate['tokens']} tokens  ${estimate['cost']:.4f}"
+                )
+            print(f"\nEstimated total: ~{total_tokens} tokens, ${total_cost:.4f}")
+            return
+
+        pending = [r for r in requests if r.id in rebuild]
+        print(f"Processing {len(pending)} requests ({len(unchanged)} unchanged)...")
+
+        manager = pipeline._get_connector_manager()
+        limits = BudgetLimits.from_config(
+            manager.config.get("budget", {}),
+            max_run_tokens=args.max_tokens,
+            max_run_cost=args.max_cost,
+            max_request_tokens=args.max_request_tokens,
+            max_request_cost=args.max_request_cost
+        )
+        budget = BudgetController(limits, pipeline.get_pricing())
 
         results = pipeline.bulk_generate(
-            requests=requests,
+            requests=pending,
             parallel=args.parallel,
-            with_review=not args.no_review
+            with_review=not args.no_review,
+            budget=budget
         )
 
         # Create output directory
-        output_dir = Path(args.output)
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Save results
@@ -553,6 +871,8 @@ def main():
                 output_file = output_dir / f"{result.id}.md"
                 with open(output_file, "w", encoding="utf-8") as f:
                     f.write(result.content)
+                manifest.record(result, fingerprints[result.id], output_file.name)
+        manifest.save()
 
         # Save summary
         summary = {
@@ -560,6 +880,13 @@ def main():
             "total": len(results),
             "successful": sum(1 for r in results if r.status == "success"),
             "failed": sum(1 for r in results if r.status == "failed"),
+            "budget_exceeded": sum(1 for r in results if r.status == "budget_exceeded"),
+            "near_duplicates": {
+                r.id: r.metadata["near_duplicates"]
+                for r in results
+                if r.metadata.get("near_duplicates")
+            },
+            "unchanged": unchanged,
             "results": [r.to_dict() for r in results],
             "metrics": pipeline.get_metrics()
         }
@@ -569,6 +896,8 @@ def main():
             json.dump(summary, f, indent=2, ensure_ascii=False)
 
         print(f"\nCompleted: {summary['successful']}/{summary['total']} successful")
+        if summary["near_duplicates"]:
+            print(f"Near-duplicates flagged: {len(summary['near_duplicates'])} (see summary.json)")
         print(f"Results saved to {output_dir}")
 
     elif args.command == "review":
@@ -0,0 +1,150 @@
+"""
+Regeneration Manifest
+
+On-disk record of request fingerprints and their final results.
+Lets bulk runs rebuild only the requests whose inputs changed.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from pathlib import Path
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+def fingerprint(
+    content_type: str,
+    topic: str,
+    context: Dict[str, Any],
+    template: Optional[str],
+    prompt_version: str,
+    model_config: Dict[str, Any]
+) -> str:
+    """
+    Fingerprint everything that influences a generated result.
+
+    Args:
+        content_type: Type of content
+        topic: Content topic
+        context: Generation context
+        template: Template text (optional)
+        prompt_version: Version of the prompt builder/templates
+        model_config: Route and model settings used for the content type
+
+    Returns:
+        Hex digest
+    """
+    payload = json.dumps(
+        {
+            "content_type": content_type,
+            "topic": topic,
+            "context": context,
+            "template": template,
+            "prompt_version": prompt_version,
+            "model_config": model_config,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RegenerationManifest:
+    """
+    Fingerprint manifest stored next to a bulk output directory.
+
+    Each entry maps a request ID to the fingerprint it was generated from
+    and a summary of the final result.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, Any]] = self._load()
+
+    @classmethod
+    def for_output_dir(cls, output_dir: Path) -> "RegenerationManifest":
+        """Manifest for an output directory: `<dir>.manifest.json` beside it."""
+        output_dir = Path(output_dir)
+        return cls(output_dir.parent / f"{output_dir.name}.manifest.json")
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load entries, ignoring missing or incompatible manifests."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError as e:
+            logger.warning(f"Ignoring corrupt manifest {self.path}: {e}")
+            return {}
+
+        if data.get("version") != MANIFEST_VERSION:
+            logger.info("Manifest version changed, rebuilding all entries")
+            return {}
+        return data.get("entries", {})
+
+    def plan(
+        self,
+        fingerprints: Dict[str, str],
+        output_dir: Path
+    ) -> Tuple[Dict[str, str], List[str]]:
+        """
+        Decide which requests need regeneration.
+
+        Args:
+            fingerprints: Request ID -> current fingerprint
+            output_dir: Directory holding generated files
+
+        Returns:
+            (request ID -> rebuild reason, list of unchanged request IDs)
+        """
+        rebuild: Dict[str, str] = {}
+        unchanged: List[str] = []
+
+        for request_id, current in fingerprints.items():
+            entry = self.entries.get(request_id)
+            if entry is None:
+                rebuild[request_id] = "new"
+            elif entry.get("fingerprint") != current:
+                rebuild[request_id] = "changed"
+            elif not (Path(output_dir) / entry.get("output_file", "")).is_file():
+                rebuild[request_id] = "missing_output"
+            else:
+                unchanged.append(request_id)
+
+        return rebuild, unchanged
+
+    def record(self, result, fingerprint_hex: str, output_file: str):
+        """Record a successful result under its fingerprint."""
+        self.entries[result.id] = {
+            "fingerprint": fingerprint_hex,
+            "output_file": output_file,
+            "content_type": result.content_type,
+            "model_used": result.model_used,
+            "review_score": result.review_score,
+            "revision_count": result.revision_count,
+            "tokens_used": result.tokens_used,
+            "generated_at": datetime.now().isoformat()
+        }
+
+    def get(self, request_id: str) -> Optional[Dict[str, Any]]:
+        """Get the entry for a request."""
+        return self.entries.get(request_id)
+
+    def save(self):
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": MANIFEST_VERSION, "entries": self.entries},
+                f, indent=2, ensure_ascii=False
+            )
+        os.replace(tmp_path, self.path)
@@ -9,24 +9,24 @@ claude-code-maestro content_pipeline.py üzerine OSGB context ekler.
 import os
 import sys
 import json
+import logging
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Script dizinini path'e ekle
 SCRIPT_DIR = Path(__file__).parent
 sys.path.insert(0, str(SCRIPT_DIR))
 
 from content_pipeline import ContentPipeline, ContentRequest, ContentResult
+from prompt_templates import PromptTemplateRegistry
+
+logger = logging.getLogger(__name__)
 
 # OSGB Özel Promptlar
+# Sabit talimatlar önce, firmaya özel bilgiler sonda: derlenen şablonun
+# statik öneki tüm firmalar için aynı kalır.
 OSGB_PROMPTS = {
-    "homepage": """
-{company_name} firması için bir anasayfa içeriği oluştur.
-
-Firma Bilgileri:
-- Firma Adı: {company_name}
-- Sektör: İş Sağlığı ve Güvenliği (OSGB)
-- Hizmetler: {services}
-{extra_info}
+    "homepage": """Bir OSGB firması için anasayfa içeriği oluştur.
 
 İçerik şunları içermeli:
 1. Dikkat çekici bir başlık ve açıklama (Hero bölümü)
@@ -37,15 +37,15 @@ Firma Bilgileri:
 HTML formatında yaz. Meta bilgileri ekle:
 META_TITLE: (max 60 karakter)
 META_DESCRIPTION: (max 160 karakter)
-""",
-
-    "about": """
-{company_name} firması için bir "Hakkımızda" sayfası içeriği oluştur.
 
 Firma Bilgileri:
-- Firma Adı: {company_name}
 - Sektör: İş Sağlığı ve Güvenliği (OSGB)
+- Firma Adı: {company_name}
+- Hizmetler: {services}
 {extra_info}
+""",
+
+    "about": """Bir OSGB firması için "Hakkımızda" sayfası içeriği oluştur.
 
 İçerik şunları içermeli:
 1. Firma hikayesi ve kuruluş amacı
@@ -56,14 +56,14 @@ Firma Bilgileri:
 Profesyonel ve güven veren bir ton kullan. HTML formatında yaz.
 META_TITLE: (max 60 karakter)
 META_DESCRIPTION: (max 160 karakter)
-""",
-
-    "services": """
-{company_name} firması için bir "Hizmetlerimiz" sayfası içeriği oluştur.
 
 Firma Bilgileri:
+- Sektör: İş Sağlığı ve Güvenliği (OSGB)
 - Firma Adı: {company_name}
-- Hizmetler: {services}
+{extra_info}
+""",
+
+    "services": """Bir OSGB firması için "Hizmetlerimiz" sayfası içeriği oluştur.
 
 Her hizmet için:
 1. Hizmet başlığı
@@ -73,16 +73,13 @@ Her hizmet için:
 Hizmetleri <section> etiketleriyle ayır. HTML formatında yaz.
 META_TITLE: (max 60 karakter)
 META_DESCRIPTION: (max 160 karakter)
-""",
-
-    "contact": """
-{company_name} firması için bir "İletişim" sayfası içeriği oluştur.
 
 Firma Bilgileri:
 - Firma Adı: {company_name}
-- Adres: {address}
-- Telefon: {phone}
-- E-posta: {email}
+- Hizmetler: {services}
+""",
+
+    "contact": """Bir OSGB firması için "İletişim" sayfası içeriği oluştur.
 
 İçerik şunları içermeli:
 1. Davetkar bir başlık
@@ -93,14 +90,15 @@ Firma Bilgileri:
 HTML formatında yaz.
 META_TITLE: (max 60 karakter)
 META_DESCRIPTION: (max 160 karakter)
-""",
-
-    "faq": """
-{company_name} firması için bir "Sıkça Sorulan Sorular" sayfası içeriği oluştur.
 
 Firma Bilgileri:
 - Firma Adı: {company_name}
-- Hizmetler: {services}
+- Adres: {address}
+- Telefon: {phone}
+- E-posta: {email}
+""",
+
+    "faq": """Bir OSGB firması için "Sıkça Sorulan Sorular" sayfası içeriği oluştur.
 
 En az 8 soru-cevap oluştur. Sorular şunları kapsamalı:
 1. OSGB nedir?
@@ -115,12 +113,13 @@ En az 8 soru-cevap oluştur. Sorular şunları kapsamalı:
 Her soru-cevabı <div class="faq-item"> içinde yaz. HTML formatında yaz.
 META_TITLE: (max 60 karakter)
 META_DESCRIPTION: (max 160 karakter)
+
+Firma Bilgileri:
+- Firma Adı: {company_name}
+- Hizmetler: {services}
 """,
 
-    "blog": """
-{company_name} firması için İş Sağlığı ve Güvenliği hakkında bir blog yazısı oluştur.
-
-Konu: {topic}
+    "blog": """Bir OSGB firması için İş Sağlığı ve Güvenliği hakkında bir blog yazısı oluştur.
 
 İçerik şunları içermeli:
 1. SEO uyumlu başlık
@@ -132,9 +131,17 @@ Yazı uzunluğu: yaklaşık 1000-1500 kelime
 HTML formatında, SEO uyumlu yaz.
 META_TITLE: (max 60 karakter)
 META_DESCRIPTION: (max 160 karakter)
+
+Firma Adı: {company_name}
+Konu: {topic}
 """
 }
 
+OSGB_PROMPT_FIELDS = ["company_name", "services", "address", "phone", "email", "topic", "extra_info"]
+
+# Şablonlar yükleme anında bir kez derlenir ve doğrulanır
+OSGB_TEMPLATES = PromptTemplateRegistry(OSGB_PROMPTS, OSGB_PROMPT_FIELDS, default="homepage")
+
 DEFAULT_SERVICES = [
     "İşyeri Hekimliği",
     "İş Güvenliği Uzmanlığı",
@@ -144,6 +151,11 @@ DEFAULT_SERVICES = [
     "Ortam Ölçümleri"
 ]
 
+SITE_PAGE_TYPES = ["homepage", "about", "services", "contact", "faq"]
+
+# _company_context() parametreleri; --companies kayıtlarındaki diğer alanlar yok sayılır
+COMPANY_FIELDS = ["company_name", "services", "address", "phone", "email", "topic", "extra_info", "slug"]
+
 
 class OSGBContentPipeline:
     """OSGB-özel içerik pipeline'ı."""
@@ -152,6 +164,36 @@ class OSGBContentPipeline:
         config_path = SCRIPT_DIR / "config" / "model-config.json"
         self.pipeline = ContentPipeline(str(config_path) if config_path.exists() else None)
     
+    def _company_context(
+        self,
+        company_name: str,
+        services: list = None,
+        address: str = None,
+        phone: str = None,
+        email: str = None,
+        topic: str = None,
+        extra_info: str = "",
+        slug: str = None
+    ) -> dict:
+        """Firma için tüm sayfalarda ortak kullanılan context'i bir kez hazırla."""
+        services = services or DEFAULT_SERVICES
+        return {
+            "company_name": company_name,
+            # Sayfa kimliklerinin öneki; aynı firma yeniden üretildiğinde değişmez
+            "slug": slug or company_name,
+            "services": ", ".join(services),
+            "address": address or "Belirtilmemiş",
+            "phone": phone or "Belirtilmemiş",
+            "email": email or "Belirtilmemiş",
+            "topic": topic or "İşyerinde Güvenlik Kültürü",
+            "extra_info": extra_info,
+            "context": {
+                "industry": "OSGB",
+                "language": "tr",
+                "tone": "professional"
+            }
+        }
+
     def generate_page(
         self,
         content_type: str,
@@ -161,7 +203,8 @@ class OSGBContentPipeline:
         phone: str = None,
         email: str = None,
         topic: str = None,
-        extra_info: str = ""
+        extra_info: str = "",
+        company_context: dict = None
     ) -> ContentResult:
         """
         OSGB sayfası için içerik üret.
@@ -175,41 +218,35 @@ class OSGBContentPipeline:
             email: E-posta
             topic: Blog konusu (sadece blog için)
             extra_info: Ek bilgi
+            company_context: _company_context() çıktısı (verilirse diğer alanlar yok sayılır)
         
         Returns:
             ContentResult
         """
-        services = services or DEFAULT_SERVICES
-        services_str = ", ".join(services)
-        
-        # Prompt şablonunu al
-        prompt_template = OSGB_PROMPTS.get(content_type.lower())
-        if not prompt_template:
-            prompt_template = OSGB_PROMPTS["homepage"]
-        
-        # Prompt'u doldur
-        prompt = prompt_template.format(
-            company_name=company_name,
-            services=services_str,
-            address=address or "Belirtilmemiş",
-            phone=phone or "Belirtilmemiş",
-            email=email or "Belirtilmemiş",
-            topic=topic or "İşyerinde Güvenlik Kültürü",
-            extra_info=extra_info
+        company = company_context or self._company_context(
+            company_name, services, address, phone, email, topic, extra_info
         )
         
-        # Context
-        context = {
-            "industry": "OSGB",
-            "language": "tr",
-            "tone": "professional"
-        }
+        # Derlenmiş şablonu al ve firmaya özel kısmı doldur
+        template = OSGB_TEMPLATES.get(content_type.lower())
+        prompt = template.render(**{
+            field: company[field] for field in OSGB_PROMPT_FIELDS
+        })
+        
+        # Sabit sayfa kimliği: yeniden üretilen sayfa kendi eski sürümünün
+        # kopyası sayılmaz, eşzamanlı sayfalar da birbirinin kaydını ezmez
+        page_id = f"{company['slug']}/{content_type.lower()}"
+        if content_type.lower() == "blog":
+            page_id += f"/{company['topic']}"
         
-        # Generate
+        # Prompt doğrudan connector'lara gider
         return self.pipeline.generate(
             content_type=content_type.lower(),
-            topic=f"{company_name} - {content_type}",
-            context=context,
+            topic=f"{company['company_name']} - {content_type}",
+            context=dict(company["context"]),
+            prompt=prompt,
+            prompt_version=template.version,
+            request_id=page_id,
             with_review=True,
             auto_revise=True
         )
@@ -220,24 +257,94 @@ class OSGBContentPipeline:
         services: list = None,
         address: str = None,
         phone: str = None,
-        email: str = None
+        email: str = None,
+        max_workers: int = None
     ) -> dict:
-        """Tüm site sayfalarını üret."""
-        results = {}
-        page_types = ["homepage", "about", "services", "contact", "faq"]
+        """Tüm site sayfalarını paralel üret."""
+        company = {
+            "company_name": company_name,
+            "services": services,
+            "address": address,
+            "phone": phone,
+            "email": email
+        }
+        return self.generate_sites(
+            [company],
+            max_workers=max_workers or len(SITE_PAGE_TYPES)
+        )[0]
+    
+    def generate_sites(
+        self,
+        companies: list,
+        max_workers: int = 8,
+        on_progress=None
+    ) -> list:
+        """
+        Birden fazla firmanın sitesini tek ortak scheduler üzerinden üret.
+        
+        Tüm sayfalar aynı thread havuzuna gönderilir; sağlayıcı başına
+        eşzamanlılık ConnectorManager'daki limitlerle sınırlanır.
+        
+        Args:
+            companies: company_name, services, address, phone, email alanlı dict listesi
+                (diğer alanlar yok sayılır)
+            max_workers: Toplam eşzamanlı sayfa sayısı
+            on_progress: (company_name, page_type, result, done, total) callback'i
         
-        for page_type in page_types:
-            result = self.generate_page(
-                content_type=page_type,
-                company_name=company_name,
-                services=services,
-                address=address,
-                phone=phone,
-                email=email
-            )
-            results[page_type] = result
+        Returns:
+            Firma sırasıyla {page_type: ContentResult} listesi
+        """
+        contexts = [
+            self._company_context(**{
+                key: company[key] for key in COMPANY_FIELDS if key in company
+            })
+            for company in companies
+        ]
+        results = [{} for _ in contexts]
+        total = len(SITE_PAGE_TYPES)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_page = {
+                executor.submit(
+                    self.generate_page,
+                    page_type,
+                    context["company_name"],
+                    company_context=context
+                ): (index, page_type)
+                for index, context in enumerate(contexts)
+                for page_type in SITE_PAGE_TYPES
+            }
+            
+            for future in as_completed(future_to_page):
+                index, page_type = future_to_page[future]
+                company_name = contexts[index]["company_name"]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"{company_name} / {page_type} başarısız: {e}")
+                    result = ContentResult(
+                        id=f"{page_type}_failed",
+                        content_type=page_type,
+                        status="failed",
+                        content="",
+                        model_used="none",
+                        review_score=0,
+                        revision_count=0,
+                        tokens_used=0,
+                        latency_ms=0,
+                        error=str(e)
+                    )
+                
+                results[index][page_type] = result
+                done = len(results[index])
+                logger.info(f"[{company_name}] {done}/{total} sayfa tamamlandı ({page_type}: {result.status})")
+                if on_progress:
+                    on_progress(company_name, page_type, result, done, total)
         
-        return results
+        return [
+            {page_type: site[page_type] for page_type in SITE_PAGE_TYPES}
+            for site in results
+        ]
 
 
 def main():
@@ -245,21 +352,57 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description="OSGB Content Pipeline")
-    parser.add_argument("--type", "-t", required=True, help="Content type: homepage, about, services, contact, faq, blog")
-    parser.add_argument("--company", "-c", required=True, help="Company name")
+    parser.add_argument("--type", "-t", required=True, help="Content type: homepage, about, services, contact, faq, blog, site")
+    parser.add_argument("--company", "-c", help="Company name")
+    parser.add_argument("--companies", help="JSON file with a list of companies (multi-company site mode)")
     parser.add_argument("--services", "-s", help="Comma-separated services")
     parser.add_argument("--address", help="Company address")
     parser.add_argument("--phone", help="Phone number")
     parser.add_argument("--email", help="Email address")
     parser.add_argument("--topic", help="Blog topic (for blog type)")
-    parser.add_argument("--output", "-o", help="Output file")
+    parser.add_argument("--output", "-o", help="Output file (output directory for site mode)")
+    parser.add_argument("--workers", "-w", type=int, default=8, help="Concurrent pages in site mode")
     
     args = parser.parse_args()
     
+    if not args.company and not args.companies:
+        parser.error("--company or --companies is required")
+    
     services = args.services.split(",") if args.services else None
     
     pipeline = OSGBContentPipeline()
     
+    if args.type == "site" or args.companies:
+        if args.companies:
+            with open(args.companies, "r", encoding="utf-8") as f:
+                companies = json.load(f)
+        else:
+            companies = [{
+                "company_name": args.company,
+                "services": services,
+                "address": args.address,
+                "phone": args.phone,
+                "email": args.email
+            }]
+        
+        sites = pipeline.generate_sites(companies, max_workers=args.workers)
+        
+        for company, site in zip(companies, sites):
+            succeeded = sum(1 for r in site.values() if r.status == "success")
+            print(f"{company['company_name']}: {succeeded}/{len(site)} sayfa başarılı")
+            
+            if args.output:
+                site_dir = Path(args.output) / (company.get("slug") or company["company_name"])
+                site_dir.mkdir(parents=True, exist_ok=True)
+                for page_type, result in site.items():
+                    if result.status == "success":
+                        with open(site_dir / f"{page_type}.html", "w", encoding="utf-8") as f:
+                            f.write(result.content)
+        
+        if args.output:
+            print(f"\nSaved to {args.output}")
+        return
+    
     result = pipeline.generate_page(
         content_type=args.type,
         company_name=args.company,
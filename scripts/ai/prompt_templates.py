@@ -0,0 +1,145 @@
+"""
+Prompt Templates
+
+Compile-once prompt templates with load-time placeholder validation.
+Each template is split into a static prefix (identical for every
+render, so providers can cache it) and a compiled per-call suffix.
+"""
+
+import hashlib
+from string import Formatter
+from typing import Optional, Dict, Any, List, Tuple, Iterable
+
+
+class PromptTemplateError(ValueError):
+    """Raised when a template is malformed or rendered with missing values."""
+
+
+class PromptTemplate:
+    """A single compiled prompt template."""
+
+    def __init__(self, name: str, source: str, allowed_fields: Optional[Iterable[str]] = None):
+        """
+        Compile a template.
+
+        Args:
+            name: Template name (used in error messages)
+            source: str.format-style template text
+            allowed_fields: Placeholders the template may use (None = any)
+
+        Raises:
+            PromptTemplateError: On malformed syntax or unknown placeholders
+        """
+        self.name = name
+        self.source = source
+        self.version = hashlib.sha256(source.encode("utf-8")).hexdigest()[:12]
+
+        try:
+            parsed = list(Formatter().parse(source))
+        except ValueError as e:
+            raise PromptTemplateError(f"Template '{name}' is malformed: {e}")
+
+        self.placeholders = frozenset(field for _, field, _, _ in parsed if field is not None)
+
+        for _, field, format_spec, conversion in parsed:
+            if field is None:
+                continue
+            if not field.isidentifier():
+                raise PromptTemplateError(
+                    f"Template '{name}' uses unsupported placeholder '{{{field}}}'"
+                )
+            if format_spec or conversion:
+                raise PromptTemplateError(
+                    f"Template '{name}' uses format options on '{{{field}}}'"
+                )
+
+        if allowed_fields is not None:
+            unknown = self.placeholders - set(allowed_fields)
+            if unknown:
+                raise PromptTemplateError(
+                    f"Template '{name}' uses unknown placeholders: {', '.join(sorted(unknown))}"
+                )
+
+        self.prefix, self._suffix_parts = self._compile(source)
+
+    @staticmethod
+    def _compile(source: str) -> Tuple[str, List[Tuple[str, Optional[str]]]]:
+        """
+        Split into the static prefix and compiled suffix parts.
+
+        The prefix ends at the start of the line holding the first
+        placeholder, so it is byte-identical across renders.
+        """
+        first = source.find("{")
+        while first >= 0 and source[first:first + 2] == "{{":
+            first = source.find("{", first + 2)
+
+        if first < 0:
+            cut = len(source)
+        else:
+            cut = source.rfind("\n", 0, first) + 1
+
+        prefix = source[:cut].replace("{{", "{").replace("}}", "}")
+        suffix_parts = [
+            (literal, field)
+            for literal, field, _, _ in Formatter().parse(source[cut:])
+        ]
+        return prefix, suffix_parts
+
+    def render_suffix(self, **values: Any) -> str:
+        """Render the per-call part of the prompt."""
+        missing = self.placeholders - set(values)
+        if missing:
+            raise PromptTemplateError(
+                f"Template '{self.name}' missing values for: {', '.join(sorted(missing))}"
+            )
+
+        parts = []
+        for literal, field in self._suffix_parts:
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(values[field]))
+        return "".join(parts)
+
+    def render(self, **values: Any) -> str:
+        """Render the full prompt (static prefix + suffix)."""
+        return self.prefix + self.render_suffix(**values)
+
+
+class PromptTemplateRegistry:
+    """Named collection of compiled templates."""
+
+    def __init__(
+        self,
+        sources: Dict[str, str],
+        allowed_fields: Optional[Iterable[str]] = None,
+        default: Optional[str] = None
+    ):
+        """
+        Compile all templates up front.
+
+        Args:
+            sources: Template name -> template text
+            allowed_fields: Placeholders templates may use
+            default: Template used for unknown names
+        """
+        allowed = set(allowed_fields) if allowed_fields is not None else None
+        self.templates = {
+            name: PromptTemplate(name, source, allowed)
+            for name, source in sources.items()
+        }
+        if default is not None and default not in self.templates:
+            raise PromptTemplateError(f"Default template '{default}' not defined")
+        self.default = default
+
+    def get(self, name: str) -> PromptTemplate:
+        """Get a template by name, falling back to the default."""
+        template = self.templates.get(name)
+        if template is None:
+            if self.default is None:
+                raise PromptTemplateError(f"Unknown template '{name}'")
+            template = self.templates[self.default]
+        return template
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.templates
@@ -0,0 +1,41 @@
+"""Tests for the tolerant JSON extraction in connectors/json_extract.py."""
+
+import sys
+import json
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from connectors.json_extract import repair_json, extract_json, IncrementalJSONExtractor
+
+
+FEEDBACK = "True story: None of the claims, ] are sourced. False modesty,}"
+
+
+def test_repair_fixes_literals_and_trailing_commas_outside_strings():
+    fixed = repair_json('{"passed": True, "score": None, "tags": ["a", "b",],}')
+    assert json.loads(fixed) == {"passed": True, "score": None, "tags": ["a", "b"]}
+
+
+def test_repair_leaves_string_contents_unchanged():
+    text = '{"feedback": %s, "passed": False,}' % json.dumps(FEEDBACK)
+    assert json.loads(repair_json(text)) == {"feedback": FEEDBACK, "passed": False}
+
+
+def test_repair_handles_escaped_quotes_in_strings():
+    value = 'He said \\"True\\", None,]'
+    text = '{"note": "%s", "ok": True}' % value
+    assert json.loads(repair_json(text)) == {"note": 'He said "True", None,]', "ok": True}
+
+
+def test_extract_keeps_string_contents_in_prose_and_fences():
+    text = 'Here is the review:\n```json\n{"improvements": [%s,], "passed": None}\n```' % json.dumps(FEEDBACK)
+    value, repaired = extract_json(text)
+    assert repaired
+    assert value == {"improvements": [FEEDBACK], "passed": None}
+
+
+def test_truncated_value_keeps_string_contents():
+    extractor = IncrementalJSONExtractor()
+    extractor.feed('{"feedback": %s, "passed": True, "notes": "None of' % json.dumps(FEEDBACK))
+    assert extractor.finish() == [{"feedback": FEEDBACK, "passed": True, "notes": "None of"}]